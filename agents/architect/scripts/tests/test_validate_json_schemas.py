@@ -0,0 +1,294 @@
+"""
+Regression tests for validate-json-schemas.py and the shared json_schema engine.
+
+Run with:
+    python3 -m unittest discover -s agents/architect/scripts/tests
+"""
+
+import json
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+SCRIPT = Path(__file__).resolve().parents[1] / "validate-json-schemas.py"
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from json_schema import SchemaError, SchemaRegistry  # noqa: E402
+
+DRAFT_07 = "http://json-schema.org/draft-07/schema#"
+
+
+def write_json(path: Path, document: object) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(document), encoding="utf-8")
+
+
+def run_gate(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, str(SCRIPT), *args], capture_output=True, text=True)
+
+
+class ValidateJsonSchemasTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.schemas = Path(self._tmp.name) / "schemas"
+        self.schemas.mkdir()
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_fixtures_for_uncompilable_schema_fail_without_traceback(self) -> None:
+        write_json(
+            self.schemas / "bad.schema.json",
+            {"$schema": DRAFT_07, "properties": {"a": {"$ref": "#/definitions/missing"}}},
+        )
+        write_json(self.schemas / "fixtures" / "bad" / "x.json", {"a": 1})
+
+        result = run_gate(str(self.schemas))
+
+        self.assertEqual(result.returncode, 1, result.stdout + result.stderr)
+        self.assertNotIn("Traceback", result.stderr)
+        self.assertIn("[INFO] Compiled 0 schema(s), 1 failed to compile", result.stdout)
+        self.assertIn("unresolvable $ref", result.stdout)
+        self.assertIn("fixtures not checked, bad.schema.json does not compile", result.stdout)
+
+    def test_property_example_location_escapes_pointer_tokens(self) -> None:
+        write_json(
+            self.schemas / "item.schema.json",
+            {"$schema": DRAFT_07, "title": "Item", "type": "object", "properties": {"a/b~c": {"type": "string"}}},
+        )
+        spec = Path(self._tmp.name) / "api.yaml"
+        spec.write_text(
+            "openapi: 3.0.3\n"
+            "info: {title: t, version: '1'}\n"
+            "paths: {}\n"
+            "components:\n"
+            "  schemas:\n"
+            "    Item:\n"
+            "      type: object\n"
+            "      properties:\n"
+            "        'a/b~c': {type: string, example: 5}\n",
+            encoding="utf-8",
+        )
+
+        result = run_gate(str(self.schemas), "--spec", str(spec))
+
+        self.assertEqual(result.returncode, 1, result.stdout + result.stderr)
+        self.assertIn("#/components/schemas/Item/properties/a~1b~0c/example", result.stdout)
+        self.assertIn("is not of type string", result.stdout)
+
+    def test_unquoted_timestamp_examples_stay_strings(self) -> None:
+        write_json(
+            self.schemas / "event.schema.json",
+            {"$schema": DRAFT_07, "title": "Event", "type": "object", "properties": {
+                "at": {"type": "string", "format": "date-time"},
+                "day": {"type": "string", "format": "date"},
+            }},
+        )
+        spec = Path(self._tmp.name) / "api.yaml"
+        spec.write_text(
+            "openapi: 3.0.3\n"
+            "info: {title: t, version: '1'}\n"
+            "paths: {}\n"
+            "components:\n"
+            "  schemas:\n"
+            "    Event:\n"
+            "      type: object\n"
+            "      properties:\n"
+            "        at: {type: string, example: 2026-01-15T10:00:00Z}\n"
+            "        day: {type: string, example: 2026-01-15}\n"
+            "      example:\n"
+            "        at: 2026-01-15T10:00:00Z\n"
+            "        day: 2026-01-15\n",
+            encoding="utf-8",
+        )
+
+        result = run_gate(str(self.schemas), "--spec", str(spec))
+
+        self.assertEqual(result.returncode, 0, result.stdout + result.stderr)
+        self.assertIn("3 example(s) checked", result.stdout)
+
+
+class SchemaRegistryTests(unittest.TestCase):
+    def test_failed_recursive_compile_leaves_no_unfilled_stub(self) -> None:
+        registry = SchemaRegistry()
+        first = registry.add(
+            {"$id": "http://example.test/first", "properties": {
+                "next": {"$ref": "http://example.test/second"},
+                "broken": {"$ref": "#/definitions/missing"},
+            }},
+            source="first",
+        )
+        second = registry.add(
+            {"$id": "http://example.test/second", "properties": {"back": {"$ref": "http://example.test/first"}}},
+            source="second",
+        )
+
+        with self.assertRaises(SchemaError):
+            registry.compile(first)
+        # second reaches first, so it must fail to compile too, not validate into a stale stub.
+        with self.assertRaises(SchemaError):
+            registry.compile(second)
+        with self.assertRaises(SchemaError):
+            registry.compile(first)
+
+    def test_recursive_refs_still_compile(self) -> None:
+        registry = SchemaRegistry()
+        uri = registry.add(
+            {"$id": "http://example.test/tree", "type": "object",
+             "properties": {"children": {"type": "array", "items": {"$ref": "#"}}}},
+            source="tree",
+        )
+
+        validator = registry.compile(uri)
+
+        self.assertTrue(validator.is_valid({"children": [{"children": []}]}))
+        self.assertFalse(validator.is_valid({"children": [{"children": 1}]}))
+
+    def test_malformed_keyword_values_raise_schema_error(self) -> None:
+        for schema in (
+            {"type": [{}]},
+            {"type": []},
+            {"type": "text"},
+            {"format": ["date"]},
+            {"uniqueItems": "yes"},
+            {"patternProperties": ["^a"]},
+            {"additionalProperties": False, "patternProperties": 1},
+            {"dependencies": {"a": [{}]}},
+        ):
+            with self.subTest(schema=schema):
+                registry = SchemaRegistry()
+                uri = registry.add(schema, source="malformed.json")
+                with self.assertRaises(SchemaError):
+                    registry.compile(uri)
+
+    def test_ref_loops_on_the_same_value_raise_schema_error(self) -> None:
+        for schema in (
+            {"$ref": "#"},
+            {"not": {"$ref": "#"}},
+            {"$ref": "#/definitions/a", "definitions": {
+                "a": {"$ref": "#/definitions/b"},
+                "b": {"allOf": [{"$ref": "#/definitions/a"}]},
+            }},
+        ):
+            with self.subTest(schema=schema):
+                registry = SchemaRegistry()
+                uri = registry.add(schema, source="loop.json")
+                with self.assertRaisesRegex(SchemaError, r"\$ref loop"):
+                    registry.compile(uri)
+
+
+# (keyword under test, schema, instances that validate, instances that do not)
+KEYWORD_CASES = [
+    ("type integer", {"type": "integer"}, [1, -3, 2.0], [True, 1.5, "1", None]),
+    ("type number", {"type": "number"}, [1, 1.5], [False, "1"]),
+    ("type boolean", {"type": "boolean"}, [True, False], [0, 1, None]),
+    ("type list", {"type": ["string", "null"]}, ["a", None], [0, [], {}]),
+    ("enum", {"enum": [True, 0, "a", [1], {"k": None}]}, [True, 0, 0.0, "a", [1], {"k": None}],
+     [False, 1, 1.0, "b", [True], {"k": 0}]),
+    ("enum bool vs number", {"enum": [1]}, [1, 1.0], [True]),
+    ("const", {"const": {"a": [1, False]}}, [{"a": [1.0, False]}], [{"a": [1, 0]}, {"a": [1]}, [1, False]]),
+    ("minimum/maximum", {"minimum": 1, "maximum": 3}, [1, 2.5, 3, "x"], [0, 3.01]),
+    ("exclusive bounds", {"exclusiveMinimum": 1, "exclusiveMaximum": 3}, [1.5, 2], [1, 3]),
+    ("multipleOf", {"multipleOf": 0.1}, [0.3, 1, 2.5], [0.35, 1.01]),
+    ("multipleOf integer", {"multipleOf": 3}, [0, 9, -3, 6.0], [4, 7.5]),
+    ("string length", {"minLength": 2, "maxLength": 3}, ["ab", "abc", 5], ["a", "abcd"]),
+    ("pattern", {"pattern": "^[A-Z]{2}-\\d+$"}, ["AB-12", 7], ["ab-12", "AB-"]),
+    ("format", {"format": "date-time"}, ["2026-01-15T10:00:00Z", "2026-01-15T10:00:00.5+02:00", 1],
+     ["2026-01-15", "2026-13-15T10:00:00Z"]),
+    ("unknown format", {"format": "hostname-ish"}, ["anything"], []),
+    ("items", {"items": {"type": "integer"}}, [[], [1, 2], "x"], [[1, "2"]]),
+    ("tuple items", {"items": [{"type": "string"}, {"type": "integer"}], "additionalItems": False},
+     [["a"], ["a", 1]], [[1], ["a", 1, 2]]),
+    ("array size", {"minItems": 1, "maxItems": 2}, [[1], [1, 2]], [[], [1, 2, 3]]),
+    ("uniqueItems", {"uniqueItems": True}, [[1, "1", True], [{"a": 1}, {"a": 2}]], [[1, 1.0], [{"a": 1}, {"a": 1}]]),
+    ("contains", {"contains": {"const": 2}}, [[1, 2]], [[], [1, 3]]),
+    ("required", {"required": ["a", "b"]}, [{"a": 1, "b": None}, []], [{"a": 1}]),
+    ("object size", {"minProperties": 1, "maxProperties": 1}, [{"a": 1}], [{}, {"a": 1, "b": 2}]),
+    ("properties", {"properties": {"a": {"type": "string"}}}, [{"a": "x"}, {"b": 1}], [{"a": 1}]),
+    ("patternProperties", {"patternProperties": {"^x-": {"type": "integer"}}}, [{"x-a": 1, "y": "s"}],
+     [{"x-a": "s"}]),
+    ("additionalProperties false",
+     {"properties": {"a": {}}, "patternProperties": {"^x-": {}}, "additionalProperties": False},
+     [{"a": 1, "x-b": 2}], [{"a": 1, "b": 2}]),
+    ("additionalProperties schema", {"properties": {"a": {}}, "additionalProperties": {"type": "integer"}},
+     [{"a": "s", "b": 1}], [{"b": "s"}]),
+    ("propertyNames", {"propertyNames": {"maxLength": 2}}, [{"ab": 1}], [{"abc": 1}]),
+    ("dependencies array", {"dependencies": {"a": ["b"]}}, [{"a": 1, "b": 2}, {"b": 2}], [{"a": 1}]),
+    ("dependencies schema", {"dependencies": {"a": {"required": ["c"]}}}, [{"a": 1, "c": 2}, {}], [{"a": 1}]),
+    ("if/then/else", {"if": {"properties": {"kind": {"const": "a"}}}, "then": {"required": ["x"]},
+                      "else": {"required": ["y"]}},
+     [{"kind": "a", "x": 1}, {"kind": "b", "y": 1}], [{"kind": "a", "y": 1}, {"kind": "b", "x": 1}]),
+    ("allOf", {"allOf": [{"minimum": 1}, {"maximum": 2}]}, [1, 2], [0, 3]),
+    ("anyOf", {"anyOf": [{"type": "string"}, {"minimum": 5}]}, ["a", 5], [4]),
+    ("oneOf", {"oneOf": [{"type": "integer"}, {"minimum": 2}]}, [1, 2.5], [3, 1.5]),
+    ("not", {"not": {"type": "string"}}, [1, None], ["a"]),
+    ("boolean schemas", {"properties": {"yes": True, "no": False}}, [{"yes": 1}], [{"no": 1}]),
+]
+
+
+class KeywordTests(unittest.TestCase):
+    def assert_verdicts(self, validator, valid, invalid) -> None:
+        for instance in valid:
+            with self.subTest(instance=instance, expected="valid"):
+                self.assertEqual(validator.validate(instance), [])
+        for instance in invalid:
+            with self.subTest(instance=instance, expected="invalid"):
+                self.assertNotEqual(validator.validate(instance), [])
+
+    def test_keywords(self) -> None:
+        for name, schema, valid, invalid in KEYWORD_CASES:
+            with self.subTest(keyword=name):
+                registry = SchemaRegistry()
+                validator = registry.compile(registry.add(schema, source=f"{name}.json"))
+                self.assert_verdicts(validator, valid, invalid)
+
+    def test_recursive_ref_through_definitions(self) -> None:
+        registry = SchemaRegistry()
+        uri = registry.add(
+            {"$ref": "#/definitions/node", "definitions": {"node": {
+                "type": "object",
+                "required": ["value"],
+                "properties": {"value": {"type": "integer"}, "next": {"$ref": "#/definitions/node"}},
+            }}},
+            source="list.json",
+        )
+
+        self.assert_verdicts(
+            registry.compile(uri),
+            [{"value": 1}, {"value": 1, "next": {"value": 2, "next": {"value": 3}}}],
+            [{"value": 1, "next": {"value": "2"}}, {"value": 1, "next": {}}],
+        )
+
+    def test_cross_document_ref_by_id(self) -> None:
+        registry = SchemaRegistry()
+        registry.add(
+            {"$id": "http://example.test/common/money.json", "type": "object", "required": ["amount"],
+             "properties": {"amount": {"type": "number", "minimum": 0}}},
+            source="money.json",
+        )
+        uri = registry.add(
+            {"$id": "http://example.test/line.json", "type": "object",
+             "properties": {"price": {"$ref": "common/money.json"},
+                            "amount": {"$ref": "common/money.json#/properties/amount"}}},
+            source="line.json",
+        )
+
+        self.assert_verdicts(
+            registry.compile(uri),
+            [{"price": {"amount": 5}, "amount": 0}],
+            [{"price": {"amount": -1}}, {"price": {}}, {"amount": "5"}],
+        )
+
+    def test_ref_siblings_are_ignored(self) -> None:
+        registry = SchemaRegistry()
+        uri = registry.add(
+            {"definitions": {"s": {"type": "string"}}, "properties": {"a": {"$ref": "#/definitions/s", "maxLength": 1}}},
+            source="siblings.json",
+        )
+
+        self.assert_verdicts(registry.compile(uri), [{"a": "long"}], [{"a": 1}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,15 +4,79 @@ API Contract Validation Script
 
 Validates OpenAPI specifications for completeness and consistency.
 
+Per-path and per-operation checks are OperationRules run by one
+OperationVisitor traversal of spec['paths']. To add a check, register another
+rule in ApiContractValidator.operation_rules(); each rule collects its own
+findings, which are reported in rule order.
+
 Usage:
     python3 validate-api-contract.py <path-to-openapi-yaml>
     python3 validate-api-contract.py planning-mds/api/example-api.yaml
 """
 
 import sys
-import yaml
 from pathlib import Path
-from typing import Any, List, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "scripts"))
+from openapi_spec import load_spec, spec_graph  # noqa: E402
+
+HTTP_METHODS = ['get', 'post', 'put', 'patch', 'delete', 'options', 'head']
+RESPONSE_METHODS = ['get', 'post', 'put', 'patch', 'delete']
+
+
+class OperationRule:
+    """
+    A check run during the single paths traversal.
+
+    on_path(rule, path, path_item) is called for every path and
+    on_operation(rule, path, method, operation) for every operation whose
+    method is in methods. begin(rule), when set, runs before the traversal and
+    returning False skips the rule's callbacks. Findings go to the rule's own
+    errors/warnings, so output order matches running the rules one at a time.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        methods: Sequence[str] = (),
+        on_path: Optional[Callable[..., None]] = None,
+        on_operation: Optional[Callable[..., None]] = None,
+        begin: Optional[Callable[["OperationRule"], bool]] = None,
+    ):
+        self.name = name
+        self.methods = tuple(methods)
+        self.on_path = on_path
+        self.on_operation = on_operation
+        self.begin = begin
+        self.errors: List[str] = []
+        self.warnings: List[str] = []
+
+
+class OperationVisitor:
+    """Walks spec['paths'] once, dispatching each path and operation to the registered rules."""
+
+    def __init__(self, rules: Sequence[OperationRule]):
+        self.path_rules = [rule for rule in rules if rule.on_path]
+        self.operation_rules: Dict[str, List[OperationRule]] = {}
+        for rule in rules:
+            if rule.on_operation:
+                for method in rule.methods:
+                    self.operation_rules.setdefault(method, []).append(rule)
+
+    def visit(self, paths: dict):
+        for path, path_item in paths.items():
+            self.visit_path(path, path_item)
+
+    def visit_path(self, path: str, path_item: Any):
+        for rule in self.path_rules:
+            rule.on_path(rule, path, path_item)
+        if not isinstance(path_item, dict):
+            return
+        for method, operation in path_item.items():
+            for rule in self.operation_rules.get(method, ()):
+                rule.on_operation(rule, path, method, operation)
+
 
 class ApiContractValidator:
     ERROR_SCHEMA_NAME = 'ProblemDetails'
@@ -21,14 +85,15 @@ class ApiContractValidator:
     def __init__(self, file_path: str):
         self.file_path = Path(file_path)
         self.spec = None
+        self.graph = None
         self.errors = []
         self.warnings = []
 
     def load_spec(self) -> bool:
-        """Load OpenAPI YAML spec."""
+        """Load OpenAPI YAML spec (parsed once per process, cached on disk by content hash)."""
         try:
-            with open(self.file_path, 'r', encoding='utf-8') as f:
-                self.spec = yaml.safe_load(f)
+            self.spec = load_spec(self.file_path)
+            self.graph = spec_graph(self.spec)
             return True
         except Exception as e:
             self.errors.append(f"Failed to load API spec: {e}")
@@ -40,11 +105,10 @@ class ApiContractValidator:
             return False, self.errors, self.warnings
 
         self.check_required_fields()
-        self.check_paths()
-        self.check_responses()
-        self.check_error_contract()
+        self.check_operations()
         self.check_security()
         self.check_schemas()
+        self.check_refs()
 
         is_valid = len(self.errors) == 0
         return is_valid, self.errors, self.warnings
@@ -62,149 +126,149 @@ class ApiContractValidator:
                 if field not in self.spec['info']:
                     self.errors.append(f"Missing required info field: {field}")
 
-    def check_paths(self):
+    def operation_rules(self) -> List[OperationRule]:
+        """Rules run by the single paths traversal, in reporting order."""
+        return [
+            OperationRule('paths', HTTP_METHODS, on_path=self.check_path, on_operation=self.check_operation),
+            OperationRule('responses', RESPONSE_METHODS, on_operation=self.check_responses),
+            OperationRule(
+                'error_contract',
+                RESPONSE_METHODS,
+                on_operation=self.check_error_responses,
+                begin=self.check_error_contract,
+            ),
+        ]
+
+    def check_operations(self):
+        """Run every operation rule over one traversal of the paths."""
+        rules = self.operation_rules()
+        active = [rule for rule in rules if rule.begin is None or rule.begin(rule)]
+        paths = self.spec.get('paths')
+        if isinstance(paths, dict):
+            OperationVisitor(active).visit(paths)
+
+        for rule in rules:
+            self.errors.extend(rule.errors)
+            self.warnings.extend(rule.warnings)
+
+    def check_path(self, rule: OperationRule, path: str, path_item: Any):
         """Check API paths follow REST conventions."""
-        if 'paths' not in self.spec:
-            return
-
-        for path, methods in self.spec['paths'].items():
-            # Check for verbs in path (should use HTTP methods instead)
-            verb_indicators = ['get', 'post', 'put', 'delete', 'create', 'update', 'list']
-            for verb in verb_indicators:
-                if verb in path.lower():
-                    self.warnings.append(f"Path '{path}' contains verb '{verb}' - use HTTP methods instead")
-
-            # Paths should be absolute route templates and avoid legacy /api base prefixes.
-            if not path.startswith('/'):
-                self.warnings.append(f"Path '{path}' should start with '/'")
-            if path == '/api' or path.startswith('/api/'):
-                self.errors.append(
-                    f"Path '{path}' uses forbidden legacy /api prefix; use root resource paths"
-                )
-
-            # Check each method
-            for method in methods:
-                if method not in ['get', 'post', 'put', 'patch', 'delete', 'options', 'head']:
-                    continue
-
-                operation = methods[method]
+        # Check for verbs in path (should use HTTP methods instead)
+        verb_indicators = ['get', 'post', 'put', 'delete', 'create', 'update', 'list']
+        for verb in verb_indicators:
+            if verb in path.lower():
+                rule.warnings.append(f"Path '{path}' contains verb '{verb}' - use HTTP methods instead")
+
+        # Paths should be absolute route templates and avoid legacy /api base prefixes.
+        if not path.startswith('/'):
+            rule.warnings.append(f"Path '{path}' should start with '/'")
+        if path == '/api' or path.startswith('/api/'):
+            rule.errors.append(
+                f"Path '{path}' uses forbidden legacy /api prefix; use root resource paths"
+            )
 
-                # Check for operationId
-                if 'operationId' not in operation:
-                    self.warnings.append(f"{method.upper()} {path}: Missing operationId")
+    def check_operation(self, rule: OperationRule, path: str, method: str, operation: dict):
+        """Check each operation is identified, summarized and has responses."""
+        # Check for operationId
+        if 'operationId' not in operation:
+            rule.warnings.append(f"{method.upper()} {path}: Missing operationId")
 
-                # Check for summary
-                if 'summary' not in operation:
-                    self.warnings.append(f"{method.upper()} {path}: Missing summary")
+        # Check for summary
+        if 'summary' not in operation:
+            rule.warnings.append(f"{method.upper()} {path}: Missing summary")
 
-                # Check for responses
-                if 'responses' not in operation:
-                    self.errors.append(f"{method.upper()} {path}: Missing responses")
+        # Check for responses
+        if 'responses' not in operation:
+            rule.errors.append(f"{method.upper()} {path}: Missing responses")
 
-    def check_responses(self):
+    def check_responses(self, rule: OperationRule, path: str, method: str, operation: dict):
         """Check response definitions."""
-        if 'paths' not in self.spec:
+        if 'responses' not in operation:
             return
 
-        for path, methods in self.spec['paths'].items():
-            for method, operation in methods.items():
-                if method not in ['get', 'post', 'put', 'patch', 'delete']:
-                    continue
-
-                if 'responses' not in operation:
-                    continue
+        responses = operation['responses']
 
-                responses = operation['responses']
+        # Check for success response
+        success_codes = ['200', '201', '204']
+        has_success = any(code in responses for code in success_codes)
+        if not has_success:
+            rule.warnings.append(f"{method.upper()} {path}: No success response (200, 201, or 204)")
 
-                # Check for success response
-                success_codes = ['200', '201', '204']
-                has_success = any(code in responses for code in success_codes)
-                if not has_success:
-                    self.warnings.append(f"{method.upper()} {path}: No success response (200, 201, or 204)")
+        # POST should return 201
+        if method == 'post' and '201' not in responses:
+            rule.warnings.append(f"POST {path}: Should return 201 Created")
 
-                # POST should return 201
-                if method == 'post' and '201' not in responses:
-                    self.warnings.append(f"POST {path}: Should return 201 Created")
+        # DELETE should return 204
+        if method == 'delete' and '204' not in responses:
+            rule.warnings.append(f"DELETE {path}: Should return 204 No Content")
 
-                # DELETE should return 204
-                if method == 'delete' and '204' not in responses:
-                    self.warnings.append(f"DELETE {path}: Should return 204 No Content")
+        # Check for error responses
+        if '400' not in responses:
+            rule.warnings.append(f"{method.upper()} {path}: Missing 400 Bad Request response")
 
-                # Check for error responses
-                if '400' not in responses:
-                    self.warnings.append(f"{method.upper()} {path}: Missing 400 Bad Request response")
+        if '401' not in responses:
+            rule.warnings.append(f"{method.upper()} {path}: Missing 401 Unauthorized response")
 
-                if '401' not in responses:
-                    self.warnings.append(f"{method.upper()} {path}: Missing 401 Unauthorized response")
-
-                if '403' not in responses:
-                    self.warnings.append(f"{method.upper()} {path}: Missing 403 Forbidden response")
+        if '403' not in responses:
+            rule.warnings.append(f"{method.upper()} {path}: Missing 403 Forbidden response")
 
     def _resolve_local_ref(self, ref: str) -> Any:
-        """Resolve local OpenAPI refs like #/components/schemas/Thing."""
-        if not isinstance(ref, str) or not ref.startswith('#/'):
-            return None
-
-        node = self.spec
-        for token in ref[2:].split('/'):
-            if not isinstance(node, dict) or token not in node:
-                return None
-            node = node[token]
-        return node
-
-    def _extract_response_schema_ref(self, response: dict, context: str) -> str:
+        """Resolve local OpenAPI refs like #/components/schemas/Thing (pre-resolved per spec)."""
+        return self.graph.resolve(ref)
+
+    def _extract_response_schema_ref(self, response: dict, context: str, errors: List[str]) -> str:
         """Resolve response object and return application/json schema $ref."""
         if not isinstance(response, dict):
-            self.errors.append(f"{context}: response must be an object")
+            errors.append(f"{context}: response must be an object")
             return ''
 
         response_object = response
         if '$ref' in response:
             response_object = self._resolve_local_ref(response['$ref'])
             if not isinstance(response_object, dict):
-                self.errors.append(f"{context}: invalid response reference {response['$ref']}")
+                errors.append(f"{context}: invalid response reference {response['$ref']}")
                 return ''
 
         content = response_object.get('content', {})
         json_content = content.get('application/json') or content.get('application/problem+json')
         if not isinstance(json_content, dict):
-            self.errors.append(f"{context}: error responses must define application/json content")
+            errors.append(f"{context}: error responses must define application/json content")
             return ''
 
         schema = json_content.get('schema')
         if not isinstance(schema, dict):
-            self.errors.append(f"{context}: error responses must define a schema")
+            errors.append(f"{context}: error responses must define a schema")
             return ''
 
         schema_ref = schema.get('$ref')
         if not schema_ref:
-            self.errors.append(f"{context}: error responses must reference {self.ERROR_SCHEMA_REF}")
+            errors.append(f"{context}: error responses must reference {self.ERROR_SCHEMA_REF}")
             return ''
 
         return schema_ref
 
-    def check_error_contract(self):
-        """Check for canonical RFC 7807 ProblemDetails schema and usage."""
+    def check_error_contract(self, rule: OperationRule) -> bool:
+        """Check for canonical RFC 7807 ProblemDetails schema; True when operations should be checked."""
         if 'components' not in self.spec:
-            self.warnings.append("Missing components section - define reusable schemas")
-            return
+            rule.warnings.append("Missing components section - define reusable schemas")
+            return False
 
         if 'schemas' not in self.spec['components']:
-            self.warnings.append("Missing schemas in components")
-            return
+            rule.warnings.append("Missing schemas in components")
+            return False
 
         schemas = self.spec['components']['schemas']
 
         if 'ErrorResponse' in schemas:
-            self.errors.append(
+            rule.errors.append(
                 "Found legacy ErrorResponse schema - use canonical ProblemDetails schema only"
             )
 
         if self.ERROR_SCHEMA_NAME not in schemas:
-            self.errors.append(
+            rule.errors.append(
                 f"Missing {self.ERROR_SCHEMA_NAME} schema - all APIs should use RFC 7807 format"
             )
-            return
+            return False
 
         error_schema = schemas[self.ERROR_SCHEMA_NAME]
         properties = error_schema.get('properties', {})
@@ -213,40 +277,34 @@ class ApiContractValidator:
         required_properties = ['type', 'title', 'status', 'code', 'traceId']
         for field in required_properties:
             if field not in properties:
-                self.errors.append(f"{self.ERROR_SCHEMA_NAME} missing required property: {field}")
+                rule.errors.append(f"{self.ERROR_SCHEMA_NAME} missing required property: {field}")
 
         required_presence = ['type', 'title', 'status']
         for field in required_presence:
             if field not in required_fields:
-                self.errors.append(f"{self.ERROR_SCHEMA_NAME} should require field: {field}")
-
-        # Every operation-level 4xx/5xx response should reference ProblemDetails.
-        paths = self.spec.get('paths', {})
-        for path, methods in paths.items():
-            if not isinstance(methods, dict):
-                continue
+                rule.errors.append(f"{self.ERROR_SCHEMA_NAME} should require field: {field}")
+        return True
 
-            for method, operation in methods.items():
-                if method not in ['get', 'post', 'put', 'patch', 'delete']:
-                    continue
-                if not isinstance(operation, dict):
-                    continue
+    def check_error_responses(self, rule: OperationRule, path: str, method: str, operation: Any):
+        """Every operation-level 4xx/5xx response should reference ProblemDetails."""
+        if not isinstance(operation, dict):
+            return
 
-                responses = operation.get('responses', {})
-                if not isinstance(responses, dict):
-                    continue
+        responses = operation.get('responses', {})
+        if not isinstance(responses, dict):
+            return
 
-                for status_code, response in responses.items():
-                    status_str = str(status_code)
-                    if not status_str or status_str[0] not in {'4', '5'}:
-                        continue
+        for status_code, response in responses.items():
+            status_str = str(status_code)
+            if not status_str or status_str[0] not in {'4', '5'}:
+                continue
 
-                    context = f"{method.upper()} {path} {status_str}"
-                    schema_ref = self._extract_response_schema_ref(response, context)
-                    if schema_ref and schema_ref != self.ERROR_SCHEMA_REF:
-                        self.errors.append(
-                            f"{context}: expected {self.ERROR_SCHEMA_REF}, found {schema_ref}"
-                        )
+            context = f"{method.upper()} {path} {status_str}"
+            schema_ref = self._extract_response_schema_ref(response, context, rule.errors)
+            if schema_ref and schema_ref != self.ERROR_SCHEMA_REF:
+                rule.errors.append(
+                    f"{context}: expected {self.ERROR_SCHEMA_REF}, found {schema_ref}"
+                )
 
     def check_security(self):
         """Check security definitions."""
@@ -269,6 +327,18 @@ class ApiContractValidator:
             if 'properties' in schema and 'required' not in schema:
                 self.warnings.append(f"Schema '{schema_name}' has properties but no 'required' array")
 
+    def check_refs(self):
+        """Report '$ref' alias loops: reference cycles that never reach a definition."""
+        # Recursive schemas are cycles too, but through real definitions; only
+        # cycles made entirely of '$ref' objects can never be resolved.
+        for cycle in self.graph.cycles:
+            if all(self._is_alias(ref) for ref in cycle):
+                self.errors.append(f"$ref alias loop never reaches a definition: {', '.join(cycle)}")
+
+    def _is_alias(self, ref: str) -> bool:
+        target = self._resolve_local_ref(ref)
+        return isinstance(target, dict) and isinstance(target.get('$ref'), str)
+
 def main():
     if len(sys.argv) < 2:
         print("Usage: python3 validate-api-contract.py <openapi-yaml-file>")
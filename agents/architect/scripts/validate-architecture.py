@@ -16,6 +16,9 @@ import re
 from pathlib import Path
 from typing import List, Dict, Tuple
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "scripts"))
+from markdown_corpus import shared_corpus  # noqa: E402
+
 class ArchitectureValidator:
     def __init__(self, file_path: str, glossary_path: str):
         self.file_path = Path(file_path)
@@ -29,7 +32,7 @@ class ArchitectureValidator:
     def load_blueprint(self) -> bool:
         """Load BLUEPRINT.md content."""
         try:
-            self.content = self.file_path.read_text(encoding='utf-8')
+            self.content = shared_corpus().text(self.file_path)
             return True
         except Exception as e:
             self.errors.append(f"Failed to read file: {e}")
@@ -51,7 +54,7 @@ class ArchitectureValidator:
         Yields: ActivityTimelineEvent
         """
         try:
-            glossary_content = self.glossary_path.read_text(encoding='utf-8')
+            glossary_content = shared_corpus().text(self.glossary_path)
         except Exception as e:
             self.warnings.append(f"Could not read glossary at '{self.glossary_path}': {e}")
             return []
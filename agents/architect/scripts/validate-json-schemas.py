@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+JSON Schema Validation Script
+
+Compiles every *.schema.json in a schemas directory once (draft-07, through
+the shared agents/scripts/json_schema.py engine) and runs the compiled
+validators over:
+- examples in an OpenAPI spec: component-level and property-level `example`
+  values of each components.schemas entry whose name matches a schema
+  `title`, and media-type `example`/`examples` whose schema is a $ref to such
+  a component
+- fixture documents, in batch: <fixtures>/<schema stem>/*.json (one document
+  per file) and *.jsonl (one document per line), where the stem is the schema
+  file name without `.schema.json`
+
+Each validator is compiled once and reused for every document checked against
+it. The run reports validations per second.
+
+The spec is parsed with YAML timestamp resolution turned off: an unquoted
+`example: 2026-01-15T10:00:00Z` is JSON text, so it is checked as the string
+the author wrote rather than as a datetime.
+
+Usage:
+    python3 validate-json-schemas.py <schemas-dir>
+    python3 validate-json-schemas.py planning-mds/schemas --spec planning-mds/api/nebula-api.yaml
+    python3 validate-json-schemas.py planning-mds/schemas --fixtures path/to/fixtures
+"""
+
+import argparse
+import json
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+from urllib.parse import quote
+
+SHARED_SCRIPTS_DIR = Path(__file__).resolve().parents[2] / "scripts"
+sys.path.insert(0, str(SHARED_SCRIPTS_DIR))
+from json_schema import SchemaError, SchemaRegistry, Validator  # noqa: E402
+from openapi_spec import YAML_LOADER, load_spec, spec_graph  # noqa: E402
+
+SCHEMA_SUFFIX = ".schema.json"
+SUPPORTED_DIALECTS = {
+    "http://json-schema.org/draft-07/schema",
+    "http://json-schema.org/draft-07/schema#",
+}
+
+TIMESTAMP_TAG = "tag:yaml.org,2002:timestamp"
+
+
+class TextTimestampLoader(YAML_LOADER):
+    """The shared spec loader, minus YAML's implicit timestamp type."""
+
+
+TextTimestampLoader.yaml_implicit_resolvers = {
+    first: [(tag, regexp) for tag, regexp in resolvers if tag != TIMESTAMP_TAG]
+    for first, resolvers in YAML_LOADER.yaml_implicit_resolvers.items()
+}
+
+
+@dataclass
+class SchemaSet:
+    registry: SchemaRegistry = field(default_factory=SchemaRegistry)
+    by_stem: Dict[str, str] = field(default_factory=dict)  # file stem -> schema URI
+    by_title: Dict[str, str] = field(default_factory=dict)  # schema title -> schema URI
+    validators: Dict[str, Validator] = field(default_factory=dict)  # URI (with pointer) -> compiled validator
+    failed: Dict[str, str] = field(default_factory=dict)  # schema URI -> compile error
+
+    def validator(self, uri: str) -> Validator:
+        """Compiled validator for uri, compiled on first use and reused afterwards."""
+        validator = self.validators.get(uri)
+        if validator is None:
+            validator = self.validators[uri] = self.registry.compile(uri)
+        return validator
+
+
+@dataclass
+class RunStats:
+    validations: int = 0
+    seconds: float = 0.0
+    skipped_examples: int = 0
+
+    def check(self, validator: Validator, document: Any) -> List[str]:
+        started = time.perf_counter()
+        errors = validator.validate(document)
+        self.seconds += time.perf_counter() - started
+        self.validations += 1
+        return errors
+
+
+def load_schemas(schemas_dir: Path, errors: List[str]) -> SchemaSet:
+    schemas = SchemaSet()
+    for path in sorted(schemas_dir.glob(f"*{SCHEMA_SUFFIX}")):
+        try:
+            document = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            errors.append(f"{path}: cannot read schema: {exc}")
+            continue
+        if not isinstance(document, dict):
+            errors.append(f"{path}: schema must be a JSON object")
+            continue
+        dialect = document.get("$schema")
+        if dialect is not None and dialect not in SUPPORTED_DIALECTS:
+            errors.append(f"{path}: unsupported $schema {dialect} (draft-07 only)")
+            continue
+        try:
+            uri = schemas.registry.add(document, path)
+        except SchemaError as exc:
+            errors.append(str(exc))
+            continue
+        schemas.by_stem[path.name[: -len(SCHEMA_SUFFIX)]] = uri
+        title = document.get("title")
+        if isinstance(title, str):
+            schemas.by_title.setdefault(title, uri)
+
+    # Compile everything up front: a schema that does not compile is an error even
+    # when nothing is validated against it yet.
+    for stem, uri in schemas.by_stem.items():
+        try:
+            schemas.validator(uri)
+        except SchemaError as exc:
+            schemas.failed[uri] = str(exc)
+            errors.append(f"{schemas_dir / (stem + SCHEMA_SUFFIX)}: {exc}")
+    return schemas
+
+
+def pointer_token(token: Any) -> str:
+    """Escape one JSON pointer reference token (RFC 6901); YAML keys need not be strings."""
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+
+def iter_spec_examples(spec: Dict[str, Any], schemas: SchemaSet, stats: RunStats) -> Iterator[Tuple[str, str, Any]]:
+    """Yield (location, schema URI, example) for each OpenAPI example that maps to a schema."""
+    components = spec.get("components", {}) if isinstance(spec, dict) else {}
+    component_schemas = components.get("schemas", {}) if isinstance(components, dict) else {}
+    if not isinstance(component_schemas, dict):
+        return
+
+    for name, component in component_schemas.items():
+        if not isinstance(component, dict):
+            continue
+        uri = schemas.by_title.get(name)
+        component_location = f"#/components/schemas/{pointer_token(name)}"
+        examples = []
+        if "example" in component:
+            examples.append((f"{component_location}/example", (), component["example"]))
+        properties = component.get("properties")
+        if isinstance(properties, dict):
+            for prop, prop_schema in properties.items():
+                if isinstance(prop_schema, dict) and "example" in prop_schema:
+                    examples.append((
+                        f"{component_location}/properties/{pointer_token(prop)}/example",
+                        ("properties", prop),
+                        prop_schema["example"],
+                    ))
+        for location, tokens, example in examples:
+            target = schema_at(schemas, uri, tokens)
+            if target is None:
+                stats.skipped_examples += 1
+                continue
+            yield location, target, example
+
+    graph = spec_graph(spec)
+    for path, method, operation in graph.operations():
+        bodies = []
+        request_body = operation.get("requestBody")
+        if request_body is not None:
+            bodies.append(("requestBody", request_body))
+        responses = operation.get("responses")
+        if isinstance(responses, dict):
+            bodies.extend((f"responses/{status}", response) for status, response in responses.items())
+        for label, body in bodies:
+            body = graph.deref(body)
+            content = body.get("content") if isinstance(body, dict) else None
+            if not isinstance(content, dict):
+                continue
+            for media_type, media in content.items():
+                if not isinstance(media, dict):
+                    continue
+                media_examples = []
+                if "example" in media:
+                    media_examples.append(("example", media["example"]))
+                named = media.get("examples")
+                if isinstance(named, dict):
+                    for example_name, example in named.items():
+                        example = graph.deref(example)
+                        if isinstance(example, dict) and "value" in example:
+                            media_examples.append((f"examples/{example_name}", example["value"]))
+                if not media_examples:
+                    continue
+                schema = media.get("schema")
+                ref = schema.get("$ref") if isinstance(schema, dict) else None
+                component_name = (
+                    ref.rsplit("/", 1)[-1] if isinstance(ref, str) and ref.startswith("#/components/schemas/") else None
+                )
+                uri = schemas.by_title.get(component_name) if component_name else None
+                for suffix, example in media_examples:
+                    if uri is None:
+                        stats.skipped_examples += 1
+                        continue
+                    yield f"{method.upper()} {path} {label} {media_type} {suffix}", uri, example
+
+
+def schema_at(schemas: SchemaSet, uri: Optional[str], tokens: Sequence[str]) -> Optional[str]:
+    """URI of the subschema at the given key path, or None when the schema does not define it."""
+    if uri is None:
+        return None
+    if not tokens:
+        return uri
+    node = schemas.registry.documents[uri]
+    for token in tokens:
+        if not isinstance(node, dict) or token not in node:
+            return None
+        node = node[token]
+    pointer = "".join("/" + pointer_token(token) for token in tokens)
+    return f"{uri}#{quote(pointer, safe='/~')}"
+
+
+def iter_fixtures(fixtures_dir: Path, schemas: SchemaSet, errors: List[str]) -> Iterator[Tuple[str, str, Any]]:
+    """Yield (location, schema URI, document) for each fixture document."""
+    for folder in sorted(path for path in fixtures_dir.iterdir() if path.is_dir()):
+        uri = schemas.by_stem.get(folder.name)
+        if uri is None:
+            errors.append(f"{folder}: no {folder.name}{SCHEMA_SUFFIX} to validate fixtures against")
+            continue
+        if uri in schemas.failed:
+            # Already reported by load_schemas; there is no validator to run.
+            errors.append(f"{folder}: fixtures not checked, {folder.name}{SCHEMA_SUFFIX} does not compile")
+            continue
+        for path in sorted(folder.iterdir()):
+            if path.suffix not in (".json", ".jsonl"):
+                continue
+            try:
+                text = path.read_text(encoding="utf-8")
+            except OSError as exc:
+                errors.append(f"{path}: cannot read fixture: {exc}")
+                continue
+            if path.suffix == ".json":
+                lines = [(None, text)]
+            else:
+                lines = [(number, line) for number, line in enumerate(text.splitlines(), 1) if line.strip()]
+            for number, source in lines:
+                location = str(path) if number is None else f"{path}:{number}"
+                try:
+                    document = json.loads(source)
+                except ValueError as exc:
+                    errors.append(f"{location}: invalid JSON: {exc}")
+                    continue
+                yield location, uri, document
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compile JSON Schemas and validate OpenAPI examples and fixtures")
+    parser.add_argument("schemas_dir", help=f"Directory of *{SCHEMA_SUFFIX} files")
+    parser.add_argument("--spec", action="append", default=[], help="OpenAPI YAML whose examples to validate (repeatable)")
+    parser.add_argument(
+        "--fixtures",
+        action="append",
+        default=None,
+        help="Fixture directory of <schema stem>/*.json|*.jsonl (repeatable; default: <schemas-dir>/fixtures)",
+    )
+    args = parser.parse_args()
+
+    schemas_dir = Path(args.schemas_dir)
+    print(f"Validating JSON schemas: {schemas_dir}")
+    print("-" * 60)
+
+    errors: List[str] = []
+    if not schemas_dir.is_dir():
+        print(f"[FAIL] Schema directory not found: {schemas_dir}")
+        sys.exit(1)
+
+    started = time.perf_counter()
+    schemas = load_schemas(schemas_dir, errors)
+    compile_ms = (time.perf_counter() - started) * 1000
+    print(
+        f"[INFO] Compiled {len(schemas.by_stem) - len(schemas.failed)} schema(s), "
+        f"{len(schemas.failed)} failed to compile, in {compile_ms:.1f} ms"
+    )
+
+    stats = RunStats()
+    for spec_path in args.spec:
+        try:
+            spec = load_spec(spec_path, loader=TextTimestampLoader)
+        except Exception as exc:
+            errors.append(f"Could not load API spec {spec_path}: {exc}")
+            continue
+        before, skipped = stats.validations, stats.skipped_examples
+        for location, uri, example in iter_spec_examples(spec, schemas, stats):
+            try:
+                validator = schemas.validator(uri)
+            except SchemaError as exc:
+                errors.append(f"{spec_path} {location}: {exc}")
+                continue
+            errors.extend(f"{spec_path} {location}: {error}" for error in stats.check(validator, example))
+        print(
+            f"[INFO] {spec_path}: {stats.validations - before} example(s) checked, "
+            f"{stats.skipped_examples - skipped} without a matching schema skipped"
+        )
+
+    fixture_dirs = [Path(path) for path in args.fixtures] if args.fixtures else [schemas_dir / "fixtures"]
+    for fixtures_dir in fixture_dirs:
+        if not fixtures_dir.is_dir():
+            if args.fixtures:
+                errors.append(f"Fixture directory not found: {fixtures_dir}")
+            continue
+        before = stats.validations
+        for location, uri, document in iter_fixtures(fixtures_dir, schemas, errors):
+            try:
+                validator = schemas.validator(uri)
+            except SchemaError as exc:
+                errors.append(f"{location}: {exc}")
+                continue
+            errors.extend(f"{location}: {error}" for error in stats.check(validator, document))
+        print(f"[INFO] {fixtures_dir}: {stats.validations - before} fixture document(s) checked")
+
+    rate = stats.validations / stats.seconds if stats.seconds else 0.0
+    print(f"[INFO] {stats.validations} validation(s) in {stats.seconds * 1000:.2f} ms ({rate:,.0f} validations/s)")
+
+    if errors:
+        print(f"[FAIL] {len(errors)} error(s) found:")
+        for idx, error in enumerate(errors, 1):
+            print(f"  {idx}. {error}")
+        sys.exit(1)
+
+    print("[PASS] JSON schema checks passed.")
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
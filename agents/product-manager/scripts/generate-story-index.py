@@ -11,17 +11,30 @@ Stories are colocated in feature folders:
 Usage:
     python generate-story-index.py <features-directory>
     python generate-story-index.py planning-mds/features/
+    python generate-story-index.py planning-mds/features/ --check
 
 Output:
-    Creates STORY-INDEX.md in the features directory
+    Creates STORY-INDEX.md in the features directory. The file is rewritten
+    (via a temp file and atomic rename) only when its content changes.
+    With --check nothing is written; exit code 1 means the index is stale.
+
+Story metadata is cached in .cache/story-index/metadata.json, keyed by file
+path and content hash, so unchanged stories are not re-read or re-parsed.
 """
 
 import sys
+import argparse
+import hashlib
 import io
+import json
+import os
 import re
 from pathlib import Path
 from typing import List, Dict, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "scripts"))
+from story_header import parse_story_header  # noqa: E402
 
 # Windows cp1252 stdout can't encode emojis used in report output.
 # Reconfigure to utf-8 unconditionally — safe on all platforms.
@@ -30,6 +43,9 @@ if hasattr(sys.stdout, 'buffer'):
 if hasattr(sys.stderr, 'buffer'):
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
 
+METADATA_CACHE_VERSION = 4
+DEFAULT_METADATA_CACHE = Path(__file__).resolve().parents[3] / ".cache" / "story-index" / "metadata.json"
+
 # Files in feature folders that are NOT stories — skip during scanning.
 _SKIP_FILENAMES = frozenset({
     "PRD.MD", "README.MD", "STATUS.MD", "GETTING-STARTED.MD",
@@ -57,68 +73,151 @@ class StoryMetadata:
     phase: Optional[str] = None
     persona: Optional[str] = None
 
+
+_CACHED_FIELDS = [field.name for field in fields(StoryMetadata) if field.name != "file_path"]
+
+
+class MetadataCache:
+    """
+    Extracted StoryMetadata per story file, persisted as JSON.
+
+    Entries are keyed by absolute path and validated by (mtime, size); when
+    those change the file's sha256 decides whether the entry is still valid.
+    """
+
+    def __init__(self, cache_path: Optional[Path]):
+        self.cache_path = cache_path
+        self.entries: Dict[str, dict] = {}
+        self.dirty = False
+        self.hits = 0
+        self.misses = 0
+        if cache_path is not None and cache_path.is_file():
+            try:
+                payload = json.loads(cache_path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                payload = {}
+            if isinstance(payload, dict) and payload.get("version") == METADATA_CACHE_VERSION:
+                self.entries = payload.get("entries", {})
+
+    def lookup(self, key: str, file_path: Path) -> Optional[StoryMetadata]:
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        stat = os.stat(key)
+        if (entry["mtime_ns"], entry["size"]) != (stat.st_mtime_ns, stat.st_size):
+            if hashlib.sha256(Path(key).read_bytes()).hexdigest() != entry["sha256"]:
+                return None
+            entry["mtime_ns"], entry["size"] = stat.st_mtime_ns, stat.st_size
+            self.dirty = True
+        return StoryMetadata(file_path=file_path, **entry["metadata"])
+
+    def store(self, key: str, metadata: StoryMetadata) -> None:
+        stat = os.stat(key)
+        self.entries[key] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": hashlib.sha256(Path(key).read_bytes()).hexdigest(),
+            "metadata": {name: getattr(metadata, name) for name in _CACHED_FIELDS},
+        }
+        self.dirty = True
+
+    def save(self) -> None:
+        """Write the cache (best effort), dropping entries for deleted files."""
+        if self.cache_path is None or not self.dirty:
+            return
+        entries = {key: entry for key, entry in self.entries.items() if os.path.exists(key)}
+        payload = json.dumps({"version": METADATA_CACHE_VERSION, "entries": entries}, sort_keys=True)
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            _write_atomic(self.cache_path, payload)
+        except OSError:
+            pass
+
+
+def _write_atomic(path: Path, content: str) -> None:
+    """Write content to a temp file beside path, then rename it over path."""
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        temp_path.write_text(content, encoding="utf-8")
+        os.replace(temp_path, path)
+    finally:
+        if temp_path.exists():
+            temp_path.unlink()
+
+
 class StoryIndexGenerator:
-    def __init__(self, features_dir: str):
+    def __init__(self, features_dir: str, cache_path: Optional[Path] = DEFAULT_METADATA_CACHE):
         self.features_dir = Path(features_dir)
         self.stories: List[StoryMetadata] = []
+        self.cache = MetadataCache(cache_path)
 
-    def extract_metadata(self, file_path: Path) -> StoryMetadata:
-        """Extract metadata from a story markdown file."""
+    def cached_metadata(self, file_path: Path) -> StoryMetadata:
+        """Metadata for file_path, extracted only when the file changed since the last run."""
+        key = os.path.abspath(file_path)
+        try:
+            metadata = self.cache.lookup(key, file_path)
+        except OSError:
+            metadata = None
+        if metadata is not None:
+            self.cache.hits += 1
+            return metadata
+
+        self.cache.misses += 1
         metadata = StoryMetadata(file_path=file_path)
-
         try:
-            content = file_path.read_text(encoding='utf-8')
-
-            # Extract Story ID
-            story_id_match = re.search(r"\*\*Story ID:\*\*\s*([^\n]+)", content)
-            if story_id_match:
-                metadata.story_id = story_id_match.group(1).strip()
-            else:
-                # Try to extract from strict filename (e.g., F0001-S0001-example.md)
-                filename_match = re.match(r"(F\d{4}-S\d{4})", file_path.stem)
-                if filename_match:
-                    metadata.story_id = filename_match.group(1)
-
-            # Extract Title
-            title_match = re.search(r"\*\*Title:\*\*\s*([^\n]+)", content)
-            if title_match:
-                metadata.title = title_match.group(1).strip()
-            else:
-                # Try to extract from first heading
-                heading_match = re.search(r"^#\s+(.+)$", content, re.MULTILINE)
-                if heading_match:
-                    metadata.title = heading_match.group(1).strip()
-
-            # Extract Feature
-            feature_match = re.search(r"\*\*Feature:\*\*\s*([^\n]+)", content)
-            if feature_match:
-                metadata.feature = feature_match.group(1).strip()
-            else:
-                # Infer feature from parent directory name (e.g., F0001-dashboard)
-                parent_name = file_path.parent.name
-                if re.match(r"F\d{4}-", parent_name):
-                    metadata.feature = parent_name
-
-            # Extract Priority
-            priority_match = re.search(r"\*\*Priority:\*\*\s*([^\n]+)", content)
-            if priority_match:
-                metadata.priority = priority_match.group(1).strip()
-
-            # Extract Phase
-            phase_match = re.search(r"\*\*Phase:\*\*\s*([^\n]+)", content)
-            if phase_match:
-                metadata.phase = phase_match.group(1).strip()
-
-            # Extract Persona from "As a..."
-            persona_match = re.search(r"\*\*As\s+a\*\*\s+([^\n*]+)", content)
-            if persona_match:
-                metadata.persona = persona_match.group(1).strip()
-
+            self._extract_fields(metadata)
         except Exception as e:
+            # Not cached, so the warning repeats until the file is fixed.
             print(f"Warning: Failed to extract metadata from {file_path.name}: {e}")
-
+            return metadata
+        self.cache.store(key, metadata)
         return metadata
 
+    def _extract_fields(self, metadata: StoryMetadata) -> None:
+        """Fill metadata from its story file; raises when the file cannot be read."""
+        file_path = metadata.file_path
+        # One pass over the header block; the shared corpus' full markdown parse costs far more.
+        header = parse_story_header(file_path.read_text(encoding='utf-8'))
+
+        # Extract Story ID
+        story_id = header.field("Story ID")
+        if story_id is not None:
+            metadata.story_id = story_id
+        else:
+            # Try to extract from strict filename (e.g., F0001-S0001-example.md)
+            filename_match = re.match(r"(F\d{4}-S\d{4})", file_path.stem)
+            if filename_match:
+                metadata.story_id = filename_match.group(1)
+
+        # Extract Title, else the first heading
+        title = header.field("Title")
+        if title is None:
+            title = header.heading
+        if title is not None:
+            metadata.title = title
+
+        # Extract Feature
+        feature = header.field("Feature")
+        if feature is not None:
+            metadata.feature = feature
+        else:
+            # Infer feature from parent directory name (e.g., F0001-dashboard)
+            parent_name = file_path.parent.name
+            if re.match(r"F\d{4}-", parent_name):
+                metadata.feature = parent_name
+
+        # Extract Priority
+        if header.field("Priority") is not None:
+            metadata.priority = header.field("Priority")
+
+        # Extract Phase
+        if header.field("Phase") is not None:
+            metadata.phase = header.field("Phase")
+
+        # Extract Persona from "As a..."
+        if header.persona is not None:
+            metadata.persona = header.persona
+
     def scan_stories(self):
         """Scan feature directories for story markdown files."""
         if not self.features_dir.exists():
@@ -136,8 +235,9 @@ class StoryIndexGenerator:
 
         # Extract metadata from each file
         for file_path in story_files:
-            metadata = self.extract_metadata(file_path)
+            metadata = self.cached_metadata(file_path)
             self.stories.append(metadata)
+        self.cache.save()
 
         print(f"Found {len(self.stories)} story files")
 
@@ -257,33 +357,65 @@ class StoryIndexGenerator:
 
         return "\n".join(lines)
 
+    def _current_index(self, output_path: Path) -> Optional[str]:
+        try:
+            return output_path.read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError):
+            return None
+
     def write_index(self, output_path: Optional[Path] = None):
-        """Write index to file."""
+        """Write index to file, leaving it untouched when the content is unchanged."""
         if output_path is None:
             output_path = self.features_dir / "STORY-INDEX.md"
 
         index_content = self.generate_index()
+        if self._current_index(output_path) == index_content:
+            print(f"✅ Story index up to date: {output_path}")
+            return
 
         try:
-            output_path.write_text(index_content, encoding='utf-8')
+            _write_atomic(output_path, index_content)
             print(f"✅ Story index generated: {output_path}")
         except Exception as e:
             print(f"❌ Failed to write index: {e}")
             sys.exit(1)
 
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: python generate-story-index.py <features-directory>")
-        print("Example: python generate-story-index.py planning-mds/features/")
-        sys.exit(1)
+    def check_index(self, output_path: Optional[Path] = None) -> bool:
+        """Report whether the index on disk matches what would be generated."""
+        if output_path is None:
+            output_path = self.features_dir / "STORY-INDEX.md"
 
-    features_dir = sys.argv[1]
+        current = self._current_index(output_path)
+        if current == self.generate_index():
+            print(f"✅ Story index up to date: {output_path}")
+            return True
+        if current is None:
+            print(f"❌ Story index missing or unreadable: {output_path}")
+        else:
+            print(f"❌ Story index is stale: {output_path}")
+        print("   Regenerate with: python3 agents/product-manager/scripts/generate-story-index.py "
+              f"{self.features_dir}")
+        return False
 
-    print(f"Generating story index for: {features_dir}")
+def main():
+    parser = argparse.ArgumentParser(
+        description="Generate STORY-INDEX.md for a features directory",
+        epilog="Example: python generate-story-index.py planning-mds/features/",
+    )
+    parser.add_argument("features_dir", help="Features directory containing story files")
+    parser.add_argument("--check", action="store_true", help="Report drift without writing (exit 1 when stale)")
+    parser.add_argument("--no-cache", action="store_true", help="Re-extract every story, ignoring the metadata cache")
+    args = parser.parse_args()
+
+    features_dir = args.features_dir
+
+    print(f"{'Checking' if args.check else 'Generating'} story index for: {features_dir}")
     print("-" * 60)
 
-    generator = StoryIndexGenerator(features_dir)
+    generator = StoryIndexGenerator(features_dir, None if args.no_cache else DEFAULT_METADATA_CACHE)
     generator.scan_stories()
+    if args.check:
+        sys.exit(0 if generator.check_index() else 1)
     generator.write_index()
 
 if __name__ == "__main__":
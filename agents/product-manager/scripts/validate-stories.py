@@ -12,12 +12,15 @@ Usage:
     python3 validate-stories.py planning-mds/features/
     python3 validate-stories.py planning-mds/features/F0001-dashboard/F0001-S0001-nudge-cards.md
     python3 validate-stories.py --strict-warnings planning-mds/features/
+    python3 validate-stories.py --jobs 0 planning-mds/features/
 """
 
 import sys
 import io
 import re
 import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Windows cp1252 stdout can't encode emojis used in report output.
@@ -26,27 +29,140 @@ if hasattr(sys.stdout, 'buffer'):
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 if hasattr(sys.stderr, 'buffer'):
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
-from typing import List, Tuple, Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Set, Tuple, Iterable, Union
 
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "scripts"))
+from markdown_corpus import CacheEntry, shared_corpus  # noqa: E402
+
+
+DEFAULT_RULES_PATH = Path(__file__).with_name("story-quality-rules.yaml")
+RULE_SCOPE_KEYWORDS = ("document", "user-story-statement")
+RULE_CONDITIONS = ("any", "none", "longer-than")
+USER_STORY_STATEMENT_RE = re.compile(r"\*\*As\s+a\*\*.*?\*\*So\s+that\*\*.*?(?=\n\n|\Z)", re.DOTALL | re.IGNORECASE)
+
+RuleScope = Union[str, List[str]]
+
+
+class TermMatcher:
+    """Case-insensitive terms/patterns compiled into one alternation regex."""
+
+    def __init__(self, terms: Sequence[str], patterns: Sequence[str]):
+        self.labels = list(terms) + list(patterns)
+        sources = [re.escape(term) for term in terms] + list(patterns)
+        self.patterns = [re.compile(source, re.IGNORECASE) for source in sources]
+        alternation = "|".join(f"(?:{source})" for source in sources)
+        self.combined = re.compile(alternation, re.IGNORECASE)
+        # Zero-width variant: reports every start position, so overlapping hits are not lost.
+        self.starts = re.compile(f"(?=(?:{alternation}))", re.IGNORECASE)
+
+    def search(self, text: str) -> bool:
+        return self.combined.search(text) is not None
+
+    def matched_labels(self, text: str) -> List[str]:
+        """Labels of every term/pattern occurring in text, in declaration order."""
+        found: Set[int] = set()
+        for match in self.starts.finditer(text):
+            position = match.start()
+            for index, pattern in enumerate(self.patterns):
+                if index not in found and pattern.match(text, position):
+                    found.add(index)
+            if len(found) == len(self.patterns):
+                break
+        return [self.labels[index] for index in sorted(found)]
+
+
+@dataclass
+class QualityRule:
+    id: str
+    scope: RuleScope
+    fallback: Optional[RuleScope]
+    requires: List[str]
+    when: str
+    limit: int
+    matcher: Optional[TermMatcher]
+    unless_scope: Optional[RuleScope]
+    unless_matcher: Optional[TermMatcher]
+    strict: bool
+    message: str
+
+
+def _rule_scope(raw, where: str) -> RuleScope:
+    if isinstance(raw, str) and raw in RULE_SCOPE_KEYWORDS:
+        return raw
+    if isinstance(raw, list) and raw and all(isinstance(name, str) for name in raw):
+        return raw
+    raise ValueError(f"{where}: scope must be one of {', '.join(RULE_SCOPE_KEYWORDS)} or a list of section names")
+
+
+def _rule_matcher(raw: Dict, where: str) -> TermMatcher:
+    terms = raw.get("terms") or []
+    patterns = raw.get("patterns") or []
+    if not terms and not patterns:
+        raise ValueError(f"{where}: needs 'terms' or 'patterns'")
+    try:
+        return TermMatcher([str(term) for term in terms], [str(pattern) for pattern in patterns])
+    except re.error as exc:
+        raise ValueError(f"{where}: invalid pattern: {exc}") from exc
+
+
+@lru_cache(maxsize=None)
+def load_quality_rules(path: str) -> Tuple[QualityRule, ...]:
+    """Load and compile story quality rules; raises ValueError on a malformed file."""
+    try:
+        data = yaml.safe_load(Path(path).read_text(encoding="utf-8")) or {}
+    except (OSError, yaml.YAMLError) as exc:
+        raise ValueError(f"Failed to load quality rules from {path}: {exc}") from exc
+
+    rules: List[QualityRule] = []
+    seen_ids: Set[str] = set()
+    for index, raw in enumerate(data.get("rules") or [], start=1):
+        rule_id = str(raw.get("id") or f"#{index}")
+        where = f"{path}: rule {rule_id}"
+        if rule_id in seen_ids:
+            raise ValueError(f"{where}: duplicate rule id")
+        seen_ids.add(rule_id)
+
+        when = raw.get("when")
+        if when not in RULE_CONDITIONS:
+            raise ValueError(f"{where}: 'when' must be one of {', '.join(RULE_CONDITIONS)}")
+        if not raw.get("message"):
+            raise ValueError(f"{where}: missing 'message'")
+        unless = raw.get("unless")
+        rules.append(QualityRule(
+            id=rule_id,
+            scope=_rule_scope(raw.get("scope"), where),
+            fallback=_rule_scope(raw["fallback"], where) if raw.get("fallback") else None,
+            requires=list(raw.get("requires") or []),
+            when=when,
+            limit=int(raw.get("limit", 0)),
+            matcher=None if when == "longer-than" else _rule_matcher(raw, where),
+            unless_scope=_rule_scope(unless.get("scope"), f"{where} unless") if unless else None,
+            unless_matcher=_rule_matcher(unless, f"{where} unless") if unless else None,
+            strict=bool(raw.get("strict", False)),
+            message=str(raw["message"]),
+        ))
+    return tuple(rules)
 
-STRICT_WARNING_PREFIXES = (
-    "Acceptance criteria contain vague terms:",
-    "No edge cases or error scenarios documented",
-    "No permission/authorization checks documented",
-    "Story involves data mutation but has no audit/timeline requirements",
-)
 
 class StoryValidator:
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, rules: Optional[Sequence[QualityRule]] = None):
         self.file_path = Path(file_path)
+        self.rules = rules if rules is not None else load_quality_rules(str(DEFAULT_RULES_PATH))
         self.content = ""
+        self.document = None
         self.errors = []
         self.warnings = []
+        self.strict_candidates: Set[str] = set()
 
     def load_story(self) -> bool:
         """Load story file content."""
         try:
-            self.content = self.file_path.read_text(encoding='utf-8')
+            self.document = shared_corpus().document(self.file_path)
+            self.content = self.document.text
             return True
         except Exception as e:
             self.errors.append(f"Failed to read file: {e}")
@@ -75,8 +191,7 @@ class StoryValidator:
         self.check_definition_of_done()
 
         # Quality checks
-        self.check_invest_criteria()
-        self.check_acceptance_criteria_quality()
+        self.check_quality_rules()
 
         if strict_warnings:
             self.promote_key_warnings_to_errors()
@@ -91,7 +206,7 @@ class StoryValidator:
         """
         retained_warnings = []
         for warning in self.warnings:
-            if any(warning.startswith(prefix) for prefix in STRICT_WARNING_PREFIXES):
+            if warning in self.strict_candidates:
                 self.errors.append(f"[strict-warning] {warning}")
             else:
                 retained_warnings.append(warning)
@@ -188,107 +303,48 @@ class StoryValidator:
         if not self.get_section_content("Context & Background"):
             self.warnings.append("Missing 'Context & Background' section")
 
-    def check_invest_criteria(self):
-        """Check INVEST criteria quality."""
-
-        user_story_section = self.get_section_content("User Story")
-        invest_scope = user_story_section if user_story_section else self.content
-
-        # Independent: Check for phrases indicating dependencies
-        dependency_phrases = ["depends on", "requires", "needs", "after", "once", "when.*is complete"]
-        for phrase in dependency_phrases:
-            if re.search(phrase, invest_scope, re.IGNORECASE):
-                self.warnings.append(f"Story may have dependencies - check 'Independent' (INVEST)")
-                break
-
-        # Valuable: Check for technical-only language
-        technical_terms = ["database", "api", "endpoint", "schema", "migration", "refactor"]
-        story_section = re.search(r"\*\*As\s+a\*\*.*?\*\*So\s+that\*\*.*?(?=\n\n|\Z)", self.content, re.DOTALL | re.IGNORECASE)
-        if story_section:
-            story_text = story_section.group(0).lower()
-            if any(term in story_text for term in technical_terms):
-                self.warnings.append("Story may be technical-focused rather than user-value focused (INVEST - Valuable)")
-
-        # Small: Check story length (rough heuristic)
-        if len(self.content) > 10000:
-            self.warnings.append("Story is very large (>10k chars) - consider breaking into smaller slices (INVEST - Small)")
-
-        # Testable: Check for vague terms in acceptance criteria
-        vague_terms = ["properly", "correctly", "appropriate", "fast", "user-friendly", "intuitive"]
-        ac_section = self.get_section_content("Acceptance Criteria")
-        if ac_section:
-            ac_text = ac_section.lower()
-            found_vague = [term for term in vague_terms if term in ac_text]
-            if found_vague:
-                self.warnings.append(f"Acceptance criteria contain vague terms: {', '.join(found_vague)} - be more specific (INVEST - Testable)")
-
-    def check_acceptance_criteria_quality(self):
-        """Check acceptance criteria quality."""
-        ac_section = self.get_section_content("Acceptance Criteria")
-        if not ac_section:
-            return
-        ac_text = ac_section.lower()
-
-        # Check for edge cases / negative-path outcomes (heuristic).
-        error_signal_patterns = [
-            r"\bedge cases?\b",
-            r"\berror scenarios?\b",
-            r"\bhttp\s*(4\d{2}|5\d{2})\b",
-            r"\bstatus\s*code\s*(4\d{2}|5\d{2})\b",
-            r"\b(forbidden|unauthorized|not found|conflict|bad request|denied|rejected)\b",
-        ]
-        if not self.contains_pattern(ac_section, error_signal_patterns):
-            self.warnings.append("No edge cases or error scenarios documented - consider adding")
-
-        # Check for permission/authorization semantics across key sections.
-        auth_scope = "\n".join(
-            [
-                ac_section,
-                self.get_section_content("Role-Based Visibility"),
-                self.get_section_content("Non-Functional Expectations"),
-            ]
-        )
-        auth_signal_patterns = [
-            r"\bpermissions?\b",
-            r"\bauthoriz(?:e|ed|ation|ing)\b",
-            r"\bauthenticat(?:e|ed|ion|ing)\b",
-            r"\bauthz\b",
-            r"\brbac\b",
-            r"\babac\b",
-            r"\bforbidden\b",
-            r"\bunauthorized\b",
-            r"\bhttp\s*(401|403)\b",
-        ]
-        if not self.contains_pattern(auth_scope, auth_signal_patterns):
-            self.warnings.append("No permission/authorization checks documented - consider adding if applicable")
-
-        # Check for audit trail (if mutation involved)
-        mutation_keywords = ["create", "update", "delete", "change", "transition", "modify"]
-        mutation_scope = "\n".join(
-            [
-                self.get_section_content("User Story"),
-                ac_section,
-            ]
-        ).lower()
-        if any(keyword in mutation_scope for keyword in mutation_keywords):
-            if "timeline" not in ac_text and "audit" not in ac_text:
-                self.warnings.append("Story involves data mutation but has no audit/timeline requirements")
-
-    @staticmethod
-    def contains_pattern(text: str, patterns: List[str]) -> bool:
-        """Return True when any regex pattern matches text (case-insensitive)."""
-        return any(re.search(pattern, text, re.IGNORECASE) for pattern in patterns)
+    def check_quality_rules(self):
+        """Apply the declarative story quality rules (see story-quality-rules.yaml)."""
+        for rule in self.rules:
+            if any(not self.get_section_content(name) for name in rule.requires):
+                continue
+            text = self.rule_scope_text(rule.scope)
+            if not text and rule.fallback is not None:
+                text = self.rule_scope_text(rule.fallback)
+
+            matches: List[str] = []
+            if rule.when == "longer-than":
+                fired = len(text) > rule.limit
+            elif rule.when == "none":
+                fired = not rule.matcher.search(text)
+            elif "{matches}" in rule.message:
+                matches = rule.matcher.matched_labels(text)
+                fired = bool(matches)
+            else:
+                fired = rule.matcher.search(text)
+
+            if fired and rule.unless_matcher is not None:
+                fired = not rule.unless_matcher.search(self.rule_scope_text(rule.unless_scope))
+            if not fired:
+                continue
+
+            message = rule.message.replace("{matches}", ", ".join(matches))
+            self.warnings.append(message)
+            if rule.strict:
+                self.strict_candidates.add(message)
+
+    def rule_scope_text(self, scope) -> str:
+        """Resolve a rule scope: 'document', 'user-story-statement' or a list of section names."""
+        if scope == "document":
+            return self.content
+        if scope == "user-story-statement":
+            match = USER_STORY_STATEMENT_RE.search(self.content)
+            return match.group(0) if match else ""
+        return "\n".join(self.get_section_content(name) for name in scope)
 
     def get_section_content(self, section_name: str) -> str:
         """Return the content of a markdown section by name (## or ###)."""
-        pattern = re.compile(rf"^##+\s+{re.escape(section_name)}\s*$", re.IGNORECASE | re.MULTILINE)
-        match = pattern.search(self.content)
-        if not match:
-            return ""
-        start = match.end()
-        next_heading = re.search(r"^##+\s+", self.content[start:], re.MULTILINE)
-        end = start + next_heading.start() if next_heading else len(self.content)
-        return self.content[start:end].strip()
+        return self.document.section(section_name, min_level=2, ignore_case=True).strip()
 
 # Files in feature folders that are NOT stories — skip during validation.
 _SKIP_FILENAMES = frozenset({
@@ -341,6 +397,42 @@ def collect_story_files(paths: Iterable[str]) -> Tuple[List[Path], List[str]]:
     return unique_files, errors
 
 
+def validate_story_file(file_path: Path, strict_warnings: bool, rules_path: str) -> Tuple[str, int, int]:
+    """Validate one story and return (report text, error count, warning count)."""
+    lines = [f"Validating story: {file_path}", "-" * 60]
+
+    validator = StoryValidator(str(file_path), load_quality_rules(rules_path))
+    is_valid, errors, warnings = validator.validate(strict_warnings=strict_warnings)
+
+    if errors:
+        lines.append("\n❌ ERRORS (Must Fix):")
+        for i, error in enumerate(errors, 1):
+            lines.append(f"  {i}. {error}")
+
+    if warnings:
+        lines.append("\n⚠️  WARNINGS (Should Fix):")
+        for i, warning in enumerate(warnings, 1):
+            lines.append(f"  {i}. {warning}")
+
+    lines.append("\n" + "=" * 60)
+    if is_valid and not warnings:
+        lines.append("✅ Story validation PASSED - No issues found!")
+    elif is_valid:
+        lines.append(f"⚠️  Story validation PASSED with {len(warnings)} warning(s)")
+    else:
+        lines.append(f"❌ Story validation FAILED with {len(errors)} error(s) and {len(warnings)} warning(s)")
+
+    return "\n".join(lines), len(errors), len(warnings)
+
+
+def _validate_in_worker(
+    file_path: Path, strict_warnings: bool, rules_path: str
+) -> Tuple[str, int, int, Dict[str, CacheEntry]]:
+    """Pool worker: validate one story and hand freshly parsed documents back to the parent's cache."""
+    report, error_count, warning_count = validate_story_file(file_path, strict_warnings, rules_path)
+    return report, error_count, warning_count, shared_corpus().take_updates()
+
+
 def main():
     parser = argparse.ArgumentParser(description="Validate user story files for completeness and quality")
     parser.add_argument(
@@ -348,12 +440,30 @@ def main():
         action="store_true",
         help="Promote key quality warnings (testability/security/audit gaps) to errors",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Validate stories in N worker processes (0 = CPU count); output order is unchanged",
+    )
+    parser.add_argument(
+        "--rules",
+        default=str(DEFAULT_RULES_PATH),
+        help="Story quality rules YAML (default: story-quality-rules.yaml next to this script)",
+    )
     parser.add_argument(
         "paths",
         nargs="+",
         help="Story files or directories to validate",
     )
     args = parser.parse_args()
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+
+    try:
+        load_quality_rules(args.rules)
+    except ValueError as exc:
+        print(f"❌ {exc}")
+        sys.exit(1)
 
     story_files, path_errors = collect_story_files(args.paths)
 
@@ -372,33 +482,29 @@ def main():
     if args.strict_warnings:
         print("Strict warning mode enabled: key warnings will fail validation.\n")
 
-    for file_path in story_files:
-        print(f"Validating story: {file_path}")
-        print("-" * 60)
-
-        validator = StoryValidator(str(file_path))
-        is_valid, errors, warnings = validator.validate(strict_warnings=args.strict_warnings)
-
-        if errors:
-            print("\n❌ ERRORS (Must Fix):")
-            for i, error in enumerate(errors, 1):
-                print(f"  {i}. {error}")
-
-        if warnings:
-            print("\n⚠️  WARNINGS (Should Fix):")
-            for i, warning in enumerate(warnings, 1):
-                print(f"  {i}. {warning}")
-
-        print("\n" + "=" * 60)
-        if is_valid and not warnings:
-            print("✅ Story validation PASSED - No issues found!")
-        elif is_valid:
-            print(f"⚠️  Story validation PASSED with {len(warnings)} warning(s)")
-        else:
-            print(f"❌ Story validation FAILED with {len(errors)} error(s) and {len(warnings)} warning(s)")
-
-        total_errors += len(errors)
-        total_warnings += len(warnings)
+    if jobs > 1 and len(story_files) > 1:
+        corpus = shared_corpus()
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            chunksize = max(1, len(story_files) // (jobs * 4))
+            strict_flags = [args.strict_warnings] * len(story_files)
+            rules_paths = [args.rules] * len(story_files)
+            results = executor.map(
+                _validate_in_worker, story_files, strict_flags, rules_paths, chunksize=chunksize
+            )
+            # map() yields results in input order, so output matches the serial run.
+            for report, error_count, warning_count, cache_updates in results:
+                print(report)
+                corpus.merge(cache_updates)
+                total_errors += error_count
+                total_warnings += warning_count
+    else:
+        for file_path in story_files:
+            report, error_count, warning_count = validate_story_file(
+                file_path, args.strict_warnings, args.rules
+            )
+            print(report)
+            total_errors += error_count
+            total_warnings += warning_count
 
     if total_errors > 0:
         sys.exit(1)
@@ -9,9 +9,13 @@ Validates planning tracker consistency across:
 - planning-mds/BLUEPRINT.md
 - feature STATUS closeout signoff governance for Done/Archived features
 
+Cross-reference checks run as SQL over the incremental planning index
+(agents/scripts/planning_index.py), so unchanged files are not re-parsed.
+
 Usage:
     python3 agents/product-manager/scripts/validate-trackers.py
     python3 agents/product-manager/scripts/validate-trackers.py --features-dir planning-mds/features --blueprint planning-mds/BLUEPRINT.md
+    python3 agents/product-manager/scripts/validate-trackers.py --index-db :memory:
 """
 
 from __future__ import annotations
@@ -21,12 +25,20 @@ import re
 import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence, Tuple
+from typing import Dict, List, Optional, Sequence
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "scripts"))
+from markdown_corpus import MarkdownDocument, shared_corpus  # noqa: E402
+from planning_index import PlanningIndex  # noqa: E402
 
 FEATURE_ID_RE = re.compile(r"F\d{4}")
 STRICT_STORY_FILE_RE = re.compile(r"^F\d{4}-S\d{4}-.+\.md$")
 ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}$")
+STORY_ID_RE = re.compile(r"F\d{4}-S\d{4}")
+BLUEPRINT_LINK_RE = re.compile(r"\[(F\d{4}(?:-S\d{4})?)[^\]]*\]\((features/[^)]+)\)\s*-\s*(.+)$")
+MARKDOWN_LINK_RE = re.compile(r"\]\(([^)]+)\)")
+ROLE_SEPARATOR_RE = re.compile(r"[^a-z0-9]+")
+TRACKER_FILENAMES = {"REGISTRY.md", "ROADMAP.md", "STORY-INDEX.md", "TRACKER-GOVERNANCE.md"}
 
 ROLE_ALIAS_MAP = {
     "qe": "qualityengineer",
@@ -46,12 +58,64 @@ BASELINE_REQUIRED_SIGNOFF_ROLES = {
 }
 
 
+# Signoff and story-index checks run as SQL over the planning index (see
+# agents/scripts/planning_index.py); role/verdict helpers below are registered
+# on the connection as SQL functions by TrackerValidator.open_index().
+REQUIRED_ROLES_SQL = """
+WITH marked AS (
+    SELECT canonical_role(role) AS canonical, role, row_order FROM status_rows
+    WHERE source = :source AND section = 'required' AND role != '' AND is_required_flag(required)
+),
+required_roles AS (
+    SELECT canonical, MIN(row_order) AS first_row,
+        (SELECT m.role FROM marked m WHERE m.canonical = marked.canonical ORDER BY m.row_order DESC LIMIT 1) AS label
+    FROM marked GROUP BY canonical
+)
+"""
+MISSING_PROVENANCE_SQL = REQUIRED_ROLES_SQL + """,
+checklist AS (
+    SELECT story_id, MIN(row_order) AS first_row FROM status_rows
+    WHERE source = :source AND section = 'stories' AND story_id IS NOT NULL GROUP BY story_id
+),
+passing AS (
+    SELECT DISTINCT story_id, canonical_role(role) AS canonical FROM status_rows
+    WHERE source = :source AND section = 'provenance' AND story_id IS NOT NULL AND role != ''
+        AND is_pass_verdict(verdict) AND reviewer != '' AND has_meaningful_value(evidence)
+        AND instr(casefold(evidence), 'agents/') = 0 AND is_iso_date(date)
+)
+SELECT checklist.story_id, required_roles.label FROM checklist CROSS JOIN required_roles
+WHERE NOT EXISTS (
+    SELECT 1 FROM passing
+    WHERE passing.story_id = checklist.story_id AND passing.canonical = required_roles.canonical
+)
+ORDER BY checklist.first_row, required_roles.first_row
+"""
+STORY_ID_DRIFT_SQL = """
+SELECT story_id FROM (
+    SELECT story_id, 1 AS delta FROM stories WHERE story_id IS NOT NULL
+    UNION ALL
+    SELECT story_id, -1 AS delta FROM story_index_links WHERE source = :source
+)
+GROUP BY story_id HAVING SUM(delta) != 0 LIMIT 1
+"""
+MISSING_INDEX_IDS_SQL = """
+SELECT story_id FROM stories WHERE story_id IS NOT NULL
+EXCEPT SELECT story_id FROM story_index_links WHERE source = :source
+ORDER BY story_id
+"""
+EXTRA_INDEX_IDS_SQL = """
+SELECT story_id FROM story_index_links WHERE source = :source
+EXCEPT SELECT story_id FROM stories WHERE story_id IS NOT NULL
+ORDER BY story_id
+"""
+
+
 def _strip_code(value: str) -> str:
     return value.strip().strip("`")
 
 
 def _normalize_role(value: str) -> str:
-    return re.sub(r"[^a-z0-9]+", "", value.casefold())
+    return ROLE_SEPARATOR_RE.sub("", value.casefold())
 
 
 def _canonical_role(value: str) -> str:
@@ -59,14 +123,6 @@ def _canonical_role(value: str) -> str:
     return ROLE_ALIAS_MAP.get(normalized, normalized)
 
 
-def _extract_first_section(content: str, headings: Sequence[str]) -> str:
-    for heading in headings:
-        section = _extract_section(content, heading)
-        if section:
-            return section
-    return ""
-
-
 def _is_required_flag(value: str) -> bool:
     normalized = value.strip().casefold()
     return normalized in {
@@ -91,37 +147,8 @@ def _has_meaningful_value(value: str) -> bool:
     return normalized not in {"", "-", "n/a", "na", "tbd", "none"}
 
 
-def _extract_section(content: str, heading: str) -> str:
-    pattern = re.compile(rf"^##\s+{re.escape(heading)}\s*$", re.MULTILINE)
-    match = pattern.search(content)
-    if not match:
-        return ""
-
-    start = match.end()
-    next_heading = re.search(r"^##\s+", content[start:], re.MULTILINE)
-    end = start + next_heading.start() if next_heading else len(content)
-    return content[start:end]
-
-
-def _parse_table(section: str) -> List[Dict[str, str]]:
-    lines = [line.strip() for line in section.splitlines() if line.strip().startswith("|")]
-    if len(lines) < 3:
-        return []
-
-    headers = [cell.strip() for cell in lines[0].strip("|").split("|")]
-    rows: List[Dict[str, str]] = []
-
-    for line in lines[2:]:
-        cells = [cell.strip() for cell in line.strip("|").split("|")]
-        if len(cells) != len(headers):
-            continue
-        rows.append({headers[i]: cells[i] for i in range(len(headers))})
-
-    return rows
-
-
 def _extract_link(markdown: str) -> Optional[str]:
-    match = re.search(r"\]\(([^)]+)\)", markdown)
+    match = MARKDOWN_LINK_RE.search(markdown)
     return match.group(1).strip() if match else None
 
 
@@ -155,7 +182,7 @@ class RoadmapEntry:
 
 
 class TrackerValidator:
-    def __init__(self, features_dir: Path, blueprint_path: Path):
+    def __init__(self, features_dir: Path, blueprint_path: Path, index_db: Optional[Path] = None):
         self.features_dir = features_dir
         self.blueprint_path = blueprint_path
         self.root_dir = features_dir.parent
@@ -168,18 +195,60 @@ class TrackerValidator:
         self.registry_planned: Dict[str, RegistryEntry] = {}
         self.registry_archived: Dict[str, RegistryEntry] = {}
 
+        self.index_db = index_db
+        self.index: Optional[PlanningIndex] = None
+
     def add_error(self, location: str, message: str) -> None:
         self.issues.append(Issue("ERROR", location, message))
 
     def add_warning(self, location: str, message: str) -> None:
         self.issues.append(Issue("WARNING", location, message))
 
-    def read_file(self, path: Path) -> str:
+    def read_document(self, path: Path) -> Optional[MarkdownDocument]:
         try:
-            return path.read_text(encoding="utf-8")
+            document = shared_corpus().document(path)
         except Exception as exc:
             self.add_error(str(path), f"Failed to read file: {exc}")
-            return ""
+            return None
+        return document if document.text else None
+
+    def read_file(self, path: Path) -> str:
+        document = self.read_document(path)
+        return document.text if document else ""
+
+    def open_index(self) -> PlanningIndex:
+        index = PlanningIndex(self.features_dir, self.index_db)
+        index.refresh()
+        connection = index.connection
+        connection.create_function("canonical_role", 1, _canonical_role, deterministic=True)
+        connection.create_function("is_required_flag", 1, _is_required_flag, deterministic=True)
+        connection.create_function("is_pass_verdict", 1, _is_pass_verdict, deterministic=True)
+        connection.create_function("has_meaningful_value", 1, _has_meaningful_value, deterministic=True)
+        connection.create_function(
+            "is_iso_date", 1, lambda value: ISO_DATE_RE.fullmatch(value) is not None, deterministic=True
+        )
+        connection.create_function("casefold", 1, str.casefold, deterministic=True)
+        return index
+
+    def indexed_source(self, path: Path, kind: str) -> Optional[str]:
+        """
+        Index key for path's tracker rows, or None when it has none.
+
+        Unreadable files are re-read through read_document() so the reported
+        error matches a direct read.
+        """
+        source = self.index.source(path, kind)
+        if source is None or source.error or source.size == 0:
+            self.read_document(path)
+            return None
+        return source.source
+
+    def path_exists(self, path: Path) -> bool:
+        """Path.exists() answered from the indexed features-tree listing where possible."""
+        if self.index.path_known(path):
+            return True
+        # Outside the tree, or a miss that case-insensitive filesystems may still resolve.
+        return path.exists()
 
     def resolve_feature_path(self, raw_path: str) -> Optional[Path]:
         cleaned = _strip_code(raw_path)
@@ -194,8 +263,8 @@ class TrackerValidator:
         return self.features_dir / cleaned
 
     def load_registry(self) -> None:
-        content = self.read_file(self.registry_path)
-        if not content:
+        source = self.indexed_source(self.registry_path, "registry")
+        if source is None:
             return
 
         sections = {
@@ -205,21 +274,25 @@ class TrackerValidator:
         }
 
         for heading, bucket in sections.items():
-            rows = _parse_table(_extract_section(content, heading))
+            rows = self.index.query(
+                "SELECT feature_id, name, status, phase, folder FROM registry_rows "
+                "WHERE source = ? AND section = ? ORDER BY row_order",
+                (source, heading),
+            )
             if not rows and heading != "Planned (Reserved IDs)":
                 self.add_error(str(self.registry_path), f"Missing or malformed table for section: {heading}")
 
-            for row in rows:
-                feature_id = row.get("Feature ID", "").strip()
+            for feature_id, name, status, phase, folder in rows:
+                feature_id = feature_id.strip()
                 if not FEATURE_ID_RE.fullmatch(feature_id):
                     self.add_error(str(self.registry_path), f"Invalid feature ID in {heading}: {feature_id!r}")
                     continue
                 bucket[feature_id] = RegistryEntry(
                     feature_id=feature_id,
-                    name=row.get("Name", "").strip(),
-                    status=row.get("Status", "").strip(),
-                    phase=row.get("Phase", "").strip(),
-                    folder=_strip_code(row.get("Folder", "").strip()),
+                    name=name.strip(),
+                    status=status.strip(),
+                    phase=phase.strip(),
+                    folder=_strip_code(folder.strip()),
                 )
 
         for feature_id, entry in self.registry_active.items():
@@ -235,7 +308,7 @@ class TrackerValidator:
                     str(self.registry_path),
                     f"Active feature {feature_id} points to archive path: {entry.folder}",
                 )
-            if not resolved.exists():
+            if not self.path_exists(resolved):
                 self.add_error(str(self.registry_path), f"Active feature folder does not exist: {resolved}")
             self._validate_status_doc(feature_id, resolved)
 
@@ -252,66 +325,73 @@ class TrackerValidator:
                     str(self.registry_path),
                     f"Archived feature {feature_id} must use archive/ path: {entry.folder}",
                 )
-            if not resolved.exists():
+            if not self.path_exists(resolved):
                 self.add_error(str(self.registry_path), f"Archived feature folder does not exist: {resolved}")
             self._validate_status_doc(feature_id, resolved)
 
     def _validate_status_doc(self, feature_id: str, feature_folder: Path) -> None:
         status_file = feature_folder / "STATUS.md"
-        if not status_file.exists():
+        if not self.path_exists(status_file):
             self.add_error(str(status_file), f"Missing STATUS.md for {feature_id}")
             return
 
-        content = self.read_file(status_file)
-        if not content:
+        source = self.indexed_source(status_file, "status")
+        if source is None:
             return
 
-        status_match = re.search(r"\*\*Overall Status:\*\*\s*(.+)", content)
-        if not status_match:
+        overall_status, required_found, stories_found, provenance_found = self.index.query(
+            "SELECT overall_status, required_found, stories_found, provenance_found FROM status_docs WHERE source = ?",
+            (source,),
+        )[0]
+        if overall_status is None:
             self.add_error(str(status_file), "Missing '**Overall Status:**' line")
             return
 
-        overall_status = status_match.group(1).strip()
         if self._is_done_or_archived(overall_status):
-            self._validate_signoff_sections(feature_id, status_file, content)
+            self._validate_signoff_sections(
+                feature_id, status_file, source, bool(required_found), bool(stories_found), bool(provenance_found)
+            )
 
     def _is_done_or_archived(self, overall_status: str) -> bool:
         normalized = overall_status.casefold()
         return "done" in normalized or "archived" in normalized
 
-    def _validate_signoff_sections(self, feature_id: str, status_file: Path, content: str) -> None:
-        required_section = _extract_first_section(
-            content,
-            [
-                "Required Signoff Roles",
-                "Required Signoff Roles (Set in Planning)",
-            ],
-        )
-        if not required_section:
+    def _count_status_rows(self, source: str, section: str) -> int:
+        return self.index.query(
+            "SELECT COUNT(*) FROM status_rows WHERE source = ? AND section = ?", (source, section)
+        )[0][0]
+
+    def _validate_signoff_sections(
+        self,
+        feature_id: str,
+        status_file: Path,
+        source: str,
+        required_found: bool,
+        stories_found: bool,
+        provenance_found: bool,
+    ) -> None:
+        if not required_found:
             self.add_error(
                 str(status_file),
                 f"{feature_id} is Done/Archived but missing 'Required Signoff Roles' section",
             )
             return
 
-        required_rows = _parse_table(required_section)
-        if not required_rows:
+        if not self._count_status_rows(source, "required"):
             self.add_error(
                 str(status_file),
                 f"{feature_id} is Done/Archived but 'Required Signoff Roles' table is missing or malformed",
             )
             return
 
-        required_roles: Dict[str, str] = {}
-        for row in required_rows:
-            role = row.get("Role", "").strip()
-            if not role:
-                continue
-            required_flag = row.get("Required", "").strip()
-            if _is_required_flag(required_flag):
-                canonical = _canonical_role(role)
-                required_roles[canonical] = role
-
+        # Canonical role -> label of its last marked row, ordered by first appearance.
+        required_roles: Dict[str, str] = {
+            canonical: label
+            for canonical, label in self.index.query(
+                REQUIRED_ROLES_SQL + " SELECT canonical, label FROM required_roles ORDER BY first_row",
+                {"source": source},
+            )
+        }
         if not required_roles:
             self.add_error(
                 str(status_file),
@@ -326,7 +406,7 @@ class TrackerValidator:
                     f"{feature_id} is Done/Archived but baseline required signoff role is missing: {label}",
                 )
 
-        story_ids = self._extract_story_ids_from_status(content, status_file)
+        story_ids = self._extract_story_ids_from_status(source, status_file, stories_found)
         if not story_ids:
             self.add_error(
                 str(status_file),
@@ -334,102 +414,69 @@ class TrackerValidator:
             )
             return
 
-        provenance_section = _extract_first_section(
-            content,
-            [
-                "Story Signoff Provenance",
-                "Story Sign-off Provenance",
-            ],
-        )
-        if not provenance_section:
+        if not provenance_found:
             self.add_error(
                 str(status_file),
                 f"{feature_id} is Done/Archived but missing 'Story Signoff Provenance' section",
             )
             return
 
-        provenance_rows = _parse_table(provenance_section)
-        if not provenance_rows:
+        if not self._count_status_rows(source, "provenance"):
             self.add_error(
                 str(status_file),
                 f"{feature_id} is Done/Archived but 'Story Signoff Provenance' table is missing or malformed",
             )
             return
 
-        passing_pairs: Dict[Tuple[str, str], bool] = {}
-        for row in provenance_rows:
-            story_cell = row.get("Story", "").strip()
-            story_match = re.search(r"F\d{4}-S\d{4}", story_cell)
-            if not story_match:
-                continue
-
-            story_id = story_match.group(0)
-            role = row.get("Role", "").strip()
-            if not role:
-                continue
-
-            canonical = _canonical_role(role)
-            verdict = row.get("Verdict", "").strip()
-            reviewer = row.get("Reviewer", "").strip()
-            evidence = row.get("Evidence", "").strip()
-            date_value = row.get("Date", "").strip()
-
-            if _is_pass_verdict(verdict):
-                if not reviewer:
-                    self.add_error(
-                        str(status_file),
-                        f"Story provenance PASS row for {story_id} role '{role}' is missing reviewer",
-                    )
-                    continue
-                if not _has_meaningful_value(evidence):
-                    self.add_error(
-                        str(status_file),
-                        f"Story provenance PASS row for {story_id} role '{role}' is missing evidence",
-                    )
-                    continue
-                if "agents/" in evidence.casefold():
-                    self.add_error(
-                        str(status_file),
-                        (
-                            f"Story provenance PASS row for {story_id} role '{role}' references "
-                            "agents/ in evidence; use solution artifacts (planning-mds/, code, tests, CI outputs)"
-                        ),
-                    )
-                    continue
-                if not ISO_DATE_RE.fullmatch(date_value):
-                    self.add_error(
-                        str(status_file),
-                        f"Story provenance PASS row for {story_id} role '{role}' has invalid date: {date_value!r}",
-                    )
-                    continue
-                passing_pairs[(story_id, canonical)] = True
+        pass_rows = self.index.query(
+            "SELECT story_id, role, reviewer, evidence, date FROM status_rows "
+            "WHERE source = ? AND section = 'provenance' AND story_id IS NOT NULL AND role != '' "
+            "AND is_pass_verdict(verdict) ORDER BY row_order",
+            (source,),
+        )
+        for story_id, role, reviewer, evidence, date_value in pass_rows:
+            if not reviewer:
+                self.add_error(
+                    str(status_file),
+                    f"Story provenance PASS row for {story_id} role '{role}' is missing reviewer",
+                )
+            elif not _has_meaningful_value(evidence):
+                self.add_error(
+                    str(status_file),
+                    f"Story provenance PASS row for {story_id} role '{role}' is missing evidence",
+                )
+            elif "agents/" in evidence.casefold():
+                self.add_error(
+                    str(status_file),
+                    (
+                        f"Story provenance PASS row for {story_id} role '{role}' references "
+                        "agents/ in evidence; use solution artifacts (planning-mds/, code, tests, CI outputs)"
+                    ),
+                )
+            elif not ISO_DATE_RE.fullmatch(date_value):
+                self.add_error(
+                    str(status_file),
+                    f"Story provenance PASS row for {story_id} role '{role}' has invalid date: {date_value!r}",
+                )
 
-        for story_id in story_ids:
-            for canonical, display_role in required_roles.items():
-                if not passing_pairs.get((story_id, canonical), False):
-                    self.add_error(
-                        str(status_file),
-                        f"Required role '{display_role}' is missing PASS/APPROVED provenance for story {story_id}",
-                    )
+        for story_id, display_role in self.index.query(MISSING_PROVENANCE_SQL, {"source": source}):
+            self.add_error(
+                str(status_file),
+                f"Required role '{display_role}' is missing PASS/APPROVED provenance for story {story_id}",
+            )
 
-    def _extract_story_ids_from_status(self, content: str, status_file: Path) -> List[str]:
-        section = _extract_first_section(content, ["Story Checklist", "Stories"])
-        if not section:
+    def _extract_story_ids_from_status(self, source: str, status_file: Path, stories_found: bool) -> List[str]:
+        if not stories_found:
             return []
 
-        rows = _parse_table(section)
-        story_ids: List[str] = []
-        seen = set()
-
-        for row in rows:
-            story_cell = row.get("Story", "").strip()
-            match = re.search(r"F\d{4}-S\d{4}", story_cell)
-            if not match:
-                continue
-            story_id = match.group(0)
-            if story_id not in seen:
-                story_ids.append(story_id)
-                seen.add(story_id)
+        story_ids = [
+            story_id
+            for (story_id,) in self.index.query(
+                "SELECT story_id FROM status_rows WHERE source = ? AND section = 'stories' "
+                "AND story_id IS NOT NULL GROUP BY story_id ORDER BY MIN(row_order)",
+                (source,),
+            )
+        ]
 
         if not story_ids:
             self.add_warning(str(status_file), "No parseable story IDs found in story status table")
@@ -437,31 +484,30 @@ class TrackerValidator:
         return story_ids
 
     def load_roadmap(self) -> List[RoadmapEntry]:
-        content = self.read_file(self.roadmap_path)
-        if not content:
+        source = self.indexed_source(self.roadmap_path, "roadmap")
+        if source is None:
             return []
 
         entries: List[RoadmapEntry] = []
-        sections = ["Now", "Next", "Later", "Completed"]
-
-        for section in sections:
-            rows = _parse_table(_extract_section(content, section))
-            for row in rows:
-                raw_feature = row.get("Feature", "").strip()
-                feature_id = _extract_feature_id(raw_feature or row.get("Feature ID", ""))
-                if not feature_id:
-                    self.add_warning(
-                        str(self.roadmap_path),
-                        f"Skipping roadmap row in '{section}' without feature ID: {raw_feature!r}",
-                    )
-                    continue
-                entry = RoadmapEntry(
-                    section=section,
-                    feature_id=feature_id,
-                    raw_feature=raw_feature,
-                    link=_extract_link(raw_feature),
+        rows = self.index.query(
+            "SELECT section, feature, feature_id FROM roadmap_rows WHERE source = ? ORDER BY row_order", (source,)
+        )
+        for section, feature, feature_id_cell in rows:
+            raw_feature = feature.strip()
+            feature_id = _extract_feature_id(raw_feature or feature_id_cell)
+            if not feature_id:
+                self.add_warning(
+                    str(self.roadmap_path),
+                    f"Skipping roadmap row in '{section}' without feature ID: {raw_feature!r}",
                 )
-                entries.append(entry)
+                continue
+            entry = RoadmapEntry(
+                section=section,
+                feature_id=feature_id,
+                raw_feature=raw_feature,
+                link=_extract_link(raw_feature),
+            )
+            entries.append(entry)
 
         self.validate_roadmap_entries(entries)
         return entries
@@ -484,7 +530,7 @@ class TrackerValidator:
                         str(self.roadmap_path),
                         f"Roadmap link for {entry.feature_id} in {entry.section} is invalid: {entry.link}",
                     )
-                elif not resolved.exists():
+                elif not self.path_exists(resolved):
                     self.add_error(
                         str(self.roadmap_path),
                         f"Roadmap link target missing for {entry.feature_id}: {resolved}",
@@ -510,17 +556,23 @@ class TrackerValidator:
                 f"Active feature {feature_id} is missing from roadmap Now/Next/Later/Completed sections",
             )
 
-    def collect_story_files(self) -> Tuple[List[Path], List[str]]:
+    def collect_story_files(self) -> List[Path]:
         story_files: List[Path] = []
-        story_ids: List[str] = []
+        headers = {
+            source: (has_header, story_id)
+            for source, has_header, story_id in self.index.query("SELECT source, has_header, story_id FROM stories")
+        }
 
-        for path in sorted(self.features_dir.rglob("*.md")):
-            if path.name in {"REGISTRY.md", "ROADMAP.md", "STORY-INDEX.md", "TRACKER-GOVERNANCE.md"}:
+        for key, path in self.index.markdown_files():
+            if path.name in TRACKER_FILENAMES:
                 continue
 
             if STRICT_STORY_FILE_RE.match(path.name):
-                content = self.read_file(path)
-                if "**Story ID:**" not in content:
+                if key not in headers:
+                    # Unreadable or empty: report any read error, then treat as header-less.
+                    self.indexed_source(path, "story")
+                has_header, story_id = headers.get(key, (0, None))
+                if not has_header:
                     self.add_error(
                         str(path),
                         "Filename matches story pattern but file is missing '**Story ID:**' header",
@@ -528,68 +580,68 @@ class TrackerValidator:
                     continue
 
                 prefix = "-".join(path.stem.split("-")[:2])
-                story_id_match = re.search(r"\*\*Story ID:\*\*\s*(F\d{4}-S\d{4})", content)
-                if not story_id_match:
+                if story_id is None:
                     self.add_error(str(path), "Cannot parse Story ID from story file")
                     continue
-                story_id = story_id_match.group(1)
                 if story_id != prefix:
                     self.add_error(
                         str(path),
                         f"Story ID {story_id} does not match filename prefix {prefix}",
                     )
                 story_files.append(path)
-                story_ids.append(story_id)
-            elif re.match(r"^F\d{4}-S\d{4}", path.name):
+            elif STORY_ID_RE.match(path.name):
                 self.add_error(
                     str(path),
                     "Non-story document starts with F{NNNN}-S{NNNN}; rename to avoid STORY-INDEX drift",
                 )
 
-        duplicate_ids = [story_id for story_id in sorted(set(story_ids)) if story_ids.count(story_id) > 1]
-        for story_id in duplicate_ids:
+        duplicates = self.index.query(
+            "SELECT story_id FROM stories WHERE story_id IS NOT NULL "
+            "GROUP BY story_id HAVING COUNT(*) > 1 ORDER BY story_id"
+        )
+        for (story_id,) in duplicates:
             self.add_error(str(self.features_dir), f"Duplicate story ID detected: {story_id}")
 
-        return story_files, story_ids
+        return story_files
 
-    def validate_story_index(self, story_files: Sequence[Path], story_ids: Sequence[str]) -> None:
-        content = self.read_file(self.story_index_path)
-        if not content:
+    def validate_story_index(self, story_files: Sequence[Path]) -> None:
+        source = self.indexed_source(self.story_index_path, "story-index")
+        if source is None:
             return
 
-        total_match = re.search(r"\*\*Total Stories:\*\*\s*(\d+)", content)
-        if not total_match:
+        (total,) = self.index.query("SELECT total FROM story_index WHERE source = ?", (source,))[0]
+        if total is None:
             self.add_error(str(self.story_index_path), "Missing '**Total Stories:**' header")
-        else:
-            total = int(total_match.group(1))
-            if total != len(story_files):
-                self.add_error(
-                    str(self.story_index_path),
-                    f"Total stories mismatch: index says {total}, filesystem has {len(story_files)}",
-                )
-
-        link_matches = re.findall(r"\[(F\d{4}-S\d{4})\]\(\./([^)]+)\)", content)
-        linked_ids = [item[0] for item in link_matches]
-        linked_paths = [item[1] for item in link_matches]
+        elif total != len(story_files):
+            self.add_error(
+                str(self.story_index_path),
+                f"Total stories mismatch: index says {total}, filesystem has {len(story_files)}",
+            )
 
-        if len(linked_ids) != len(story_files):
+        (link_count,) = self.index.query("SELECT COUNT(*) FROM story_index_links WHERE source = ?", (source,))[0]
+        if link_count != len(story_files):
             self.add_error(
                 str(self.story_index_path),
-                f"Story link count mismatch: index has {len(linked_ids)} entries, filesystem has {len(story_files)}",
+                f"Story link count mismatch: index has {link_count} entries, filesystem has {len(story_files)}",
             )
 
-        expected_ids = sorted(story_ids)
-        if sorted(linked_ids) != expected_ids:
-            missing = sorted(set(expected_ids) - set(linked_ids))
-            extra = sorted(set(linked_ids) - set(expected_ids))
+        parameters = {"source": source}
+        if self.index.query(STORY_ID_DRIFT_SQL, parameters):
+            missing = [story_id for (story_id,) in self.index.query(MISSING_INDEX_IDS_SQL, parameters)]
+            extra = [story_id for (story_id,) in self.index.query(EXTRA_INDEX_IDS_SQL, parameters)]
             if missing:
                 self.add_error(str(self.story_index_path), f"Missing story IDs in index: {', '.join(missing)}")
             if extra:
                 self.add_error(str(self.story_index_path), f"Unexpected story IDs in index: {', '.join(extra)}")
 
-        for rel in linked_paths:
+        links = self.index.query(
+            "SELECT l.rel_path, p.path IS NOT NULL FROM story_index_links l "
+            "LEFT JOIN paths p ON p.path = l.target WHERE l.source = ? ORDER BY l.row_order",
+            (source,),
+        )
+        for rel, indexed in links:
             linked_file = self.features_dir / rel
-            if not linked_file.exists():
+            if not indexed and not linked_file.exists():
                 self.add_error(str(self.story_index_path), f"Story index link target missing: {rel}")
                 continue
             if not STRICT_STORY_FILE_RE.match(linked_file.name):
@@ -608,7 +660,7 @@ class TrackerValidator:
             if not line.startswith("- ["):
                 continue
 
-            match = re.search(r"\[(F\d{4}(?:-S\d{4})?)[^\]]*\]\((features/[^)]+)\)\s*-\s*(.+)$", line)
+            match = BLUEPRINT_LINK_RE.search(line)
             if not match:
                 continue
 
@@ -617,7 +669,7 @@ class TrackerValidator:
             status_text = match.group(3)
             target = self.root_dir / rel_path
 
-            if not target.exists():
+            if not self.path_exists(target):
                 self.add_error(
                     f"{self.blueprint_path}:{lineno}",
                     f"Blueprint link target missing for {item_id}: {rel_path}",
@@ -659,11 +711,13 @@ class TrackerValidator:
             self.print_report()
             return 1
 
+        self.index = self.open_index()
         self.load_registry()
         self.load_roadmap()
-        story_files, story_ids = self.collect_story_files()
-        self.validate_story_index(story_files, story_ids)
+        story_files = self.collect_story_files()
+        self.validate_story_index(story_files)
         self.validate_blueprint()
+        self.index.close()
 
         self.print_report()
         return 1 if any(issue.severity == "ERROR" for issue in self.issues) else 0
@@ -706,9 +760,16 @@ def main() -> int:
         default="planning-mds/BLUEPRINT.md",
         help="Path to blueprint file (default: planning-mds/BLUEPRINT.md)",
     )
+    parser.add_argument(
+        "--index-db",
+        default="",
+        help="Planning index SQLite path, or :memory: (default: .cache/planning-index/...)",
+    )
     args = parser.parse_args()
 
-    validator = TrackerValidator(Path(args.features_dir), Path(args.blueprint))
+    validator = TrackerValidator(
+        Path(args.features_dir), Path(args.blueprint), Path(args.index_db) if args.index_db else None
+    )
     return validator.validate()
 
 
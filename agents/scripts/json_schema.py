@@ -0,0 +1,656 @@
+"""
+Compiled JSON Schema (draft-07) validators for framework gate scripts.
+
+compile() turns a schema into a tree of Python closures once, so validating a
+document runs only the checks its schema declares instead of re-interpreting
+the schema per document. Compiled validators are cached per schema location in
+the SchemaRegistry and reused across documents; '$ref's to other registered
+schemas (by '$id', relative or absolute) and to local '#/...' pointers are
+resolved at compile time, recursive refs included. A document's root '$id'
+is its base URI; '$id's nested inside a document are not treated as new bases.
+
+All draft-07 assertion keywords are supported. format is asserted for
+date-time, date, time, email, uuid, uri and ipv4; other formats, annotations
+and unknown keywords are ignored as the draft allows. Only pure Python is
+used: no third-party validator is required.
+
+Usage (from a gate script):
+    sys.path.insert(0, str(<repo root> / "agents" / "scripts"))
+    from json_schema import SchemaRegistry
+
+    registry = SchemaRegistry()
+    uri = registry.add(schema, source="account.schema.json")
+    validator = registry.compile(uri)
+    errors = validator.validate(document)   # ["/email: 'x' is not a valid email", ...]
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+from urllib.parse import unquote, urldefrag, urljoin
+
+# check(instance, path, errors): append "<json pointer>: <message>" for each violation.
+Check = Callable[[Any, str, List[str]], None]
+
+FORMAT_PATTERNS = {
+    "date-time": re.compile(
+        r"^\d{4}-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])[Tt]([01]\d|2[0-3]):[0-5]\d:([0-5]\d|60)(\.\d+)?"
+        r"([Zz]|[+-]([01]\d|2[0-3]):[0-5]\d)$"
+    ),
+    "date": re.compile(r"^\d{4}-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])$"),
+    "time": re.compile(r"^([01]\d|2[0-3]):[0-5]\d:([0-5]\d|60)(\.\d+)?([Zz]|[+-]([01]\d|2[0-3]):[0-5]\d)?$"),
+    "email": re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$"),
+    "uuid": re.compile(r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"),
+    "uri": re.compile(r"^[A-Za-z][A-Za-z0-9+.-]*:[^\s]*$"),
+    "ipv4": re.compile(r"^((25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)\.){3}(25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)$"),
+}
+
+
+class SchemaError(Exception):
+    """A schema that cannot be compiled (bad '$ref', pattern or keyword value)."""
+
+
+def _is_number(value: Any) -> bool:
+    return value.__class__ is int or value.__class__ is float
+
+
+def _is_integer(value: Any) -> bool:
+    if value.__class__ is int:
+        return True
+    return value.__class__ is float and value.is_integer()
+
+
+TYPE_CHECKS: Dict[str, Callable[[Any], bool]] = {
+    "object": lambda value: value.__class__ is dict,
+    "array": lambda value: value.__class__ is list,
+    "string": lambda value: value.__class__ is str,
+    "number": _is_number,
+    "integer": _is_integer,
+    "boolean": lambda value: value.__class__ is bool,
+    "null": lambda value: value is None,
+}
+
+
+def _json_equal(left: Any, right: Any) -> bool:
+    """JSON equality: 1 == 1.0, but true != 1."""
+    if isinstance(left, bool) or isinstance(right, bool):
+        return left is right
+    if _is_number(left) and _is_number(right):
+        return left == right
+    if left.__class__ is list and right.__class__ is list:
+        return len(left) == len(right) and all(_json_equal(a, b) for a, b in zip(left, right))
+    if left.__class__ is dict and right.__class__ is dict:
+        return left.keys() == right.keys() and all(_json_equal(left[key], right[key]) for key in left)
+    return left.__class__ is right.__class__ and left == right
+
+
+def _escape(token: Any) -> str:
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+
+def _short(value: Any) -> str:
+    text = repr(value)
+    return text if len(text) <= 60 else text[:57] + "..."
+
+
+class Validator:
+    """A compiled schema: validate() returns the violations of one document."""
+
+    __slots__ = ("uri", "_check")
+
+    def __init__(self, uri: str, check: Check):
+        self.uri = uri
+        self._check = check
+
+    def validate(self, instance: Any) -> List[str]:
+        errors: List[str] = []
+        self._check(instance, "", errors)
+        return errors
+
+    def is_valid(self, instance: Any) -> bool:
+        return not self.validate(instance)
+
+
+class SchemaRegistry:
+    """Schemas by URI, compiled on first use and cached per location."""
+
+    def __init__(self) -> None:
+        self.documents: Dict[str, Any] = {}
+        self.sources: Dict[str, str] = {}
+        self._compiled: Dict[str, Check] = {}
+        self._stubbed: List[str] = []  # cache keys in stub order, for rollback on a failed compile
+        # Refs being compiled that apply to the current instance itself (no item or
+        # member descended into since): reaching one again would recurse forever.
+        self._in_place: Set[str] = set()
+
+    def add(self, schema: Any, source: Union[str, Path]) -> str:
+        """Register a schema document; returns its URI ('$id', else the source path as a file URI)."""
+        uri = schema.get("$id") if isinstance(schema, dict) else None
+        if not isinstance(uri, str) or not uri:
+            uri = Path(source).resolve().as_uri()
+        uri = urldefrag(uri)[0]
+        if uri in self.documents:
+            raise SchemaError(f"{source}: duplicate $id {uri} (also {self.sources[uri]})")
+        self.documents[uri] = schema
+        self.sources[uri] = str(source)
+        return uri
+
+    def compile(self, uri: str) -> Validator:
+        """Validator for a registered URI, optionally with a '#/json/pointer' fragment."""
+        return Validator(uri, self._compile_ref(uri))
+
+    # -- compilation ---------------------------------------------------------------
+
+    def _resolve(self, uri: str) -> Tuple[str, Any]:
+        base, fragment = urldefrag(uri)
+        if base not in self.documents:
+            raise SchemaError(f"unresolvable $ref {uri}")
+        node = self.documents[base]
+        if fragment:
+            if not fragment.startswith("/"):
+                raise SchemaError(f"unsupported $ref fragment {uri} (only JSON pointers)")
+            for token in fragment[1:].split("/"):
+                token = unquote(token).replace("~1", "/").replace("~0", "~")
+                if isinstance(node, dict) and token in node:
+                    node = node[token]
+                elif isinstance(node, list) and token.isdigit() and int(token) < len(node):
+                    node = node[int(token)]
+                else:
+                    raise SchemaError(f"unresolvable $ref {uri}")
+        return base, node
+
+    def _compile_ref(self, uri: str) -> Check:
+        """Compiled check for a schema location, shared by every '$ref' to it."""
+        base, fragment = urldefrag(uri)
+        key = f"{base}#{fragment}"
+        check = self._compiled.get(key)
+        if check is not None:
+            if key in self._in_place:
+                raise SchemaError(f"$ref loop at {uri} applies the schema to the same value forever")
+            return check
+        # A forwarding stub first, so recursive refs compile to a call into the cache.
+        target: List[Check] = []
+
+        def forward(instance: Any, path: str, errors: List[str]) -> None:
+            target[0](instance, path, errors)
+
+        mark = len(self._stubbed)
+        self._stubbed.append(key)
+        self._compiled[key] = forward
+        self._in_place.add(key)
+        try:
+            doc_base, node = self._resolve(uri)
+            compiled = self._compile(node, doc_base)
+        except SchemaError:
+            # Locations compiled during this attempt may call into its unfilled stub
+            # (recursive refs), so drop them too and let a later lookup fail cleanly.
+            for stale in self._stubbed[mark:]:
+                self._compiled.pop(stale, None)
+            del self._stubbed[mark:]
+            raise
+        finally:
+            self._in_place.discard(key)
+        target.append(compiled)
+        self._compiled[key] = compiled
+        if not mark:
+            self._stubbed.clear()  # outermost compile done: nothing left to roll back
+        return compiled
+
+    def _compile_child(self, schema: Any, base: str) -> Check:
+        """Compile a subschema applied to part of the instance (an item, member or name)."""
+        in_place, self._in_place = self._in_place, set()
+        try:
+            return self._compile(schema, base)
+        finally:
+            self._in_place = in_place
+
+    def _compile(self, schema: Any, base: str) -> Check:
+        if schema is True or schema == {}:
+            return _accept
+        if schema is False:
+            return _reject
+        if not isinstance(schema, dict):
+            raise SchemaError(f"schema must be an object or boolean, found {_short(schema)} in {base}")
+        if "$ref" in schema:
+            # draft-07: '$ref' siblings are ignored.
+            ref = schema["$ref"]
+            if not isinstance(ref, str):
+                raise SchemaError(f"$ref must be a string in {base}")
+            return self._compile_ref(urljoin(base, ref))
+
+        checks: List[Check] = []
+        for keyword, value in schema.items():
+            builder = KEYWORDS.get(keyword)
+            if builder is not None:
+                check = builder(self, value, schema, base)
+                if check is not None:
+                    checks.append(check)
+
+        if not checks:
+            return _accept
+        if len(checks) == 1:
+            return checks[0]
+
+        def check_all(instance: Any, path: str, errors: List[str]) -> None:
+            for check in checks:
+                check(instance, path, errors)
+
+        return check_all
+
+
+def _accept(instance: Any, path: str, errors: List[str]) -> None:
+    return None
+
+
+def _reject(instance: Any, path: str, errors: List[str]) -> None:
+    errors.append(f"{path or '/'}: no value is allowed here")
+
+
+def _fails(check: Check, instance: Any, path: str) -> List[str]:
+    errors: List[str] = []
+    check(instance, path, errors)
+    return errors
+
+
+# -- keywords ------------------------------------------------------------------------
+# Each builder returns a check, or None when the keyword asserts nothing by itself
+# (then/else are compiled by 'if', additionalItems by 'items').
+
+def _type(registry: SchemaRegistry, value: Any, schema: dict, base: str) -> Check:
+    names = [value] if isinstance(value, str) else value
+    if (
+        not isinstance(names, list)
+        or not names
+        or any(not isinstance(name, str) or name not in TYPE_CHECKS for name in names)
+    ):
+        raise SchemaError(f"invalid type {_short(value)} in {base}")
+    tests = [TYPE_CHECKS[name] for name in names]
+    expected = " or ".join(names)
+
+    if len(tests) == 1:
+        test = tests[0]
+
+        def check_type(instance: Any, path: str, errors: List[str]) -> None:
+            if not test(instance):
+                errors.append(f"{path or '/'}: {_short(instance)} is not of type {expected}")
+
+        return check_type
+
+    def check_types(instance: Any, path: str, errors: List[str]) -> None:
+        for test in tests:
+            if test(instance):
+                return
+        errors.append(f"{path or '/'}: {_short(instance)} is not of type {expected}")
+
+    return check_types
+
+
+def _enum(registry: SchemaRegistry, value: Any, schema: dict, base: str) -> Check:
+    if not isinstance(value, list):
+        raise SchemaError(f"enum must be an array in {base}")
+    # Hashable scalars are looked up in a set; bools are kept apart from 0/1.
+    scalars = {(item.__class__ is bool, item) for item in value if not isinstance(item, (dict, list))}
+    others = [item for item in value if isinstance(item, (dict, list))]
+
+    def check_enum(instance: Any, path: str, errors: List[str]) -> None:
+        if not isinstance(instance, (dict, list)):
+            if (instance.__class__ is bool, instance) in scalars:
+                return
+        elif any(_json_equal(instance, item) for item in others):
+            return
+        errors.append(f"{path or '/'}: {_short(instance)} is not one of {_short(value)}")
+
+    return check_enum
+
+
+def _const(registry: SchemaRegistry, value: Any, schema: dict, base: str) -> Check:
+    def check_const(instance: Any, path: str, errors: List[str]) -> None:
+        if not _json_equal(instance, value):
+            errors.append(f"{path or '/'}: {_short(instance)} is not {_short(value)}")
+
+    return check_const
+
+
+def _number_bound(keyword: str) -> Callable[..., Check]:
+    compare = {
+        "minimum": (lambda instance, bound: instance >= bound, "less than"),
+        "maximum": (lambda instance, bound: instance <= bound, "greater than"),
+        "exclusiveMinimum": (lambda instance, bound: instance > bound, "less than or equal to"),
+        "exclusiveMaximum": (lambda instance, bound: instance < bound, "greater than or equal to"),
+    }[keyword]
+
+    def build(registry: SchemaRegistry, value: Any, schema: dict, base: str) -> Check:
+        if not _is_number(value):
+            raise SchemaError(f"{keyword} must be a number in {base}")
+        within, relation = compare
+
+        def check_bound(instance: Any, path: str, errors: List[str]) -> None:
+            if _is_number(instance) and not within(instance, value):
+                errors.append(f"{path or '/'}: {instance} is {relation} {keyword} {value}")
+
+        return check_bound
+
+    return build
+
+
+def _multiple_of(registry: SchemaRegistry, value: Any, schema: dict, base: str) -> Check:
+    if not _is_number(value) or value <= 0:
+        raise SchemaError(f"multipleOf must be a positive number in {base}")
+
+    def check_multiple(instance: Any, path: str, errors: List[str]) -> None:
+        if not _is_number(instance):
+            return
+        if isinstance(instance, int) and isinstance(value, int):
+            ok = instance % value == 0
+        else:
+            quotient = instance / value
+            ok = math.isfinite(quotient) and abs(quotient - round(quotient)) < 1e-9
+        if not ok:
+            errors.append(f"{path or '/'}: {instance} is not a multiple of {value}")
+
+    return check_multiple
+
+
+def _size_bound(keyword: str, kind: type, noun: str, at_least: bool) -> Callable[..., Check]:
+    def build(registry: SchemaRegistry, value: Any, schema: dict, base: str) -> Check:
+        if not isinstance(value, int) or isinstance(value, bool) or value < 0:
+            raise SchemaError(f"{keyword} must be a non-negative integer in {base}")
+
+        def check_size(instance: Any, path: str, errors: List[str]) -> None:
+            if instance.__class__ is kind:
+                size = len(instance)
+                if (size < value) if at_least else (size > value):
+                    bound = "at least" if at_least else "at most"
+                    errors.append(f"{path or '/'}: expected {bound} {value} {noun}, found {size}")
+
+        return check_size
+
+    return build
+
+
+def _pattern(registry: SchemaRegistry, value: Any, schema: dict, base: str) -> Check:
+    try:
+        regex = re.compile(value)
+    except (re.error, TypeError) as exc:
+        raise SchemaError(f"invalid pattern {_short(value)} in {base}: {exc}") from exc
+
+    def check_pattern(instance: Any, path: str, errors: List[str]) -> None:
+        if instance.__class__ is str and not regex.search(instance):
+            errors.append(f"{path or '/'}: {_short(instance)} does not match {value!r}")
+
+    return check_pattern
+
+
+def _format(registry: SchemaRegistry, value: Any, schema: dict, base: str) -> Optional[Check]:
+    if not isinstance(value, str):
+        raise SchemaError(f"format must be a string in {base}")
+    regex = FORMAT_PATTERNS.get(value)
+    if regex is None:
+        return None
+
+    def check_format(instance: Any, path: str, errors: List[str]) -> None:
+        if instance.__class__ is str and not regex.match(instance):
+            errors.append(f"{path or '/'}: {_short(instance)} is not a valid {value}")
+
+    return check_format
+
+
+def _items(registry: SchemaRegistry, value: Any, schema: dict, base: str) -> Check:
+    if isinstance(value, list):
+        positional = [registry._compile_child(item, base) for item in value]
+        additional = schema.get("additionalItems", True)
+        extra = registry._compile_child(additional, base)
+
+        def check_tuple(instance: Any, path: str, errors: List[str]) -> None:
+            if instance.__class__ is not list:
+                return
+            for index, item in enumerate(instance):
+                check = positional[index] if index < len(positional) else extra
+                check(item, f"{path}/{index}", errors)
+
+        return check_tuple
+
+    each = registry._compile_child(value, base)
+
+    def check_items(instance: Any, path: str, errors: List[str]) -> None:
+        if instance.__class__ is not list:
+            return
+        for index, item in enumerate(instance):
+            each(item, f"{path}/{index}", errors)
+
+    return check_items
+
+
+def _unique_items(registry: SchemaRegistry, value: Any, schema: dict, base: str) -> Optional[Check]:
+    if not isinstance(value, bool):
+        raise SchemaError(f"uniqueItems must be a boolean in {base}")
+    if value is not True:
+        return None
+
+    def check_unique(instance: Any, path: str, errors: List[str]) -> None:
+        if instance.__class__ is not list:
+            return
+        for index, item in enumerate(instance):
+            if any(_json_equal(item, earlier) for earlier in instance[:index]):
+                errors.append(f"{path or '/'}: items are not unique ({_short(item)} repeats)")
+                return
+
+    return check_unique
+
+
+def _contains(registry: SchemaRegistry, value: Any, schema: dict, base: str) -> Check:
+    inner = registry._compile_child(value, base)
+
+    def check_contains(instance: Any, path: str, errors: List[str]) -> None:
+        if instance.__class__ is list and all(_fails(inner, item, path) for item in instance):
+            errors.append(f"{path or '/'}: no item matches 'contains'")
+
+    return check_contains
+
+
+def _required(registry: SchemaRegistry, value: Any, schema: dict, base: str) -> Check:
+    if not isinstance(value, list) or not all(isinstance(name, str) for name in value):
+        raise SchemaError(f"required must be an array of strings in {base}")
+    names = list(dict.fromkeys(value))
+
+    def check_required(instance: Any, path: str, errors: List[str]) -> None:
+        if instance.__class__ is not dict:
+            return
+        for name in names:
+            if name not in instance:
+                errors.append(f"{path or '/'}: missing required property '{name}'")
+
+    return check_required
+
+
+def _properties(registry: SchemaRegistry, value: Any, schema: dict, base: str) -> Check:
+    """properties, patternProperties and additionalProperties compile into one check."""
+    if not isinstance(value, dict):
+        raise SchemaError(f"properties must be an object in {base}")
+    return _object_members(registry, schema, base)
+
+
+def _pattern_properties(registry: SchemaRegistry, value: Any, schema: dict, base: str) -> Optional[Check]:
+    return None if "properties" in schema else _object_members(registry, schema, base)
+
+
+def _additional_properties(registry: SchemaRegistry, value: Any, schema: dict, base: str) -> Optional[Check]:
+    if "properties" in schema or "patternProperties" in schema:
+        return None
+    return _object_members(registry, schema, base)
+
+
+def _object_members(registry: SchemaRegistry, schema: dict, base: str) -> Check:
+    for keyword in ("properties", "patternProperties"):
+        if not isinstance(schema.get(keyword, {}), dict):
+            raise SchemaError(f"{keyword} must be an object in {base}")
+    named = {name: registry._compile_child(sub, base) for name, sub in (schema.get("properties") or {}).items()}
+    try:
+        patterns = [
+            (re.compile(pattern), registry._compile_child(sub, base))
+            for pattern, sub in (schema.get("patternProperties") or {}).items()
+        ]
+    except re.error as exc:
+        raise SchemaError(f"invalid patternProperties in {base}: {exc}") from exc
+    additional = schema.get("additionalProperties", True)
+    forbid_additional = additional is False
+    extra = None if additional is True or forbid_additional else registry._compile_child(additional, base)
+
+    def check_members(instance: Any, path: str, errors: List[str]) -> None:
+        if instance.__class__ is not dict:
+            return
+        for key, item in instance.items():
+            check = named.get(key)
+            matched = check is not None
+            if matched:
+                check(item, f"{path}/{_escape(key)}", errors)
+            for regex, pattern_check in patterns:
+                if regex.search(key):
+                    matched = True
+                    pattern_check(item, f"{path}/{_escape(key)}", errors)
+            if not matched:
+                if forbid_additional:
+                    errors.append(f"{path or '/'}: additional property '{key}' is not allowed")
+                elif extra is not None:
+                    extra(item, f"{path}/{_escape(key)}", errors)
+
+    return check_members
+
+
+def _property_names(registry: SchemaRegistry, value: Any, schema: dict, base: str) -> Check:
+    inner = registry._compile_child(value, base)
+
+    def check_names(instance: Any, path: str, errors: List[str]) -> None:
+        if instance.__class__ is dict:
+            for key in instance:
+                for error in _fails(inner, key, path):
+                    errors.append(f"{error} (property name)")
+
+    return check_names
+
+
+def _dependencies(registry: SchemaRegistry, value: Any, schema: dict, base: str) -> Check:
+    if not isinstance(value, dict):
+        raise SchemaError(f"dependencies must be an object in {base}")
+    for dependency in value.values():
+        if isinstance(dependency, list) and not all(isinstance(other, str) for other in dependency):
+            raise SchemaError(f"dependencies arrays must hold strings in {base}")
+    rules = [
+        (name, list(dependency) if isinstance(dependency, list) else registry._compile(dependency, base))
+        for name, dependency in value.items()
+    ]
+
+    def check_dependencies(instance: Any, path: str, errors: List[str]) -> None:
+        if instance.__class__ is not dict:
+            return
+        for name, dependency in rules:
+            if name not in instance:
+                continue
+            if isinstance(dependency, list):
+                for other in dependency:
+                    if other not in instance:
+                        errors.append(f"{path or '/'}: property '{other}' is required by '{name}'")
+            else:
+                dependency(instance, path, errors)
+
+    return check_dependencies
+
+
+def _subschemas(keyword: str, registry: SchemaRegistry, value: Any, base: str) -> List[Check]:
+    if not isinstance(value, list) or not value:
+        raise SchemaError(f"{keyword} must be a non-empty array in {base}")
+    return [registry._compile(sub, base) for sub in value]
+
+
+def _all_of(registry: SchemaRegistry, value: Any, schema: dict, base: str) -> Check:
+    checks = _subschemas("allOf", registry, value, base)
+
+    def check_all_of(instance: Any, path: str, errors: List[str]) -> None:
+        for check in checks:
+            check(instance, path, errors)
+
+    return check_all_of
+
+
+def _any_of(registry: SchemaRegistry, value: Any, schema: dict, base: str) -> Check:
+    checks = _subschemas("anyOf", registry, value, base)
+
+    def check_any_of(instance: Any, path: str, errors: List[str]) -> None:
+        for check in checks:
+            if not _fails(check, instance, path):
+                return
+        errors.append(f"{path or '/'}: {_short(instance)} matches none of the anyOf schemas")
+
+    return check_any_of
+
+
+def _one_of(registry: SchemaRegistry, value: Any, schema: dict, base: str) -> Check:
+    checks = _subschemas("oneOf", registry, value, base)
+
+    def check_one_of(instance: Any, path: str, errors: List[str]) -> None:
+        matches = sum(1 for check in checks if not _fails(check, instance, path))
+        if matches != 1:
+            errors.append(f"{path or '/'}: {_short(instance)} matches {matches} of the oneOf schemas, expected 1")
+
+    return check_one_of
+
+
+def _not(registry: SchemaRegistry, value: Any, schema: dict, base: str) -> Check:
+    inner = registry._compile(value, base)
+
+    def check_not(instance: Any, path: str, errors: List[str]) -> None:
+        if not _fails(inner, instance, path):
+            errors.append(f"{path or '/'}: {_short(instance)} must not match the 'not' schema")
+
+    return check_not
+
+
+def _if(registry: SchemaRegistry, value: Any, schema: dict, base: str) -> Optional[Check]:
+    if "then" not in schema and "else" not in schema:
+        return None
+    condition = registry._compile(value, base)
+    then = registry._compile(schema.get("then", True), base)
+    otherwise = registry._compile(schema.get("else", True), base)
+
+    def check_if(instance: Any, path: str, errors: List[str]) -> None:
+        branch = otherwise if _fails(condition, instance, path) else then
+        branch(instance, path, errors)
+
+    return check_if
+
+
+KEYWORDS: Dict[str, Callable[..., Optional[Check]]] = {
+    "type": _type,
+    "enum": _enum,
+    "const": _const,
+    "minimum": _number_bound("minimum"),
+    "maximum": _number_bound("maximum"),
+    "exclusiveMinimum": _number_bound("exclusiveMinimum"),
+    "exclusiveMaximum": _number_bound("exclusiveMaximum"),
+    "multipleOf": _multiple_of,
+    "minLength": _size_bound("minLength", str, "characters", True),
+    "maxLength": _size_bound("maxLength", str, "characters", False),
+    "pattern": _pattern,
+    "format": _format,
+    "items": _items,
+    "minItems": _size_bound("minItems", list, "items", True),
+    "maxItems": _size_bound("maxItems", list, "items", False),
+    "uniqueItems": _unique_items,
+    "contains": _contains,
+    "required": _required,
+    "minProperties": _size_bound("minProperties", dict, "properties", True),
+    "maxProperties": _size_bound("maxProperties", dict, "properties", False),
+    "properties": _properties,
+    "patternProperties": _pattern_properties,
+    "additionalProperties": _additional_properties,
+    "propertyNames": _property_names,
+    "dependencies": _dependencies,
+    "allOf": _all_of,
+    "anyOf": _any_of,
+    "oneOf": _one_of,
+    "not": _not,
+    "if": _if,
+}
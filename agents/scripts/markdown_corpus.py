@@ -0,0 +1,320 @@
+"""
+Shared parsed-markdown corpus for planning validators.
+
+Planning validators (trackers, stories, story index, architecture, security
+audit) all scan the same planning-mds markdown. This module reads each file
+once, parses it into headings, tables and bold header fields, and persists the
+parse to an on-disk cache so later validator runs skip both the read and the
+parse for unchanged files.
+
+Cache entries are keyed by absolute path and validated by (mtime, size); when
+those change the file is re-read and its sha256 compared before re-parsing.
+The cache lives at .cache/markdown-corpus/corpus.pickle under the repository
+root. Set MARKDOWN_CORPUS_CACHE to another file path to relocate it, or to
+"off" to disable it.
+
+Usage (from a validator script):
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "scripts"))
+    from markdown_corpus import shared_corpus
+
+    document = shared_corpus().document(path)
+    document.text, document.headings, document.tables, document.fields
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import os
+import pickle
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+CORPUS_FORMAT_VERSION = 2
+REPO_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_CACHE_PATH = REPO_ROOT / ".cache" / "markdown-corpus" / "corpus.pickle"
+CACHE_ENV_VAR = "MARKDOWN_CORPUS_CACHE"
+CACHE_DISABLED_VALUES = {"", "0", "off", "false", "no"}
+
+HEADING_RE = re.compile(r"^(#+)(.*)$", re.MULTILINE)
+FIELD_MARKER_RE = re.compile(r"\*\*([^*\n]+?):\*\*")
+FIELD_VALUE_RE = re.compile(r"\s*([^\n]+)")
+
+
+@dataclass
+class Heading:
+    level: int
+    title: str
+    start: int  # offset of the heading line
+    end: int  # offset just past the heading text (the newline, or end of text)
+    spaced: bool  # whitespace (or end of line) follows the '#' run, as r"^#+\s" requires
+
+
+@dataclass
+class Table:
+    start: int  # offset of the first table line
+    lines: List[List[str]]  # stripped cells per '|' line, header and separator included
+
+
+@dataclass
+class MarkdownDocument:
+    text: str
+    headings: List[Heading] = field(default_factory=list)
+    tables: List[Table] = field(default_factory=list)
+    # '**Name:** value' markers: first value per name, None when no value follows.
+    fields: Dict[str, Optional[str]] = field(default_factory=dict)
+    # Lower-cased heading title -> positions in headings, in document order.
+    heading_index: Dict[str, List[int]] = field(default_factory=dict)
+
+    def field(self, name: str) -> Optional[str]:
+        return self.fields.get(name)
+
+    def section_span(
+        self,
+        title: str,
+        min_level: int = 2,
+        max_level: Optional[int] = None,
+        ignore_case: bool = False,
+    ) -> Optional[Tuple[int, int]]:
+        """
+        Span of the body under the first heading titled title.
+
+        Only spaced headings with min_level <= level <= max_level are
+        considered, and the body runs to the next such heading. This is the
+        index-based equivalent of searching r"^#{n}\s+<title>\s*$" and
+        slicing up to the next r"^#{n}\s+" match, with the same start offset.
+        """
+        top = max_level if max_level is not None else float("inf")
+        candidates = self.heading_index.get(title.lower(), [])
+        for position in candidates:
+            heading = self.headings[position]
+            if not heading.spaced or not min_level <= heading.level <= top:
+                continue
+            if not ignore_case and heading.title != title:
+                continue
+            end = len(self.text)
+            for following in self.headings[position + 1:]:
+                if following.spaced and min_level <= following.level <= top:
+                    end = following.start
+                    break
+            return self._body_start(heading), end
+        return None
+
+    def _body_start(self, heading: Heading) -> int:
+        # r"\s*$" after the title consumes blank lines but must stop at a line end.
+        text = self.text
+        limit = heading.end
+        while limit < len(text) and text[limit].isspace():
+            limit += 1
+        if limit == len(text):
+            return limit
+        return text.rfind("\n", heading.end, limit)
+
+    def section(self, title: str, **options) -> str:
+        """Text of the section titled title ("" when absent); see section_span()."""
+        span = self.section_span(title, **options)
+        return self.text[span[0]:span[1]] if span else ""
+
+    def table_rows(self, span: Optional[Tuple[int, int]]) -> List[Dict[str, str]]:
+        """
+        Rows of the '|' table lines within span, keyed by header cell.
+
+        All '|' lines in the span are read as one table: the first is the
+        header, the second the separator, and rows whose cell count differs
+        from the header are dropped.
+        """
+        if span is None:
+            return []
+        start, end = span
+        lines = [line for table in self.tables if start <= table.start < end for line in table.lines]
+        if len(lines) < 3:
+            return []
+        headers = lines[0]
+        return [dict(zip(headers, cells)) for cells in lines[2:] if len(cells) == len(headers)]
+
+
+@dataclass
+class CacheEntry:
+    mtime_ns: int
+    size: int
+    sha256: str
+    document: MarkdownDocument
+
+
+def decode_text(data: bytes, errors: str = "strict") -> str:
+    """Decode like Path.read_text(): UTF-8 with universal newlines."""
+    return data.decode("utf-8", errors=errors).replace("\r\n", "\n").replace("\r", "\n")
+
+
+def parse_markdown(text: str) -> MarkdownDocument:
+    """Parse markdown text into headings, '|' tables and bold header fields."""
+    headings = [
+        Heading(
+            level=len(match.group(1)),
+            title=match.group(2).strip(),
+            start=match.start(),
+            end=match.end(),
+            spaced=not match.group(2) or match.group(2)[0].isspace(),
+        )
+        for match in HEADING_RE.finditer(text)
+    ]
+    heading_index: Dict[str, List[int]] = {}
+    for position, heading in enumerate(headings):
+        heading_index.setdefault(heading.title.lower(), []).append(position)
+
+    tables: List[Table] = []
+    current: Optional[Table] = None
+    offset = 0
+    for line in text.splitlines(keepends=True):
+        stripped = line.strip()
+        if stripped.startswith("|"):
+            if current is None:
+                current = Table(offset, [])
+                tables.append(current)
+            current.lines.append([cell.strip() for cell in stripped.strip("|").split("|")])
+        else:
+            current = None
+        offset += len(line)
+
+    fields: Dict[str, Optional[str]] = {}
+    for match in FIELD_MARKER_RE.finditer(text):
+        name = match.group(1)
+        if fields.get(name) is not None:
+            continue
+        value = FIELD_VALUE_RE.match(text, match.end())
+        fields[name] = value.group(1).strip() if value else None
+
+    return MarkdownDocument(
+        text=text,
+        headings=headings,
+        tables=tables,
+        fields=fields,
+        heading_index=heading_index,
+    )
+
+
+def default_cache_path() -> Optional[Path]:
+    configured = os.environ.get(CACHE_ENV_VAR)
+    if configured is None:
+        return DEFAULT_CACHE_PATH
+    if configured.strip().lower() in CACHE_DISABLED_VALUES:
+        return None
+    return Path(configured)
+
+
+class MarkdownCorpus:
+    """Parsed markdown documents, memoized in memory and persisted to disk."""
+
+    def __init__(self, cache_path: Optional[Path] = None):
+        self.cache_path = cache_path
+        self.entries: Dict[str, CacheEntry] = {}
+        self.updated: Set[str] = set()
+        self.loaded = False
+        self.reads = 0
+        self.hits = 0
+
+    def _load_entries(self) -> Dict[str, CacheEntry]:
+        if self.cache_path is None or not self.cache_path.is_file():
+            return {}
+        try:
+            with self.cache_path.open("rb") as handle:
+                payload = pickle.load(handle)
+        except Exception:
+            return {}
+        if not isinstance(payload, dict) or payload.get("format") != CORPUS_FORMAT_VERSION:
+            return {}
+        return payload.get("entries", {})
+
+    def document(self, path: Path, errors: str = "strict") -> MarkdownDocument:
+        """
+        Return the parsed document for path.
+
+        Raises OSError when the file cannot be read and UnicodeDecodeError when it
+        is not valid UTF-8 (unless errors="ignore" or similar is requested, in
+        which case the lossy decode is parsed but never cached).
+        """
+        if not self.loaded:
+            self.entries.update(self._load_entries())
+            self.loaded = True
+
+        key = str(Path(path).resolve())
+        stat = os.stat(key)
+        entry = self.entries.get(key)
+        if entry is not None and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+            self.hits += 1
+            return entry.document
+
+        data = Path(key).read_bytes()
+        self.reads += 1
+        digest = hashlib.sha256(data).hexdigest()
+        if entry is not None and entry.sha256 == digest:
+            document = entry.document
+        else:
+            try:
+                text = decode_text(data)
+            except UnicodeDecodeError:
+                if errors == "strict":
+                    raise
+                return parse_markdown(decode_text(data, errors=errors))
+            document = parse_markdown(text)
+
+        self.entries[key] = CacheEntry(stat.st_mtime_ns, len(data), digest, document)
+        if self.cache_path is not None:
+            self.updated.add(key)
+        return document
+
+    def text(self, path: Path, errors: str = "strict") -> str:
+        return self.document(path, errors=errors).text
+
+    def take_updates(self) -> Dict[str, CacheEntry]:
+        """
+        Return entries parsed since the last call (worker -> parent hand-off).
+
+        Only the record of updates is cleared; the entries stay in the corpus.
+        """
+        updates = {key: self.entries[key] for key in self.updated}
+        self.updated.clear()
+        return updates
+
+    def merge(self, updates: Dict[str, CacheEntry]) -> None:
+        """Adopt entries parsed elsewhere, e.g. returned by take_updates() in a worker."""
+        self.entries.update(updates)
+        self.updated.update(updates)
+
+    def save(self) -> None:
+        """Merge updated entries into the on-disk cache (best effort)."""
+        if self.cache_path is None or not self.updated:
+            return
+        # Re-read so entries written by concurrently running validators survive.
+        merged = self._load_entries()
+        merged.update({key: self.entries[key] for key in self.updated})
+        merged = {key: entry for key, entry in merged.items() if os.path.exists(key)}
+        payload = {"format": CORPUS_FORMAT_VERSION, "entries": merged}
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.cache_path.with_name(f"{self.cache_path.name}.{os.getpid()}.tmp")
+            with temp_path.open("wb") as handle:
+                pickle.dump(payload, handle, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, self.cache_path)
+        except OSError:
+            return
+        self.updated.clear()
+
+
+_SHARED_CORPUS: Optional[MarkdownCorpus] = None
+
+
+def shared_corpus() -> MarkdownCorpus:
+    """
+    Process-wide corpus, saved at interpreter exit.
+
+    Validators run in-process by the lifecycle gate runner share this instance,
+    so each file is read at most once per run.
+    """
+    global _SHARED_CORPUS
+    if _SHARED_CORPUS is None:
+        _SHARED_CORPUS = MarkdownCorpus(default_cache_path())
+        atexit.register(_SHARED_CORPUS.save)
+    return _SHARED_CORPUS
@@ -0,0 +1,336 @@
+"""
+Shared, cached OpenAPI spec loader for the API contract gates.
+
+The structural contract gate (agents/architect/scripts/validate-api-contract.py)
+and the solution contract gate both parse the same multi-thousand-line OpenAPI
+YAML, and the YAML parse dominates both. load_spec() parses with libyaml's
+CSafeLoader when PyYAML ships it (SafeLoader otherwise), pickles the parsed
+spec to an on-disk cache keyed by the file's sha256, and memoizes it per
+process: gates run in-process by the lifecycle gate runner get the very same
+object. Callers must treat the returned spec as read-only.
+
+Cache files live in .cache/openapi-spec/ under the repository root, one per
+spec path. Set OPENAPI_SPEC_CACHE to another directory to relocate them, or to
+"off" to disable the disk cache.
+
+spec_graph() returns a per-spec '$ref' table: each local ref is resolved by
+the gates' usual walk from the root the first time it is seen and by a dict
+lookup afterwards, so a spec costs one walk per distinct ref rather than one
+per '$ref' occurrence, and nothing is paid up front. Reference cycles
+(recursive schemas, '$ref' aliases that loop) are found on demand. The graph
+is memoized per spec object, so gates sharing a spec share its table.
+
+Usage (from a gate script):
+    sys.path.insert(0, str(<repo root> / "agents" / "scripts"))
+    from openapi_spec import load_spec, spec_graph
+
+    spec = load_spec(path)
+    graph = spec_graph(spec)
+    graph.resolve("#/components/responses/NotFound")
+    for path, method, operation in graph.operations():
+        graph.deref(operation["responses"]["404"])["content"]
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import os
+import pickle
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+import yaml
+
+SPEC_CACHE_VERSION = 1
+REPO_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_CACHE_DIR = REPO_ROOT / ".cache" / "openapi-spec"
+CACHE_ENV_VAR = "OPENAPI_SPEC_CACHE"
+CACHE_DISABLED_VALUES = {"", "0", "off", "false", "no"}
+
+# libyaml's C loader accepts the same documents as yaml.safe_load, much faster.
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+HTTP_METHODS = ("get", "put", "post", "delete", "options", "head", "patch", "trace")
+
+# (absolute spec path, loader name) -> (mtime_ns, size, sha256, parsed spec).
+_LOADED: Dict[Tuple[str, str], Tuple[int, int, str, Any]] = {}
+# id(spec) -> (spec, graph); the spec is held so its id is not reused.
+_GRAPHS: Dict[int, Tuple[Any, "SpecGraph"]] = {}
+_MISSING = object()
+
+
+def default_cache_dir() -> Optional[Path]:
+    configured = os.environ.get(CACHE_ENV_VAR)
+    if configured is None:
+        return DEFAULT_CACHE_DIR
+    if configured.strip().lower() in CACHE_DISABLED_VALUES:
+        return None
+    return Path(configured)
+
+
+def parse_spec(data: bytes, name: str, loader: Any = YAML_LOADER) -> Any:
+    """Parse spec bytes; YAML errors name the file, as when loading from an open file."""
+    stream = io.StringIO(data.decode("utf-8"))
+    stream.name = name
+    return yaml.load(stream, Loader=loader)
+
+
+def _cache_file(cache_dir: Path, key: str) -> Path:
+    return cache_dir / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()[:16]}.pickle"
+
+
+def _read_cache(cache_path: Path, digest: str, loader: Any) -> Tuple[bool, Any]:
+    try:
+        payload = pickle.loads(cache_path.read_bytes())
+    except Exception:
+        return False, None
+    if (
+        isinstance(payload, dict)
+        and payload.get("version") == SPEC_CACHE_VERSION
+        and payload.get("loader") == loader.__name__
+        and payload.get("sha256") == digest
+    ):
+        return True, payload["spec"]
+    return False, None
+
+
+def _write_cache(cache_path: Path, digest: str, spec: Any, loader: Any) -> None:
+    payload = {"version": SPEC_CACHE_VERSION, "loader": loader.__name__, "sha256": digest, "spec": spec}
+    temp_path = cache_path.with_name(f".{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path.write_bytes(pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL))
+        os.replace(temp_path, cache_path)
+    except OSError:
+        pass
+    finally:
+        if temp_path.exists():
+            temp_path.unlink()
+
+
+def load_spec(
+    path: Union[str, Path],
+    cache_dir: Optional[Path] = None,
+    use_cache: bool = True,
+    loader: Any = YAML_LOADER,
+) -> Any:
+    """
+    Return the parsed spec at path.
+
+    loader is a PyYAML loader class; specs parsed by different loaders are
+    memoized and cached separately (by the loader's class name). In-process hits are validated by (mtime, size), then by sha256; disk cache
+    hits by sha256. Raises OSError when the file cannot be read,
+    UnicodeDecodeError when it is not UTF-8 and yaml.YAMLError when it does
+    not parse.
+    """
+    stat = os.stat(path)
+    key = (os.path.abspath(path), loader.__name__)
+    loaded = _LOADED.get(key)
+    if loaded is not None and loaded[:2] == (stat.st_mtime_ns, stat.st_size):
+        return loaded[3]
+
+    data = Path(path).read_bytes()
+    digest = hashlib.sha256(data).hexdigest()
+    if loaded is not None and loaded[2] == digest:
+        spec = loaded[3]
+    else:
+        if cache_dir is None and use_cache:
+            cache_dir = default_cache_dir()
+        cache_path = _cache_file(cache_dir, "\0".join(key)) if use_cache and cache_dir is not None else None
+        found, spec = _read_cache(cache_path, digest, loader) if cache_path is not None else (False, None)
+        if not found:
+            spec = parse_spec(data, str(path), loader)
+            if cache_path is not None:
+                _write_cache(cache_path, digest, spec, loader)
+
+    _LOADED[key] = (stat.st_mtime_ns, len(data), digest, spec)
+    return spec
+
+
+def clear_memo() -> None:
+    """Forget in-process specs and their graphs (the disk cache is kept)."""
+    _LOADED.clear()
+    _GRAPHS.clear()
+
+
+def collect_local_refs(root: Any, stop_at_refs: bool = False) -> List[str]:
+    """
+    Distinct local '$ref' strings under root.
+
+    With stop_at_refs, the walk does not descend into an object holding a
+    '$ref' (its siblings are ignored by OpenAPI 3.0 resolution anyway).
+    """
+    refs: Dict[str, None] = {}
+    # Only containers are pushed: the spec is mostly scalars, and skipping them
+    # halves the walk.
+    stack = [root] if root.__class__ in (dict, list) else []
+    while stack:
+        node = stack.pop()
+        if node.__class__ is dict:
+            ref = node.get("$ref")
+            if ref.__class__ is str and ref.startswith("#/"):
+                refs[ref] = None
+                if stop_at_refs:
+                    continue
+            values = node.values()
+        else:
+            values = node
+        for value in values:
+            if value.__class__ is dict or value.__class__ is list:
+                stack.append(value)
+    return list(refs)
+
+
+class SpecGraph:
+    """
+    Memoized '$ref' table for one parsed spec.
+
+    refs maps each local '$ref' resolved so far to its target node (None when
+    it does not resolve). Resolution follows the gates' existing rule: '#/a/b'
+    is a chain of mapping keys from the root. dependencies (refs directly
+    reachable from a ref's target) are filled by closure() and cycles, and
+    cycles lists each set of refs that reach one another (a self-referencing
+    schema is a one-ref cycle); both walk the spec only when asked for.
+    """
+
+    def __init__(self, spec: Any):
+        self.spec = spec
+        self.refs: Dict[str, Any] = {}
+        self.dependencies: Dict[str, Tuple[str, ...]] = {}
+        self._targets: Dict[str, Any] = {}
+        self._cycles: Optional[List[Tuple[str, ...]]] = None
+
+    def _walk(self, ref: str) -> Any:
+        node = self.spec
+        for token in ref[2:].split("/"):
+            if not isinstance(node, dict) or token not in node:
+                return None
+            node = node[token]
+        return node
+
+    def resolve(self, ref: Any) -> Any:
+        """Target of a local ref (None when it is not a local ref or does not resolve)."""
+        target = self.refs.get(ref, _MISSING) if ref.__class__ is str else None
+        if target is _MISSING:
+            if not ref.startswith("#/"):
+                return None
+            target = self.refs[ref] = self._walk(ref)
+        return target
+
+    def deref(self, node: Any) -> Any:
+        """
+        Follow '$ref' objects from node to the first non-reference node.
+
+        Returns None for a ref that does not resolve or for an alias loop
+        ('$ref' objects pointing back at one another).
+        """
+        if node.__class__ is not dict:
+            return node
+        ref = node.get("$ref")
+        if ref.__class__ is not str:
+            return node
+        target = self._targets.get(ref, _MISSING)
+        if target is _MISSING:
+            seen = set()
+            target = node
+            while isinstance(target, dict) and isinstance(target.get("$ref"), str):
+                if target["$ref"] in seen:
+                    target = None
+                    break
+                seen.add(target["$ref"])
+                target = self.resolve(target["$ref"])
+            self._targets[ref] = target
+        return target
+
+    def operations(self) -> Iterator[Tuple[str, str, Dict[str, Any]]]:
+        """Yield (path, method, operation) for every operation object, with path item refs followed."""
+        paths = self.spec.get("paths") if isinstance(self.spec, dict) else None
+        if not isinstance(paths, dict):
+            return
+        for path, path_item in paths.items():
+            path_item = self.deref(path_item)
+            if not isinstance(path_item, dict):
+                continue
+            for method, operation in path_item.items():
+                if method in HTTP_METHODS and isinstance(operation, dict):
+                    yield path, method, operation
+
+    def _dependencies(self, ref: str) -> Tuple[str, ...]:
+        dependencies = self.dependencies.get(ref)
+        if dependencies is None:
+            dependencies = self.dependencies[ref] = tuple(
+                collect_local_refs(self.resolve(ref), stop_at_refs=True)
+            )
+        return dependencies
+
+    def closure(self, refs: Sequence[str]) -> List[str]:
+        """refs plus every ref reachable from their targets, sorted."""
+        seen = set()
+        pending = list(refs)
+        while pending:
+            ref = pending.pop()
+            if ref in seen:
+                continue
+            seen.add(ref)
+            pending.extend(self._dependencies(ref))
+        return sorted(seen)
+
+    @property
+    def cycles(self) -> List[Tuple[str, ...]]:
+        """Strongly connected ref groups that loop, over every local ref in the spec."""
+        if self._cycles is None:
+            self._cycles = self._find_cycles(self.closure(collect_local_refs(self.spec)))
+        return self._cycles
+
+    def _find_cycles(self, refs: Sequence[str]) -> List[Tuple[str, ...]]:
+        """Tarjan's strongly connected components, iterative."""
+        index: Dict[str, int] = {}
+        lowlink: Dict[str, int] = {}
+        on_stack = set()
+        stack: List[str] = []
+        cycles: List[Tuple[str, ...]] = []
+        for root in refs:
+            if root in index:
+                continue
+            work = [(root, 0)]
+            while work:
+                ref, child = work.pop()
+                if child == 0:
+                    index[ref] = lowlink[ref] = len(index)
+                    stack.append(ref)
+                    on_stack.add(ref)
+                dependencies = self._dependencies(ref)
+                if child < len(dependencies):
+                    work.append((ref, child + 1))
+                    dependency = dependencies[child]
+                    if dependency not in index:
+                        work.append((dependency, 0))
+                    elif dependency in on_stack:
+                        lowlink[ref] = min(lowlink[ref], index[dependency])
+                    continue
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[ref])
+                if lowlink[ref] == index[ref]:
+                    group = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        group.append(member)
+                        if member == ref:
+                            break
+                    if len(group) > 1 or ref in self._dependencies(ref):
+                        cycles.append(tuple(sorted(group)))
+        return sorted(cycles)
+
+
+def spec_graph(spec: Any) -> SpecGraph:
+    """The '$ref' table for a loaded spec, one per spec object."""
+    entry = _GRAPHS.get(id(spec))
+    if entry is not None and entry[0] is spec:
+        return entry[1]
+    graph = SpecGraph(spec)
+    _GRAPHS[id(spec)] = (spec, graph)
+    return graph
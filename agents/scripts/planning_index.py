@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+"""
+Planning Index Builder
+
+Maintains a local SQLite index of planning tracker facts under a features
+directory so validators can answer cross-reference questions with indexed SQL
+instead of re-deriving them from markdown on every run:
+
+- every path in the features tree (for link/target existence checks)
+- REGISTRY.md feature rows, ROADMAP.md rows, STORY-INDEX.md total and links
+- story files (strict F{NNNN}-S{NNNN}-*.md names) and their Story ID headers
+- STATUS.md overall status, required signoff roles, story checklist rows and
+  story signoff provenance rows
+
+The index is refreshed incrementally: each markdown file is re-ingested only
+when its mtime or size changes, and rows from deleted files are dropped.
+Databases live under .cache/planning-index/ (one per features directory).
+
+Usage:
+    python3 agents/scripts/planning_index.py
+    python3 agents/scripts/planning_index.py --features-dir planning-mds/features --db /tmp/planning.sqlite3
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import os
+import re
+import sqlite3
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from markdown_corpus import MarkdownDocument, decode_text, shared_corpus  # noqa: E402
+from story_header import parse_story_header  # noqa: E402
+
+SCHEMA_VERSION = 4
+REPO_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_DB_DIR = REPO_ROOT / ".cache" / "planning-index"
+
+STRICT_STORY_FILE_RE = re.compile(r"^F\d{4}-S\d{4}-.+\.md$")
+STORY_ID_RE = re.compile(r"F\d{4}-S\d{4}")
+OVERALL_STATUS_RE = re.compile(r"\*\*Overall Status:\*\*\s*(.+)")
+TOTAL_STORIES_RE = re.compile(r"\*\*Total Stories:\*\*\s*(\d+)")
+STORY_INDEX_LINK_RE = re.compile(r"\[(F\d{4}-S\d{4})\]\(\./([^)]+)\)")
+
+TRACKER_FILENAMES = {"REGISTRY.md", "ROADMAP.md", "STORY-INDEX.md", "TRACKER-GOVERNANCE.md"}
+REGISTRY_SECTIONS = ["Active Features", "Planned (Reserved IDs)", "Archived Features"]
+ROADMAP_SECTIONS = ["Now", "Next", "Later", "Completed"]
+# STATUS.md sections: first heading variant with a non-empty body wins.
+STATUS_SECTIONS = {
+    "required": ["Required Signoff Roles", "Required Signoff Roles (Set in Planning)"],
+    "stories": ["Story Checklist", "Stories"],
+    "provenance": ["Story Signoff Provenance", "Story Sign-off Provenance"],
+}
+STATUS_COLUMNS = ["Story", "Role", "Required", "Verdict", "Reviewer", "Evidence", "Date"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS paths (path TEXT PRIMARY KEY, is_file INTEGER NOT NULL) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS sources (
+    source TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    error TEXT
+);
+CREATE TABLE IF NOT EXISTS registry_rows (
+    source TEXT NOT NULL, section TEXT NOT NULL, row_order INTEGER NOT NULL,
+    feature_id TEXT NOT NULL, name TEXT NOT NULL, status TEXT NOT NULL, phase TEXT NOT NULL, folder TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS roadmap_rows (
+    source TEXT NOT NULL, section TEXT NOT NULL, row_order INTEGER NOT NULL,
+    feature TEXT NOT NULL, feature_id TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS stories (
+    source TEXT PRIMARY KEY, has_header INTEGER NOT NULL, story_id TEXT
+);
+CREATE TABLE IF NOT EXISTS story_index (source TEXT PRIMARY KEY, total INTEGER);
+CREATE TABLE IF NOT EXISTS story_index_links (
+    source TEXT NOT NULL, row_order INTEGER NOT NULL, story_id TEXT NOT NULL,
+    rel_path TEXT NOT NULL, target TEXT
+);
+CREATE TABLE IF NOT EXISTS status_docs (
+    source TEXT PRIMARY KEY, overall_status TEXT,
+    required_found INTEGER NOT NULL, stories_found INTEGER NOT NULL, provenance_found INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS status_rows (
+    source TEXT NOT NULL, section TEXT NOT NULL, row_order INTEGER NOT NULL, story_id TEXT,
+    story TEXT NOT NULL, role TEXT NOT NULL, required TEXT NOT NULL, verdict TEXT NOT NULL,
+    reviewer TEXT NOT NULL, evidence TEXT NOT NULL, date TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS registry_rows_source ON registry_rows (source, section, row_order);
+CREATE INDEX IF NOT EXISTS roadmap_rows_source ON roadmap_rows (source, row_order);
+CREATE INDEX IF NOT EXISTS stories_story_id ON stories (story_id);
+CREATE INDEX IF NOT EXISTS story_index_links_source ON story_index_links (source, row_order);
+CREATE INDEX IF NOT EXISTS story_index_links_story_id ON story_index_links (story_id);
+CREATE INDEX IF NOT EXISTS status_rows_source ON status_rows (source, section, row_order);
+CREATE INDEX IF NOT EXISTS status_rows_story ON status_rows (source, section, story_id);
+"""
+ROW_TABLES = [
+    "registry_rows", "roadmap_rows", "stories", "story_index",
+    "story_index_links", "status_docs", "status_rows",
+]
+
+
+@dataclass
+class RefreshStats:
+    paths: int = 0
+    sources: int = 0
+    ingested: int = 0
+    removed: int = 0
+    seconds: float = 0.0
+
+
+@dataclass
+class Source:
+    source: str
+    kind: str
+    size: int
+    error: Optional[str]
+
+
+def default_db_path(features_dir: Path) -> Path:
+    digest = hashlib.sha256(str(features_dir.resolve()).encode("utf-8")).hexdigest()[:16]
+    return DEFAULT_DB_DIR / f"{features_dir.resolve().name}-{digest}.sqlite3"
+
+
+def _first_section(document: MarkdownDocument, headings: Sequence[str]) -> Optional[Tuple[int, int]]:
+    for heading in headings:
+        span = document.section_span(heading, min_level=2, max_level=2)
+        if span and span[1] > span[0]:
+            return span
+    return None
+
+
+class PlanningIndex:
+    """SQLite index of one features directory; call refresh() before querying."""
+
+    def __init__(self, features_dir: Path, db_path: Optional[Path] = None):
+        self.features_dir = features_dir
+        self.root = os.path.normpath(str(features_dir))
+        self.db_path = db_path if db_path is not None else default_db_path(features_dir)
+        if str(self.db_path) != ":memory:":
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(str(self.db_path))
+        self.connection.executescript(SCHEMA)
+        self._check_schema()
+
+    def _check_schema(self) -> None:
+        expected = {"schema": str(SCHEMA_VERSION), "features_dir": str(self.features_dir.resolve())}
+        stored = dict(self.connection.execute("SELECT key, value FROM meta"))
+        if stored != expected:
+            with self.connection:
+                for table in ROW_TABLES + ["paths", "sources", "meta"]:
+                    self.connection.execute(f"DELETE FROM {table}")
+                self.connection.executemany("INSERT INTO meta VALUES (?, ?)", expected.items())
+
+    def close(self) -> None:
+        self.connection.close()
+
+    # -- paths ---------------------------------------------------------------
+
+    def relative(self, path: Path) -> Optional[str]:
+        """Key of path inside the features tree, or None when it lies outside."""
+        raw = str(path)
+        normalized = os.path.normpath(raw)
+        if normalized == self.root:
+            return "."
+        prefix = self.root + os.sep
+        if not normalized.startswith(prefix) or f"{os.sep}..{os.sep}" in f"{os.sep}{raw}{os.sep}":
+            return None
+        return normalized[len(prefix):]
+
+    def path_known(self, path: Path) -> bool:
+        key = self.relative(path)
+        if key is None:
+            return False
+        return self.connection.execute("SELECT 1 FROM paths WHERE path = ?", (key,)).fetchone() is not None
+
+    def markdown_files(self) -> List[Tuple[str, Path]]:
+        """(key, path) of every *.md file in the tree, in sorted(Path) order."""
+        rows = self.connection.execute("SELECT path FROM paths WHERE is_file AND path GLOB '*.md'")
+        keys = sorted((key for (key,) in rows), key=lambda key: key.split(os.sep))
+        return [(key, self.features_dir / key) for key in keys]
+
+    # -- refresh -------------------------------------------------------------
+
+    def _kind(self, key: str) -> Optional[str]:
+        name = os.path.basename(key)
+        if key in {"REGISTRY.md", "ROADMAP.md", "STORY-INDEX.md"}:
+            return {"REGISTRY.md": "registry", "ROADMAP.md": "roadmap", "STORY-INDEX.md": "story-index"}[key]
+        if name == "STATUS.md":
+            return "status"
+        if name not in TRACKER_FILENAMES and STRICT_STORY_FILE_RE.match(name):
+            return "story"
+        return None
+
+    def refresh(self) -> RefreshStats:
+        """Walk the features tree and re-ingest markdown files whose mtime/size changed."""
+        started = time.perf_counter()
+        stats = RefreshStats()
+        listing: Dict[str, int] = {}
+        candidates: Dict[str, os.stat_result] = {}
+        if os.path.isdir(self.root):
+            listing["."] = 0
+            for dirpath, dirnames, filenames in os.walk(self.root):
+                relative_dir = os.path.relpath(dirpath, self.root)
+                for name in dirnames:
+                    listing[os.path.normpath(os.path.join(relative_dir, name))] = 0
+                for name in filenames:
+                    key = os.path.normpath(os.path.join(relative_dir, name))
+                    listing[key] = 1
+                    if name.endswith(".md") and self._kind(key):
+                        candidates[key] = os.stat(os.path.join(dirpath, name))
+        stats.paths = len(listing)
+        stats.sources = len(candidates)
+
+        known = dict(self.connection.execute("SELECT source, mtime_ns || ':' || size FROM sources WHERE kind != 'external'"))
+        with self.connection:
+            stored_paths = {key for (key,) in self.connection.execute("SELECT path FROM paths")}
+            self.connection.executemany(
+                "DELETE FROM paths WHERE path = ?", ((key,) for key in stored_paths - listing.keys())
+            )
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO paths VALUES (?, ?)",
+                ((key, listing[key]) for key in listing.keys() - stored_paths),
+            )
+            for key in known.keys() - candidates.keys():
+                self._delete_source(key)
+                stats.removed += 1
+            for key, stat in candidates.items():
+                if known.get(key) != f"{stat.st_mtime_ns}:{stat.st_size}":
+                    self._ingest(key, self._kind(key), os.path.join(self.root, key), stat)
+                    stats.ingested += 1
+        stats.seconds = time.perf_counter() - started
+        return stats
+
+    def external_source(self, path: Path, kind: str) -> Optional[Source]:
+        """Ingest (if changed) and return a source outside the features tree, keyed by its path."""
+        key = "external:" + os.path.normpath(str(path))
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        row = self.connection.execute("SELECT mtime_ns, size FROM sources WHERE source = ?", (key,)).fetchone()
+        if row != (stat.st_mtime_ns, stat.st_size):
+            with self.connection:
+                self._ingest(key, kind, str(path), stat, record_kind="external")
+        return self.source_by_key(key)
+
+    def _delete_source(self, key: str) -> None:
+        for table in ROW_TABLES:
+            self.connection.execute(f"DELETE FROM {table} WHERE source = ?", (key,))
+        self.connection.execute("DELETE FROM sources WHERE source = ?", (key,))
+
+    def _ingest(self, key: str, kind: str, path: str, stat: os.stat_result, record_kind: str = "") -> None:
+        self._delete_source(key)
+        error = None
+        content = None
+        try:
+            if kind == "story":
+                # Stories only contribute header fields; skip the full markdown parse.
+                content = decode_text(Path(path).read_bytes())
+            else:
+                content = shared_corpus().document(Path(path))
+        except Exception as exc:
+            error = str(exc)
+        self.connection.execute(
+            "INSERT INTO sources VALUES (?, ?, ?, ?, ?)",
+            (key, record_kind or kind, stat.st_mtime_ns, stat.st_size, error),
+        )
+        if not content or (isinstance(content, MarkdownDocument) and not content.text):
+            return
+        getattr(self, "_ingest_" + kind.replace("-", "_"))(key, content)
+
+    def _ingest_registry(self, key: str, document: MarkdownDocument) -> None:
+        rows = []
+        for section in REGISTRY_SECTIONS:
+            span = document.section_span(section, min_level=2, max_level=2)
+            for order, row in enumerate(document.table_rows(span)):
+                rows.append((
+                    key, section, order, row.get("Feature ID", ""), row.get("Name", ""),
+                    row.get("Status", ""), row.get("Phase", ""), row.get("Folder", ""),
+                ))
+        self.connection.executemany("INSERT INTO registry_rows VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+
+    def _ingest_roadmap(self, key: str, document: MarkdownDocument) -> None:
+        rows = []
+        for section in ROADMAP_SECTIONS:
+            span = document.section_span(section, min_level=2, max_level=2)
+            for row in document.table_rows(span):
+                rows.append((key, section, len(rows), row.get("Feature", ""), row.get("Feature ID", "")))
+        self.connection.executemany("INSERT INTO roadmap_rows VALUES (?, ?, ?, ?, ?)", rows)
+
+    def _ingest_story(self, key: str, text: str) -> None:
+        header = parse_story_header(text)
+        self.connection.execute(
+            "INSERT INTO stories VALUES (?, ?, ?)", (key, int(header.has_story_id), header.story_id)
+        )
+
+    def _ingest_story_index(self, key: str, document: MarkdownDocument) -> None:
+        total = TOTAL_STORIES_RE.search(document.text)
+        self.connection.execute(
+            "INSERT INTO story_index VALUES (?, ?)", (key, int(total.group(1)) if total else None)
+        )
+        rows = []
+        for order, (story_id, rel_path) in enumerate(STORY_INDEX_LINK_RE.findall(document.text)):
+            rows.append((key, order, story_id, rel_path, self.relative(self.features_dir / rel_path)))
+        self.connection.executemany("INSERT INTO story_index_links VALUES (?, ?, ?, ?, ?)", rows)
+
+    def _ingest_status(self, key: str, document: MarkdownDocument) -> None:
+        overall = OVERALL_STATUS_RE.search(document.text)
+        spans = {section: _first_section(document, headings) for section, headings in STATUS_SECTIONS.items()}
+        self.connection.execute(
+            "INSERT INTO status_docs VALUES (?, ?, ?, ?, ?)",
+            (
+                key,
+                overall.group(1).strip() if overall else None,
+                int(spans["required"] is not None),
+                int(spans["stories"] is not None),
+                int(spans["provenance"] is not None),
+            ),
+        )
+        rows = []
+        for section, span in spans.items():
+            for order, row in enumerate(document.table_rows(span)):
+                cells = [row.get(column, "").strip() for column in STATUS_COLUMNS]
+                story_id = STORY_ID_RE.search(cells[0])
+                rows.append((key, section, order, story_id.group(0) if story_id else None, *cells))
+        self.connection.executemany("INSERT INTO status_rows VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+
+    # -- queries -------------------------------------------------------------
+
+    def source_by_key(self, key: str) -> Optional[Source]:
+        row = self.connection.execute(
+            "SELECT source, kind, size, error FROM sources WHERE source = ?", (key,)
+        ).fetchone()
+        return Source(*row) if row else None
+
+    def source(self, path: Path, kind: str = "status") -> Optional[Source]:
+        """Indexed source for path; files outside the features tree are ingested on demand."""
+        key = self.relative(path)
+        if key is None:
+            return self.external_source(path, kind)
+        return self.source_by_key(key)
+
+    def query(self, sql: str, parameters: Union[Sequence, Dict[str, object]] = ()) -> List[tuple]:
+        return self.connection.execute(sql, parameters).fetchall()
+
+    def counts(self) -> Dict[str, int]:
+        return {
+            table: self.connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            for table in ["paths", "sources"] + ROW_TABLES
+        }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Build or refresh the planning tracker SQLite index")
+    parser.add_argument(
+        "--features-dir",
+        default="planning-mds/features",
+        help="Path to planning feature directory (default: planning-mds/features)",
+    )
+    parser.add_argument("--db", default="", help="SQLite database path (default: .cache/planning-index/...)")
+    args = parser.parse_args()
+
+    features_dir = Path(args.features_dir)
+    if not features_dir.is_dir():
+        print(f"[ERROR] Features directory does not exist: {features_dir}")
+        return 1
+
+    index = PlanningIndex(features_dir, Path(args.db) if args.db else None)
+    stats = index.refresh()
+    print(f"Planning index: {index.db_path}")
+    print(
+        f"  refreshed in {stats.seconds * 1000:.1f} ms: {stats.paths} path(s), {stats.sources} tracked file(s), "
+        f"{stats.ingested} ingested, {stats.removed} removed"
+    )
+    for table, count in index.counts().items():
+        print(f"  {table}: {count}")
+    index.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
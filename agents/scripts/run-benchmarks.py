@@ -0,0 +1,1180 @@
+#!/usr/bin/env python3
+"""
+Benchmark harness for framework gate and validation scripts.
+
+Each subcommand times an execution strategy against its baseline on this
+repository (or on a generated corpus) and prints a small table. Benchmarks
+are informational only; no lifecycle gate runs them.
+
+Usage:
+    python3 agents/scripts/run-benchmarks.py gate-modes
+    python3 agents/scripts/run-benchmarks.py gate-modes --stage planning --rounds 5
+    python3 agents/scripts/run-benchmarks.py sections --features-dir planning-mds/features
+    python3 agents/scripts/run-benchmarks.py story-jobs --stories 10000 --jobs 1 2 4 0
+    python3 agents/scripts/run-benchmarks.py trackers --sizes 1000 10000 50000
+    python3 agents/scripts/run-benchmarks.py story-headers --features-dir planning-mds/features
+    python3 agents/scripts/run-benchmarks.py genericness-terms --sizes 10 100 1000
+    python3 agents/scripts/run-benchmarks.py genericness-tree --copies 1 10 50 --jobs 0
+    python3 agents/scripts/run-benchmarks.py skill-routing --prompts 10000
+    python3 agents/scripts/run-benchmarks.py skill-parse --skills 500
+    python3 agents/scripts/run-benchmarks.py openapi-load --spec planning-mds/api/nebula-api.yaml
+    python3 agents/scripts/run-benchmarks.py openapi-refs --operations 2000
+    python3 agents/scripts/run-benchmarks.py json-schema --documents 200
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import os
+import random
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import Callable, Dict, List, Sequence, Tuple
+
+import yaml
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT / "agents" / "scripts"))
+from markdown_corpus import parse_markdown  # noqa: E402
+from story_header import parse_story_header  # noqa: E402
+import json_schema  # noqa: E402
+import openapi_spec  # noqa: E402
+
+
+def load_script(relative_path: str) -> ModuleType:
+    """Import a hyphen-named framework script as a module."""
+    path = REPO_ROOT / relative_path
+    module_name = "_bench_" + path.stem.replace("-", "_")
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    # Registered first: dataclasses resolve string annotations through sys.modules.
+    sys.modules[module_name] = module
+    # Import under a StringIO so scripts skip their stdout re-wrap.
+    with contextlib.redirect_stdout(io.StringIO()):
+        spec.loader.exec_module(module)
+    return module
+
+
+def print_table(headers: Sequence[str], rows: Sequence[Sequence[object]]) -> None:
+    cells = [[str(value) for value in row] for row in rows]
+    widths = [
+        max([len(header)] + [len(row[i]) for row in cells])
+        for i, header in enumerate(headers)
+    ]
+    print("  ".join(header.ljust(widths[i]) for i, header in enumerate(headers)))
+    print("  ".join("-" * width for width in widths))
+    for row in cells:
+        print("  ".join(value.ljust(widths[i]) for i, value in enumerate(row)))
+
+
+def bench_gate_modes(args: argparse.Namespace) -> int:
+    runner = load_script("agents/scripts/run-lifecycle-gates.py")
+    config = runner.load_config(REPO_ROOT / "lifecycle-stage.yaml")
+    runner.validate_gate_definitions(config)
+    stage_name, stage_config = runner.resolve_stage(config, args.stage)
+    gates = config["gates"]
+    gate_names = stage_config.get("required_gates", [])
+
+    modes: Dict[str, Callable[[str], object]] = {
+        "subprocess": lambda name: runner.run_gate(REPO_ROOT, name, gates[name]),
+        "in-process": lambda name: runner.run_gate_with_mode(REPO_ROOT, name, gates[name], True),
+    }
+
+    print(f"Gate execution modes for stage '{stage_name}' ({args.rounds} round(s), best of)")
+    print("-" * 60)
+    rows = []
+    totals = {mode: 0.0 for mode in modes}
+    for name in gate_names:
+        best = {}
+        statuses = set()
+        for mode, run in modes.items():
+            samples = []
+            for _ in range(args.rounds):
+                started = time.perf_counter()
+                statuses.add(run(name).status)
+                samples.append(time.perf_counter() - started)
+            best[mode] = min(samples)
+            totals[mode] += best[mode]
+        speedup = best["subprocess"] / best["in-process"] if best["in-process"] else float("inf")
+        rows.append([
+            name,
+            f"{best['subprocess'] * 1000:.1f} ms",
+            f"{best['in-process'] * 1000:.1f} ms",
+            f"{speedup:.1f}x",
+            "/".join(sorted(statuses)),
+        ])
+    rows.append([
+        "TOTAL",
+        f"{totals['subprocess'] * 1000:.1f} ms",
+        f"{totals['in-process'] * 1000:.1f} ms",
+        f"{totals['subprocess'] / totals['in-process']:.1f}x" if totals["in-process"] else "-",
+        "",
+    ])
+    print_table(["gate", "subprocess", "in-process", "speedup", "status"], rows)
+    return 0
+
+
+VALIDATOR_SECTION_TITLES = [
+    # validate-trackers.py
+    "Active Features", "Planned (Reserved IDs)", "Archived Features",
+    "Now", "Next", "Later", "Completed",
+    "Required Signoff Roles", "Required Signoff Roles (Set in Planning)",
+    "Story Checklist", "Stories", "Story Signoff Provenance", "Story Sign-off Provenance",
+    # validate-stories.py
+    "User Story", "Context & Background", "Acceptance Criteria", "Data Requirements",
+    "Role-Based Visibility", "Non-Functional Expectations", "Dependencies", "Out of Scope",
+    "Questions & Assumptions", "Definition of Done",
+]
+
+
+def regex_section(content: str, title: str, level_pattern: str, flags: int) -> str:
+    """Per-lookup regex section extraction the validators used before the heading index."""
+    match = re.compile(rf"^{level_pattern}\s+{re.escape(title)}\s*$", flags | re.MULTILINE).search(content)
+    if not match:
+        return ""
+    start = match.end()
+    next_heading = re.search(rf"^{level_pattern}\s+", content[start:], re.MULTILINE)
+    end = start + next_heading.start() if next_heading else len(content)
+    return content[start:end]
+
+
+def regex_table(section: str) -> List[Dict[str, str]]:
+    lines = [line.strip() for line in section.splitlines() if line.strip().startswith("|")]
+    if len(lines) < 3:
+        return []
+    headers = [cell.strip() for cell in lines[0].strip("|").split("|")]
+    rows = []
+    for line in lines[2:]:
+        cells = [cell.strip() for cell in line.strip("|").split("|")]
+        if len(cells) == len(headers):
+            rows.append(dict(zip(headers, cells)))
+    return rows
+
+
+def bench_sections(args: argparse.Namespace) -> int:
+    features_dir = Path(args.features_dir)
+    texts = [path.read_text(encoding="utf-8") for path in sorted(features_dir.rglob("*.md"))]
+    if args.all_titles:
+        # Every heading title in the tree plus one miss: an exhaustive equivalence check.
+        titles = sorted({h.title for text in texts for h in parse_markdown(text).headings if h.title})
+        titles.append("No Such Section")
+    else:
+        titles = VALIDATOR_SECTION_TITLES
+    styles = {
+        "trackers (## exact, +table)": ("##", 0, {"min_level": 2, "max_level": 2}),
+        "stories (##+ ignore-case)": ("##+", re.IGNORECASE, {"min_level": 2, "ignore_case": True}),
+    }
+    lookups = len(texts) * len(titles)
+    print(f"Section lookups over {features_dir}: {len(texts)} file(s) x {len(titles)} title(s) = {lookups}")
+    print("-" * 60)
+
+    rows = []
+    for style, (level_pattern, flags, options) in styles.items():
+        with_tables = style.startswith("trackers")
+        regex_results: List[Tuple[str, object]] = []
+        started = time.perf_counter()
+        for text in texts:
+            for title in titles:
+                section = regex_section(text, title, level_pattern, flags)
+                regex_results.append((section, regex_table(section) if with_tables else None))
+        regex_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        documents = [parse_markdown(text) for text in texts]
+        parse_seconds = time.perf_counter() - started
+        index_results: List[Tuple[str, object]] = []
+        started = time.perf_counter()
+        for document in documents:
+            for title in titles:
+                span = document.section_span(title, **options)
+                section = document.text[span[0]:span[1]] if span else ""
+                index_results.append((section, document.table_rows(span) if with_tables else None))
+        index_seconds = time.perf_counter() - started
+
+        mismatches = sum(1 for old, new in zip(regex_results, index_results) if old != new)
+        rows.append([
+            style,
+            f"{regex_seconds * 1000:.1f} ms",
+            f"{parse_seconds * 1000:.1f} ms",
+            f"{index_seconds * 1000:.1f} ms",
+            f"{regex_seconds / (parse_seconds + index_seconds):.1f}x",
+            str(mismatches),
+        ])
+    print_table(["lookup style", "regex scan", "index build", "index lookup", "speedup", "mismatches"], rows)
+    return 0 if all(row[-1] == "0" for row in rows) else 1
+
+
+StoryFields = Tuple[object, ...]
+
+
+def regex_story_fields(text: str) -> StoryFields:
+    """Six full-text re.search calls, as generate-story-index.py extracted story metadata before story_header."""
+    values = []
+    for name in ("Story ID", "Title", "Feature", "Priority", "Phase"):
+        match = re.search(rf"\*\*{name}:\*\*\s*([^\n]+)", text)
+        values.append(match.group(1).strip() if match else None)
+    if values[1] is None:
+        heading = re.search(r"^#\s+(.+)$", text, re.MULTILINE)
+        values[1] = heading.group(1).strip() if heading else None
+    persona = re.search(r"\*\*As\s+a\*\*\s+([^\n*]+)", text)
+    values.append(persona.group(1).strip() if persona else None)
+    return tuple(values)
+
+
+def corpus_story_fields(text: str) -> StoryFields:
+    """Full markdown parse plus field lookups (the parsed-corpus path)."""
+    document = parse_markdown(text)
+    values = [document.field(name) for name in ("Story ID", "Title", "Feature", "Priority", "Phase")]
+    if values[1] is None:
+        values[1] = next((h.title for h in document.headings if h.level == 1 and h.spaced and h.title), None)
+    persona = re.search(r"\*\*As\s+a\*\*\s+([^\n*]+)", text)
+    values.append(persona.group(1).strip() if persona else None)
+    return tuple(values)
+
+
+def header_story_fields(text: str) -> StoryFields:
+    """story_header's single pass over the header block (the shared extractor)."""
+    header = parse_story_header(text)
+    values = [header.field(name) for name in ("Story ID", "Title", "Feature", "Priority", "Phase")]
+    if values[1] is None:
+        values[1] = header.heading
+    values.append(header.persona)
+    return tuple(values)
+
+
+def bench_story_headers(args: argparse.Namespace) -> int:
+    features_dir = Path(args.features_dir)
+    texts = [
+        path.read_text(encoding="utf-8")
+        for path in sorted(features_dir.rglob("*.md"))
+        if re.match(r"F\d{4}-S\d{4}", path.name)
+    ]
+    print(f"Story header extraction over {features_dir}: {len(texts)} story file(s) x {args.rounds} round(s)")
+    print("-" * 60)
+    extractors: Dict[str, Callable[[str], StoryFields]] = {
+        "six re.search (full text)": regex_story_fields,
+        "markdown parse + fields": corpus_story_fields,
+        "header block, one pass": header_story_fields,
+    }
+    baseline_results = [regex_story_fields(text) for text in texts]
+    rows = []
+    baseline_seconds = None
+    for label, extract in extractors.items():
+        started = time.perf_counter()
+        for _ in range(args.rounds):
+            results = [extract(text) for text in texts]
+        seconds = time.perf_counter() - started
+        baseline_seconds = baseline_seconds or seconds
+        mismatches = sum(1 for old, new in zip(baseline_results, results) if old != new)
+        rows.append([
+            label,
+            f"{seconds * 1000:.1f} ms",
+            f"{seconds / (len(texts) * args.rounds) * 1e6:.1f} us",
+            f"{baseline_seconds / seconds:.1f}x",
+            str(mismatches),
+        ])
+    print_table(["extractor", "total", "per story", "speedup", "mismatches"], rows)
+    return 0 if all(row[-1] == "0" for row in rows) else 1
+
+
+def phrase_to_regex(phrase: str) -> "re.Pattern[str]":
+    """Regex form of a validate-genericness exception phrase (the pre-automaton rule style)."""
+    parts = re.split(r"(\\s[+*]| )", phrase)
+    body = "".join(part if part in (" ", r"\s+", r"\s*") else re.escape(part) for part in parts)
+    suffix = r"\b" if re.search(r"\w$", phrase) else ""
+    return re.compile(r"\b" + body + suffix, re.IGNORECASE)
+
+
+def regex_genericness_scan(
+    texts: Sequence[str], terms: Sequence[str], genericness: ModuleType
+) -> List[Tuple[int, int]]:
+    """The longest-first alternation scan validate-genericness.py used before the automaton."""
+    blocked_terms = sorted({term.lower().strip() for term in terms if term.strip()})
+    blocked_term_set = set(blocked_terms)
+    pattern_terms = sorted(
+        {variant for term in blocked_terms for variant in genericness.expand_term_variants(term)},
+        key=len,
+        reverse=True,
+    )
+    pattern = re.compile(r"\b(" + "|".join(re.escape(t) for t in pattern_terms) + r")\b", re.IGNORECASE)
+    exceptions = {
+        term: [phrase_to_regex(phrase) for phrase in phrases]
+        for term, phrases in genericness.TERM_EXCEPTIONS.items()
+    }
+    violations = []
+    for file_index, text in enumerate(texts):
+        for line_num, line in enumerate(text.splitlines(), start=1):
+            matches = list(pattern.finditer(line))
+            if not matches:
+                continue
+            matched = {genericness.canonicalize_matched_term(m.group(0), blocked_term_set) for m in matches}
+            if not all(any(rule.search(line) for rule in exceptions.get(term, [])) for term in matched):
+                violations.append((file_index, line_num))
+    return violations
+
+
+def automaton_genericness_scan(
+    texts: Sequence[str], terms: Sequence[str], genericness: ModuleType
+) -> List[Tuple[int, int]]:
+    automaton = genericness.BlockedTermAutomaton(list(terms))
+    violations = []
+    for file_index, text in enumerate(texts):
+        if not automaton.may_match(genericness.fold_case(text)):
+            continue
+        for line_num, line in enumerate(text.splitlines(), start=1):
+            if automaton.may_match(genericness.fold_case(line)) and automaton.line_violates(line):
+                violations.append((file_index, line_num))
+    return violations
+
+
+def synthetic_blocked_terms(size: int, base_terms: Sequence[str], vocabulary: Sequence[str]) -> List[str]:
+    """base_terms, then ~10% words that occur in the scanned tree, then made-up words, up to size."""
+    terms = list(base_terms)[:size]
+    real_words = max(1, (size - len(terms)) // 10)
+    step = max(1, len(vocabulary) // real_words)
+    terms.extend(vocabulary[::step][:real_words])
+    index = 0
+    while len(terms) < size:
+        terms.append(f"zq{index:05d}x")
+        index += 1
+    return terms[:size]
+
+
+def bench_genericness_terms(args: argparse.Namespace) -> int:
+    genericness = load_script("agents/scripts/validate-genericness.py")
+    agents_dir = Path(args.agents_dir)
+    extensions = {".md", ".py", ".sh", ".yaml", ".yml"}
+    texts = []
+    for path in sorted(agents_dir.rglob("*")):
+        if path.is_file() and path.suffix in extensions:
+            try:
+                texts.append(path.read_text(encoding="utf-8"))
+            except (OSError, UnicodeDecodeError):
+                continue
+    base_terms = genericness.extract_blocked_terms(args.glossary)
+    vocabulary = sorted({word.lower() for text in texts for word in re.findall(r"[A-Za-z]{8,}", text)})
+    lines = sum(len(text.splitlines()) for text in texts)
+    print(f"Genericness scan over {agents_dir}: {len(texts)} file(s), {lines:,} line(s)")
+    print("-" * 60)
+
+    rows = []
+    for size in args.sizes:
+        terms = synthetic_blocked_terms(size, base_terms, vocabulary)
+        started = time.perf_counter()
+        regex_hits = regex_genericness_scan(texts, terms, genericness)
+        regex_seconds = time.perf_counter() - started
+        started = time.perf_counter()
+        automaton_hits = automaton_genericness_scan(texts, terms, genericness)
+        automaton_seconds = time.perf_counter() - started
+        rows.append([
+            str(size),
+            f"{regex_seconds * 1000:.0f} ms",
+            f"{automaton_seconds * 1000:.0f} ms",
+            f"{regex_seconds / automaton_seconds:.1f}x",
+            str(len(regex_hits)),
+            str(len(set(regex_hits) ^ set(automaton_hits))),
+        ])
+    print_table(["terms", "regex alternation", "automaton", "speedup", "violations", "mismatches"], rows)
+    return 0 if all(row[-1] == "0" for row in rows) else 1
+
+
+def text_genericness_tree_scan(
+    agents_dir: Path, terms: Sequence[str], genericness: ModuleType
+) -> List[Tuple[str, int, str]]:
+    """Decode and split every file, as validate-genericness.py did before its byte prefilter."""
+    automaton = genericness.BlockedTermAutomaton(list(terms))
+    skip_files = {"TECH-STACK-ADAPTATION.md", "validate-genericness.py"}
+    violations = []
+    for path in sorted(agents_dir.rglob("*")):
+        if not path.is_file() or path.suffix not in {".md", ".py", ".sh", ".yaml", ".yml"}:
+            continue
+        if path.name in skip_files or ".git" in path.parts:
+            continue
+        try:
+            content = path.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            continue
+        for line_num, line in genericness.scan_text(content, automaton):
+            violations.append((str(path), line_num, line))
+    return violations
+
+
+def bench_genericness_tree(args: argparse.Namespace) -> int:
+    genericness = load_script("agents/scripts/validate-genericness.py")
+    terms = genericness.extract_blocked_terms(args.glossary)
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    print(f"Genericness scan of agents/ copies: text vs mmap, 1 vs {jobs} job(s) (cpu count {os.cpu_count()})")
+    print("-" * 60)
+
+    rows = []
+    with tempfile.TemporaryDirectory(prefix="genericness-bench-") as temp_dir:
+        root = Path(temp_dir)
+        copied = 0
+        for copies in sorted(args.copies):
+            for index in range(copied, copies):
+                shutil.copytree(args.agents_dir, root / f"copy{index:04d}")
+            copied = copies
+            files = sum(1 for path in root.rglob("*") if path.is_file())
+            megabytes = sum(path.stat().st_size for path in root.rglob("*") if path.is_file()) / 1e6
+
+            started = time.perf_counter()
+            text_hits = text_genericness_tree_scan(root, terms, genericness)
+            text_seconds = time.perf_counter() - started
+            started = time.perf_counter()
+            serial_hits = genericness.scan_directory(str(root), terms, 1)
+            serial_seconds = time.perf_counter() - started
+            started = time.perf_counter()
+            pool_hits = genericness.scan_directory(str(root), terms, jobs)
+            pool_seconds = time.perf_counter() - started
+            rows.append([
+                str(copies),
+                str(files),
+                f"{megabytes:.1f} MB",
+                f"{text_seconds * 1000:.0f} ms",
+                f"{serial_seconds * 1000:.0f} ms",
+                f"{pool_seconds * 1000:.0f} ms",
+                f"{text_seconds / min(serial_seconds, pool_seconds):.1f}x",
+                "yes" if text_hits == serial_hits == pool_hits else "NO",
+            ])
+    print_table(["copies", "files", "size", "read+split", "mmap", f"mmap jobs={jobs}", "speedup", "identical"], rows)
+    return 0 if all(row[-1] == "yes" for row in rows) else 1
+
+
+def synthetic_routing_prompts(count: int, vocabulary: Sequence[str], seed: int = 7) -> List[str]:
+    generator = random.Random(seed)
+    return [" ".join(generator.choices(vocabulary, k=generator.randint(3, 16))) for _ in range(count)]
+
+
+def bench_skill_routing(args: argparse.Namespace) -> int:
+    regression = load_script("agents/scripts/run-skill-regression.py")
+    errors: List[str] = []
+    skills = regression.discover_skills(Path(args.skills_dir), errors)
+    if not skills:
+        print(f"No SKILL.md files found under {args.skills_dir}: {errors}")
+        return 1
+    router = regression.SkillRouter(skills)
+    cases = regression.yaml.safe_load(Path(args.cases).read_text(encoding="utf-8")).get("cases") or []
+    # Skill vocabulary, the golden prompts' words, and as many words no skill knows.
+    case_words = [word for case in cases for word in str(case.get("prompt", "")).split()]
+    vocabulary = sorted(router.vocabulary) + case_words
+    vocabulary += [f"filler{index}" for index in range(len(vocabulary))]
+    prompts = [regression.tokenize(prompt) for prompt in synthetic_routing_prompts(args.prompts, vocabulary)]
+    backend = "numpy" if router.weights is not None else "pure Python"
+    print(f"Routing {len(prompts):,} synthetic prompts over {len(skills)} skills (batch backend: {backend})")
+    print("-" * 60)
+
+    def pair_loop() -> List[Tuple[int, str]]:
+        routes = []
+        for tokens in prompts:
+            scored = sorted(
+                ((regression.route_score(tokens, skill), skill.folder) for skill in skills),
+                key=lambda pair: (-pair[0], pair[1]),
+            )
+            routes.append(scored[0])
+        return routes
+
+    bm25_router = regression.SkillRouter(skills, regression.bm25_token_weights(skills))
+    # (label, strategy, reference label whose top-1 routes it must reproduce)
+    strategies: List[Tuple[str, Callable[[], List[Tuple[float, str]]], str]] = [
+        ("route_score per pair", pair_loop, "route_score per pair"),
+        ("index route()", lambda: [router.route(tokens) for tokens in prompts], "route_score per pair"),
+        ("index route_batch()", lambda: router.route_batch(prompts), "route_score per pair"),
+        ("bm25 route()", lambda: [bm25_router.route(tokens)[1] for tokens in prompts], "bm25 route()"),
+        ("bm25 route_batch()", lambda: [route[1] for route in bm25_router.route_batch(prompts)], "bm25 route()"),
+    ]
+    rows = []
+    results: Dict[str, list] = {}
+    baseline_seconds = 0.0
+    for label, strategy, reference in strategies:
+        started = time.perf_counter()
+        routes = strategy()
+        elapsed = time.perf_counter() - started
+        results[label] = routes
+        baseline_seconds = baseline_seconds or elapsed
+        mismatches = sum(1 for expected, actual in zip(results[reference], routes) if expected != actual)
+        rows.append([
+            label,
+            f"{elapsed * 1000:.0f} ms",
+            f"{len(prompts) / elapsed:,.0f}",
+            f"{baseline_seconds / elapsed:.1f}x",
+            str(mismatches),
+        ])
+    print_table(["router", "total", "prompts/s", "speedup", "top-1 mismatches"], rows)
+    return 0 if all(row[-1] == "0" for row in rows) else 1
+
+
+def legacy_skill_parse(path: Path, regression: ModuleType) -> Tuple[Dict, str, int]:
+    """SKILL.md parsing as build_skill() did it: yaml.safe_load, file read twice."""
+    lines = path.read_text(encoding="utf-8").splitlines()
+    end = next(index for index in range(1, len(lines)) if lines[index].strip() == "---")
+    metadata = regression.yaml.safe_load("\n".join(lines[1:end]))
+    return metadata, "\n".join(lines[end + 1:]), len(path.read_text(encoding="utf-8").splitlines())
+
+
+def bench_skill_parse(args: argparse.Namespace) -> int:
+    regression = load_script("agents/scripts/run-skill-regression.py")
+    templates = sorted(Path(args.skills_dir).glob("*/SKILL.md"))
+    if not templates:
+        print(f"No SKILL.md files found under {args.skills_dir}")
+        return 1
+    print(f"Parsing {args.skills} synthetic skills (YAML loader: {regression.YAML_LOADER.__name__})")
+    print("-" * 60)
+
+    with tempfile.TemporaryDirectory(prefix="skill-bench-") as temp_dir:
+        root = Path(temp_dir)
+        for index in range(args.skills):
+            folder = root / f"skill-{index:04d}"
+            folder.mkdir()
+            # A distinct trailing line per copy, so the hash-keyed cache cannot share entries.
+            content = templates[index % len(templates)].read_text(encoding="utf-8") + f"\n<!-- copy {index} -->\n"
+            (folder / "SKILL.md").write_text(content, encoding="utf-8")
+        cache_path = root / "skills.pickle"
+        paths = sorted(root.glob("*/SKILL.md"))
+
+        started = time.perf_counter()
+        legacy = [legacy_skill_parse(path, regression) for path in paths]
+        legacy_seconds = time.perf_counter() - started
+
+        rows = []
+        for label, cache in (("no cache", None), ("cold cache", cache_path), ("warm cache", cache_path)):
+            errors: List[str] = []
+            started = time.perf_counter()
+            skills = regression.discover_skills(root, errors, cache)
+            elapsed = time.perf_counter() - started
+            parsed = [(skill.metadata, skill.body, skill.line_count) for skill in skills]
+            rows.append([
+                label,
+                f"{elapsed * 1000:.1f} ms",
+                f"{legacy_seconds / elapsed:.1f}x",
+                str(len(errors) + sum(1 for old, new in zip(legacy, parsed) if old != new)),
+            ])
+    print(f"safe_load, two reads per skill: {legacy_seconds * 1000:.1f} ms")
+    print_table(["discover_skills", "total", "speedup", "mismatches"], rows)
+    return 0 if all(row[-1] == "0" for row in rows) else 1
+
+
+def bench_openapi_load(args: argparse.Namespace) -> int:
+    spec_path = Path(args.spec)
+    data = spec_path.read_bytes()
+    print(f"Loading {spec_path} ({len(data.splitlines()):,} lines, YAML loader: {openapi_spec.YAML_LOADER.__name__})")
+    print("-" * 60)
+
+    def best_of(action: Callable[[], object]) -> Tuple[float, object]:
+        timings, result = [], None
+        for _ in range(args.rounds):
+            started = time.perf_counter()
+            result = action()
+            timings.append(time.perf_counter() - started)
+        return min(timings), result
+
+    baseline_seconds, baseline = best_of(lambda: yaml.safe_load(data.decode("utf-8")))
+    with tempfile.TemporaryDirectory(prefix="openapi-bench-") as temp_dir:
+        cache_dir = Path(temp_dir)
+
+        def cold() -> object:
+            openapi_spec.clear_memo()
+            for cached in cache_dir.glob("*.pickle"):
+                cached.unlink()
+            return openapi_spec.load_spec(spec_path, cache_dir)
+
+        def warm_disk() -> object:
+            openapi_spec.clear_memo()
+            return openapi_spec.load_spec(spec_path, cache_dir)
+
+        strategies = [
+            ("yaml.safe_load", lambda: (baseline_seconds, baseline)),
+            ("fast loader, no cache", lambda: best_of(lambda: openapi_spec.parse_spec(data, str(spec_path)))),
+            ("load_spec, cold (parse + write cache)", lambda: best_of(cold)),
+            ("load_spec, warm disk cache", lambda: best_of(warm_disk)),
+            ("load_spec, warm in-process", lambda: best_of(lambda: openapi_spec.load_spec(spec_path, cache_dir))),
+        ]
+        rows = []
+        for label, strategy in strategies:
+            seconds, spec = strategy()
+            rows.append([
+                label,
+                f"{seconds * 1000:.2f} ms",
+                f"{baseline_seconds / seconds:.1f}x",
+                "yes" if spec == baseline else "NO",
+            ])
+        openapi_spec.clear_memo()
+    print_table(["loader", f"best of {args.rounds}", "speedup", "identical"], rows)
+    return 0 if all(row[-1] == "yes" for row in rows) else 1
+
+
+def write_synthetic_stories(target: Path, count: int, features_dir: Path) -> int:
+    """Write count story files to target, cycling through the repository's stories as templates."""
+    templates = [
+        path.read_text(encoding="utf-8")
+        for path in sorted(features_dir.rglob("F*-S*.md"))
+        if re.match(r"F\d{4}-S\d{4}-", path.name)
+    ]
+    if not templates:
+        return 0
+    for index in range(count):
+        feature = 9000 + index // 1000
+        folder = target / f"F{feature:04d}-synthetic"
+        folder.mkdir(exist_ok=True)
+        story_id = f"F{feature:04d}-S{index % 1000:04d}"
+        (folder / f"{story_id}-synthetic.md").write_text(templates[index % len(templates)], encoding="utf-8")
+    return count
+
+
+def bench_story_jobs(args: argparse.Namespace) -> int:
+    script = REPO_ROOT / "agents/product-manager/scripts/validate-stories.py"
+    # Measure validation itself: the parsed-markdown cache would hide parse cost on reruns.
+    env = dict(os.environ, MARKDOWN_CORPUS_CACHE="off")
+    with tempfile.TemporaryDirectory(prefix="story-bench-") as temp_dir:
+        target = Path(temp_dir)
+        written = write_synthetic_stories(target, args.stories, Path(args.features_dir))
+        if not written:
+            print(f"No template stories found under {args.features_dir}")
+            return 1
+        print(f"validate-stories.py over {written} synthetic stories (cpu count {os.cpu_count()})")
+        print("-" * 60)
+
+        baseline_output = None
+        baseline_seconds = 0.0
+        rows = []
+        for jobs in args.jobs:
+            started = time.perf_counter()
+            completed = subprocess.run(
+                [sys.executable, str(script), "--jobs", str(jobs), str(target)],
+                capture_output=True,
+                env=env,
+            )
+            elapsed = time.perf_counter() - started
+            if baseline_output is None:
+                baseline_output, baseline_seconds = completed.stdout, elapsed
+            rows.append([
+                str(jobs),
+                f"{elapsed:.2f} s",
+                f"{written / elapsed:,.0f}",
+                f"{baseline_seconds / elapsed:.2f}x",
+                "yes" if completed.stdout == baseline_output else "NO",
+                str(completed.returncode),
+            ])
+    print_table(["jobs", "wall", "stories/s", "vs first", "identical", "exit"], rows)
+    return 0 if all(row[4] == "yes" for row in rows) else 1
+
+
+def write_synthetic_trackers(root: Path, story_count: int, stories_per_feature: int = 100) -> None:
+    """Write a planning tree (features, stories, STATUS signoffs, trackers, blueprint) of story_count stories."""
+    features_dir = root / "features"
+    features_dir.mkdir(parents=True)
+    registry = ["# Feature Registry", "", "## Active Features", "",
+                "| Feature ID | Name | Status | Phase | Folder |", "|---|---|---|---|---|"]
+    roadmap = ["# Roadmap", "", "## Completed", "", "| Feature | Phase | Outcome |", "|---|---|---|"]
+    index = ["# User Story Index", "", f"**Total Stories:** {story_count}", ""]
+    blueprint = ["# Blueprint", ""]
+    for start in range(0, story_count, stories_per_feature):
+        feature_id = f"F{1000 + start // stories_per_feature:04d}"
+        folder_name = f"{feature_id}-synthetic"
+        folder = features_dir / folder_name
+        folder.mkdir()
+        story_ids = [f"{feature_id}-S{n:04d}" for n in range(1, min(stories_per_feature, story_count - start) + 1)]
+        status = [
+            f"# {feature_id} Status", "", "**Overall Status:** Done", "",
+            "## Required Signoff Roles", "", "| Role | Required |", "|---|---|",
+            "| Quality Engineer | Yes |", "| Code Reviewer | Yes |", "",
+            "## Story Checklist", "", "| Story | Status |", "|---|---|",
+        ]
+        status += [f"| {story_id} | Done |" for story_id in story_ids]
+        status += ["", "## Story Signoff Provenance", "",
+                   "| Story | Role | Verdict | Reviewer | Evidence | Date |", "|---|---|---|---|---|---|"]
+        for story_id in story_ids:
+            for role in ("Quality Engineer", "Code Reviewer"):
+                status.append(f"| {story_id} | {role} | PASS | reviewer | tests/{story_id}.log | 2026-01-01 |")
+            name = f"{story_id}-synthetic.md"
+            (folder / name).write_text(
+                f"# {story_id}: Synthetic story\n\n**Story ID:** {story_id}\n**Feature:** {feature_id}\n",
+                encoding="utf-8",
+            )
+            index.append(f"| [{story_id}](./{folder_name}/{name}) | Synthetic story |")
+            blueprint.append(f"- [{story_id}: Synthetic story](features/{folder_name}/{name}) - Done")
+        (folder / "STATUS.md").write_text("\n".join(status) + "\n", encoding="utf-8")
+        (folder / "PRD.md").write_text(f"# {feature_id}\n", encoding="utf-8")
+        registry.append(f"| {feature_id} | Synthetic | Done | MVP | `{folder_name}/` |")
+        roadmap.append(f"| [{feature_id} — Synthetic](./{folder_name}/PRD.md) | MVP | Done |")
+        blueprint.append(f"- [{feature_id}: Synthetic](features/{folder_name}/PRD.md) - Done")
+    registry += ["", "## Archived Features", "",
+                 "| Feature ID | Name | Status | Phase | Folder |", "|---|---|---|---|---|"]
+    (features_dir / "REGISTRY.md").write_text("\n".join(registry) + "\n", encoding="utf-8")
+    (features_dir / "ROADMAP.md").write_text("\n".join(roadmap) + "\n", encoding="utf-8")
+    (features_dir / "STORY-INDEX.md").write_text("\n".join(index) + "\n", encoding="utf-8")
+    (root / "BLUEPRINT.md").write_text("\n".join(blueprint) + "\n", encoding="utf-8")
+
+
+def bench_trackers(args: argparse.Namespace) -> int:
+    # Time the checks, not markdown parsing served from the on-disk cache.
+    os.environ["MARKDOWN_CORPUS_CACHE"] = "off"
+    trackers = load_script("agents/product-manager/scripts/validate-trackers.py")
+    print("validate-trackers.py scaling over synthetic planning trees (100 stories per feature)")
+    print("-" * 60)
+    rows = []
+    previous = None
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory(prefix="tracker-bench-") as temp_dir:
+            root = Path(temp_dir)
+            write_synthetic_trackers(root, size)
+            index_db = root / "planning-index.sqlite3"
+            timings = []
+            # Cold: the planning index is built from scratch; warm: every file is unchanged.
+            for _ in ("cold", "warm"):
+                validator = trackers.TrackerValidator(root / "features", root / "BLUEPRINT.md", index_db)
+                started = time.perf_counter()
+                with contextlib.redirect_stdout(io.StringIO()):
+                    validator.validate()
+                timings.append(time.perf_counter() - started)
+        cold, warm = timings
+        per_story = cold / size
+        growth = f"{per_story / previous:.2f}x" if previous else "-"
+        previous = per_story
+        errors = sum(1 for issue in validator.issues if issue.severity == "ERROR")
+        rows.append([
+            f"{size:,}", f"{cold:.2f} s", f"{warm:.2f} s", f"{per_story * 1e6:.1f} us", growth, str(errors),
+        ])
+    print_table(["stories", "cold index", "warm index", "per story (cold)", "per-story growth", "errors"], rows)
+    print("\nLinear scaling keeps per-story cost flat as the tree grows; warm runs only re-stat")
+    print("files and answer the checks from the planning index.")
+    return 0
+
+
+ERROR_RESPONSES = {"400": "BadRequest", "401": "Unauthorized", "403": "Forbidden", "404": "NotFound", "409": "Conflict"}
+
+
+def synthetic_openapi_spec(operations: int) -> Dict[str, object]:
+    """OpenAPI document with `operations` operations sharing $ref'd parameters, schemas and error responses."""
+    methods = ("get", "post", "put", "patch", "delete")
+    problem = {"$ref": "#/components/schemas/ProblemDetails"}
+    spec: Dict[str, object] = {
+        "openapi": "3.0.3",
+        "info": {"title": "Synthetic API", "version": "1.0.0"},
+        "security": [{"bearer": []}],
+        "paths": {},
+        "components": {
+            "securitySchemes": {"bearer": {"type": "http", "scheme": "bearer"}},
+            "parameters": {
+                "Page": {"name": "page", "in": "query", "schema": {"type": "integer", "minimum": 1}},
+                "PageSize": {"name": "pageSize", "in": "query", "schema": {"type": "integer", "maximum": 100}},
+            },
+            "responses": {
+                name: {"description": name, "content": {"application/problem+json": {"schema": dict(problem)}}}
+                for name in ERROR_RESPONSES.values()
+            },
+            "schemas": {
+                "ProblemDetails": {
+                    "type": "object",
+                    "required": ["type", "title", "status"],
+                    "properties": {name: {"type": "string"} for name in ("type", "title", "status", "code", "traceId")},
+                },
+                # Recursive schema: one ref cycle for the graph to report.
+                "TreeNode": {
+                    "type": "object",
+                    "required": ["id"],
+                    "properties": {"id": {"type": "string"}, "children": {"type": "array", "items": {"$ref": "#/components/schemas/TreeNode"}}},
+                },
+            },
+        },
+    }
+    paths = spec["paths"]
+    schemas = spec["components"]["schemas"]
+    for index in range(operations):
+        resource = f"Resource{index // len(methods):04d}"
+        if resource not in schemas:
+            schemas[resource] = {
+                "type": "object",
+                "required": ["id"],
+                "properties": {"id": {"type": "string"}, "tree": {"$ref": "#/components/schemas/TreeNode"}},
+            }
+        method = methods[index % len(methods)]
+        schema_ref = {"$ref": f"#/components/schemas/{resource}"}
+        success = "201" if method == "post" else "204" if method == "delete" else "200"
+        operation = {
+            "operationId": f"{method}{resource}",
+            "summary": f"{method.upper()} {resource}",
+            "parameters": [{"$ref": "#/components/parameters/Page"}, {"$ref": "#/components/parameters/PageSize"}],
+            "responses": {success: {"description": "OK", "content": {"application/json": {"schema": dict(schema_ref)}}}},
+        }
+        if method in ("post", "put", "patch"):
+            operation["requestBody"] = {"content": {"application/json": {"schema": dict(schema_ref)}}}
+        operation["responses"].update(
+            {code: {"$ref": f"#/components/responses/{name}"} for code, name in ERROR_RESPONSES.items()}
+        )
+        paths.setdefault(f"/resources/r{index // len(methods):04d}", {})[method] = operation
+    return spec
+
+
+def legacy_resolve_local_ref(spec: object, ref: object) -> object:
+    """Pre-graph resolution: walk the spec from the root for every $ref."""
+    if not isinstance(ref, str) or not ref.startswith("#/"):
+        return None
+    node = spec
+    for token in ref[2:].split("/"):
+        if not isinstance(node, dict) or token not in node:
+            return None
+        node = node[token]
+    return node
+
+
+def ref_occurrences(node: object) -> List[str]:
+    """Every local $ref string in node, once per occurrence."""
+    if isinstance(node, dict):
+        found = [node["$ref"]] if isinstance(node.get("$ref"), str) and node["$ref"].startswith("#/") else []
+        return found + [ref for value in node.values() for ref in ref_occurrences(value)]
+    if isinstance(node, list):
+        return [ref for value in node for ref in ref_occurrences(value)]
+    return []
+
+
+def bench_openapi_refs(args: argparse.Namespace) -> int:
+    contract = load_script("agents/architect/scripts/validate-api-contract.py")
+    spec = synthetic_openapi_spec(args.operations)
+    occurrences = ref_occurrences(spec)
+    graphs: List[openapi_spec.SpecGraph] = []
+
+    def best_of(action: Callable[[], object], cold: bool = False) -> Tuple[float, object]:
+        timings, result = [], None
+        for _ in range(args.rounds):
+            if cold or not graphs:
+                graphs[:] = [openapi_spec.SpecGraph(spec)]
+            started = time.perf_counter()
+            result = action()
+            timings.append(time.perf_counter() - started)
+        return min(timings), result
+
+    graph = openapi_spec.SpecGraph(spec)
+    print(
+        f"Synthetic spec: {args.operations:,} operations, {len(occurrences):,} $ref occurrences, "
+        f"{len(set(occurrences))} distinct refs, {len(graph.cycles)} cycle(s)"
+    )
+    print("Ref table: cold = fresh table per run (first gate on a spec), warm = table already filled (a gate sharing it)")
+    print("-" * 60)
+
+    class RootWalkValidator(contract.ApiContractValidator):
+        def load_spec(self) -> bool:
+            self.spec = spec
+            return True
+
+        def _resolve_local_ref(self, ref: str) -> object:
+            return legacy_resolve_local_ref(self.spec, ref)
+
+    class GraphValidator(contract.ApiContractValidator):
+        def load_spec(self) -> bool:
+            self.spec = spec
+            self.graph = graphs[0]
+            return True
+
+    def deref_responses_root_walk() -> List[object]:
+        resolved = []
+        for path_item in spec["paths"].values():
+            for operation in path_item.values():
+                for response in operation["responses"].values():
+                    target = legacy_resolve_local_ref(spec, response["$ref"]) if "$ref" in response else response
+                    content = target["content"]
+                    media = content["application/problem+json"] if "application/problem+json" in content else content["application/json"]
+                    resolved.append(legacy_resolve_local_ref(spec, media["schema"]["$ref"]))
+        return resolved
+
+    def deref_responses_graph() -> List[object]:
+        resolved = []
+        deref = graphs[0].deref
+        for _, _, operation in graphs[0].operations():
+            for response in operation["responses"].values():
+                content = deref(response)["content"]
+                media = content["application/problem+json"] if "application/problem+json" in content else content["application/json"]
+                resolved.append(deref(media["schema"]))
+        return resolved
+
+    def same_nodes(old: List[object], new: List[object]) -> bool:
+        return len(old) == len(new) and all(a is b for a, b in zip(old, new))
+
+    pairs = [
+        (
+            "resolve every $ref",
+            lambda: [legacy_resolve_local_ref(spec, ref) for ref in occurrences],
+            lambda: [graphs[0].resolve(ref) for ref in occurrences],
+            same_nodes,
+        ),
+        ("dereference responses", deref_responses_root_walk, deref_responses_graph, same_nodes),
+        (
+            "api_contract validate()",
+            lambda: RootWalkValidator("synthetic").validate(),
+            lambda: GraphValidator("synthetic").validate(),
+            lambda old, new: old == new,
+        ),
+    ]
+    rows = []
+    for label, legacy, indexed, same in pairs:
+        legacy_seconds, legacy_result = best_of(legacy)
+        cold_seconds, cold_result = best_of(indexed, cold=True)
+        warm_seconds, warm_result = best_of(indexed)
+        rows.append([
+            label,
+            f"{legacy_seconds * 1000:.1f} ms",
+            f"{cold_seconds * 1000:.1f} ms",
+            f"{legacy_seconds / cold_seconds:.1f}x",
+            f"{warm_seconds * 1000:.1f} ms",
+            f"{legacy_seconds / warm_seconds:.1f}x",
+            "yes" if same(legacy_result, cold_result) and same(legacy_result, warm_result) else "NO",
+        ])
+    print_table(["workload", "root walk", "cold table", "speedup", "warm table", "speedup", "identical"], rows)
+    return 0 if all(row[-1] == "yes" for row in rows) else 1
+
+
+FORMAT_SAMPLES = {
+    "uuid": "6f1c1b7a-1111-4a4a-9a9a-123456789abc",
+    "date": "2026-01-31",
+    "date-time": "2026-01-31T12:00:00Z",
+    "email": "person@example.com",
+    "uri": "https://example.com/resource",
+}
+
+
+def synthetic_instance(documents: Dict[str, object], schema: object, base: str, rng: random.Random, depth: int = 0) -> object:
+    """A document shaped like schema: required properties always, optional ones at random."""
+    if not isinstance(schema, dict):
+        return {}
+    if "$ref" in schema:
+        from urllib.parse import urldefrag, urljoin
+
+        target, fragment = urldefrag(urljoin(base, schema["$ref"]))
+        node = documents.get(target, {})
+        for token in filter(None, fragment.split("/")):
+            node = node.get(token, {}) if isinstance(node, dict) else {}
+        return synthetic_instance(documents, node, target, rng, depth + 1)
+    if "const" in schema:
+        return schema["const"]
+    if "enum" in schema:
+        return rng.choice(schema["enum"])
+    for combinator in ("anyOf", "oneOf"):
+        if combinator in schema:
+            return synthetic_instance(documents, schema[combinator][0], base, rng, depth + 1)
+    kind = schema.get("type", "object" if "properties" in schema else "string")
+    if isinstance(kind, list):
+        kind = next((name for name in kind if name != "null"), "null")
+    if kind == "object":
+        properties = schema.get("properties") or {}
+        required = set(schema.get("required") or [])
+        return {
+            name: synthetic_instance(documents, sub, base, rng, depth + 1)
+            for name, sub in properties.items()
+            if name in required or (depth < 3 and rng.random() < 0.5)
+        }
+    if kind == "array":
+        return [synthetic_instance(documents, schema.get("items", {}), base, rng, depth + 1) for _ in range(rng.randint(0, 3) if depth < 3 else 0)]
+    if kind in ("integer", "number"):
+        low = schema.get("minimum", 0)
+        value = low + rng.randint(0, 20)
+        return min(value, schema.get("maximum", value))
+    if kind == "boolean":
+        return rng.random() < 0.5
+    if kind == "null":
+        return None
+    value = FORMAT_SAMPLES.get(schema.get("format"), "sample text")
+    return value[: schema.get("maxLength", len(value))]
+
+
+def bench_json_schema(args: argparse.Namespace) -> int:
+    gate = load_script("agents/architect/scripts/validate-json-schemas.py")
+    schemas_dir = Path(args.schemas_dir)
+    errors: List[str] = []
+    started = time.perf_counter()
+    schemas = gate.load_schemas(schemas_dir, errors)
+    compile_seconds = time.perf_counter() - started
+    if errors:
+        print("\n".join(errors))
+        return 1
+
+    rng = random.Random(7)
+    documents = schemas.registry.documents
+    batch = [
+        (uri, synthetic_instance(documents, documents[uri], uri, rng))
+        for uri in schemas.by_stem.values()
+        for _ in range(args.documents)
+    ]
+    print(
+        f"{len(schemas.by_stem)} schemas compiled in {compile_seconds * 1000:.1f} ms; "
+        f"{len(batch):,} synthetic documents ({args.documents} per schema)"
+    )
+    print("-" * 60)
+
+    def compile_per_document() -> List[int]:
+        counts = []
+        for uri, document in batch:
+            registry = json_schema.SchemaRegistry()
+            for known_uri, known in documents.items():
+                registry.add(known, schemas.registry.sources[known_uri])
+            counts.append(len(registry.compile(uri).validate(document)))
+        return counts
+
+    def compiled_once() -> List[int]:
+        return [len(schemas.validator(uri).validate(document)) for uri, document in batch]
+
+    rows = []
+    baseline_seconds = None
+    baseline_counts = None
+    for label, strategy in (("compile per document", compile_per_document), ("compiled once, reused", compiled_once)):
+        started = time.perf_counter()
+        counts = strategy()
+        elapsed = time.perf_counter() - started
+        if baseline_seconds is None:
+            baseline_seconds, baseline_counts = elapsed, counts
+        rows.append([
+            label,
+            f"{elapsed * 1000:.1f} ms",
+            f"{len(batch) / elapsed:,.0f}",
+            f"{baseline_seconds / elapsed:.1f}x",
+            f"{sum(1 for count in counts if count):,}",
+            "yes" if counts == baseline_counts else "NO",
+        ])
+    print_table(["strategy", "total", "validations/s", "speedup", "invalid docs", "identical"], rows)
+    return 0 if all(row[-1] == "yes" for row in rows) else 1
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark framework gate and validation scripts")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    gate_modes = subparsers.add_parser(
+        "gate-modes",
+        help="Compare subprocess vs in-process lifecycle gate execution",
+    )
+    gate_modes.add_argument("--stage", default="", help="Lifecycle stage (default: current_stage)")
+    gate_modes.add_argument("--rounds", type=int, default=3, help="Timed rounds per gate and mode")
+    gate_modes.set_defaults(handler=bench_gate_modes)
+
+    sections = subparsers.add_parser(
+        "sections",
+        help="Compare per-lookup regex section extraction vs the markdown heading index",
+    )
+    sections.add_argument("--features-dir", default="planning-mds/features", help="Markdown tree to scan")
+    sections.add_argument(
+        "--all-titles",
+        action="store_true",
+        help="Look up every heading title in the tree (slow; exhaustive equivalence check)",
+    )
+    sections.set_defaults(handler=bench_sections)
+
+    story_jobs = subparsers.add_parser(
+        "story-jobs",
+        help="Time validate-stories.py --jobs values over a synthetic story corpus",
+    )
+    story_jobs.add_argument("--stories", type=int, default=10000, help="Synthetic stories to generate")
+    story_jobs.add_argument(
+        "--jobs",
+        type=int,
+        nargs="+",
+        default=[1, 2, 4, 0],
+        help="--jobs values to compare; the first is the baseline (0 = CPU count)",
+    )
+    story_jobs.add_argument("--features-dir", default="planning-mds/features", help="Template story tree")
+    story_jobs.set_defaults(handler=bench_story_jobs)
+
+    tracker_sizes = subparsers.add_parser(
+        "trackers",
+        help="Measure validate-trackers.py scaling over synthetic planning trees",
+    )
+    tracker_sizes.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[1000, 10000, 50000],
+        help="Story counts to generate",
+    )
+    tracker_sizes.set_defaults(handler=bench_trackers)
+
+    story_headers = subparsers.add_parser(
+        "story-headers",
+        help="Compare story header metadata extractors over the features tree",
+    )
+    story_headers.add_argument("--features-dir", default="planning-mds/features", help="Markdown tree to scan")
+    story_headers.add_argument("--rounds", type=int, default=20, help="Passes over the story files")
+    story_headers.set_defaults(handler=bench_story_headers)
+
+    genericness_terms = subparsers.add_parser(
+        "genericness-terms",
+        help="Compare the genericness regex alternation vs the Aho-Corasick automaton by glossary size",
+    )
+    genericness_terms.add_argument("--agents-dir", default="agents", help="Directory to scan")
+    genericness_terms.add_argument(
+        "--glossary", default="planning-mds/domain/glossary.md", help="Glossary with the real blocked terms"
+    )
+    genericness_terms.add_argument(
+        "--sizes", type=int, nargs="+", default=[10, 100, 1000], help="Blocked term counts to test"
+    )
+    genericness_terms.set_defaults(handler=bench_genericness_terms)
+
+    genericness_tree = subparsers.add_parser(
+        "genericness-tree",
+        help="Compare decoded vs memory-mapped genericness scans as copies of agents/ pile up",
+    )
+    genericness_tree.add_argument("--agents-dir", default="agents", help="Directory to copy and scan")
+    genericness_tree.add_argument(
+        "--glossary", default="planning-mds/domain/glossary.md", help="Glossary with the blocked terms"
+    )
+    genericness_tree.add_argument(
+        "--copies", type=int, nargs="+", default=[1, 10, 50], help="Copies of the agents directory to scan"
+    )
+    genericness_tree.add_argument(
+        "--jobs", type=int, default=0, help="Worker processes for the pooled scan (0 = CPU count)"
+    )
+    genericness_tree.set_defaults(handler=bench_genericness_tree)
+
+    skill_routing = subparsers.add_parser(
+        "skill-routing",
+        help="Compare per-pair route_score() routing vs the inverted-index SkillRouter (weights and BM25)",
+    )
+    skill_routing.add_argument("--skills-dir", default="agents", help="Directory containing skill folders")
+    skill_routing.add_argument(
+        "--cases", default="agents/scripts/skill-regression-cases.yaml", help="Golden routing cases"
+    )
+    skill_routing.add_argument("--prompts", type=int, default=10000, help="Synthetic prompts to route")
+    skill_routing.set_defaults(handler=bench_skill_routing)
+
+    skill_parse = subparsers.add_parser(
+        "skill-parse",
+        help="Time SKILL.md discovery: safe_load vs the fast loader, cold and warm parse cache",
+    )
+    skill_parse.add_argument("--skills-dir", default="agents", help="Directory with template skill folders")
+    skill_parse.add_argument("--skills", type=int, default=500, help="Synthetic skills to generate")
+    skill_parse.set_defaults(handler=bench_skill_parse)
+
+    openapi_load = subparsers.add_parser(
+        "openapi-load",
+        help="Time OpenAPI spec loading: safe_load vs the shared loader, cold and warm",
+    )
+    openapi_load.add_argument("--spec", default="planning-mds/api/nebula-api.yaml", help="OpenAPI YAML to load")
+    openapi_load.add_argument("--rounds", type=int, default=5, help="Repetitions per loader (best is shown)")
+    openapi_load.set_defaults(handler=bench_openapi_load)
+
+    openapi_refs = subparsers.add_parser(
+        "openapi-refs",
+        help="Time $ref resolution on a synthetic spec: root walks vs the pre-resolved ref graph",
+    )
+    openapi_refs.add_argument("--operations", type=int, default=2000, help="Operations in the synthetic spec")
+    openapi_refs.add_argument("--rounds", type=int, default=5, help="Repetitions per strategy (best is shown)")
+    openapi_refs.set_defaults(handler=bench_openapi_refs)
+
+
+    json_schema_parser = subparsers.add_parser(
+        "json-schema",
+        help="Validations/s of compiled JSON Schema validators vs compiling per document",
+    )
+    json_schema_parser.add_argument("--schemas-dir", default="planning-mds/schemas", help="Directory of *.schema.json files")
+    json_schema_parser.add_argument("--documents", type=int, default=200, help="Synthetic documents per schema")
+    json_schema_parser.set_defaults(handler=bench_json_schema)
+
+    args = parser.parse_args()
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
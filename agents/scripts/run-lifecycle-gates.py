@@ -6,18 +6,124 @@ Usage:
     python3 agents/scripts/run-lifecycle-gates.py
     python3 agents/scripts/run-lifecycle-gates.py --list
     python3 agents/scripts/run-lifecycle-gates.py --stage planning
+    python3 agents/scripts/run-lifecycle-gates.py --jobs 4
+    python3 agents/scripts/run-lifecycle-gates.py --no-cache
+    python3 agents/scripts/run-lifecycle-gates.py --cache-dir /tmp/gate-cache
+    python3 agents/scripts/run-lifecycle-gates.py --in-process
+    python3 agents/scripts/run-lifecycle-gates.py --report-json gates.json --report-junit gates.xml
+    python3 agents/scripts/run-lifecycle-gates.py --profile --profile-top 10
+    python3 agents/scripts/run-lifecycle-gates.py --since origin/main
+    python3 agents/scripts/run-lifecycle-gates.py --watch
+
+Gates may declare `depends_on` (a list of gate names). With `--jobs N` the
+runner executes up to N independent gates at once; a gate starts only after
+its dependencies that are part of the same stage have passed. Gate output is
+buffered and printed in `required_gates` order regardless of completion order.
+
+Gates may also declare `inputs` (repo-relative glob patterns). Such gates are
+cached by content: the runner hashes the matched files, which directories the
+patterns name exist, the command (plus any command argument that is a file)
+and the interpreter version, and replays a
+stored PASS/FAIL with its output when nothing changed. Gates without `inputs`
+always run.
+
+With `--in-process`, gates whose command is `python3 <script>.py ...` are
+imported and their `main()` is called with a patched `sys.argv`, so the
+interpreter and shared modules (yaml, re, pathlib) load once per run. Other
+gates, and scripts without a `main()`, fall back to a subprocess.
+
+Each gate reports wall time, user/sys CPU and (for subprocess gates) peak RSS,
+taken from the child's rusage. `--report-json` / `--report-junit` persist the
+per-gate numbers; `--profile` runs Python gates under cProfile and prints a
+top-N hotspot table per gate.
+
+`--since <ref>` takes the changed-path list from one `git diff --name-only
+<ref>` call and skips gates whose declared inputs (and command files) did not
+change. Gates without `inputs` always run, and any change to the lifecycle
+config reruns every gate.
+
+`--watch` stays resident: it runs the stage once in-process, then polls the
+gates' input files and, after a short debounce window, reruns only the gates
+whose inputs changed. Imported modules stay warm between runs, so single-file
+edits report back in well under a second; when a repo-local helper module
+(openapi_spec, markdown_corpus, ...) changes on disk, every repo-local module
+is evicted so the rerun imports the new code.
 """
 
 import argparse
+import ast
+import contextlib
+import cProfile
+import functools
+import hashlib
+import importlib.util
+import io
+import json
+import os
+import platform
+import pstats
+import re
+import shutil
 import subprocess
 import sys
+import time
+import traceback
+import xml.etree.ElementTree as ET
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 import yaml
 
+try:
+    import resource
+except ImportError:  # Windows: per-gate CPU/RSS accounting is unavailable.
+    resource = None
+
 
 DEFAULT_CONFIG_PATH = Path("lifecycle-stage.yaml")
+DEFAULT_CACHE_DIR = Path(".cache/lifecycle-gates")
+CACHE_FORMAT_VERSION = 2
+DEFAULT_PROFILE_DIR = Path(".cache/lifecycle-gates/profiles")
+DEFAULT_PROFILE_TOP = 15
+WATCH_POLL_SECONDS = 0.1
+# Input globs are re-expanded (to see added files) this often; in between only
+# the already-resolved files are stat()ed.
+WATCH_RESCAN_SECONDS = 2.0
+DEFAULT_WATCH_DEBOUNCE = 0.25
+# Profiles `python3 <script> args` and keeps the script's exit status, which
+# `python3 -m cProfile` would swallow.
+PROFILE_BOOTSTRAP = (
+    "import cProfile, os, runpy, sys\n"
+    "output_path, sys.argv = sys.argv[1], sys.argv[2:]\n"
+    "sys.path.insert(0, os.path.dirname(os.path.abspath(sys.argv[0])))\n"
+    "profiler = cProfile.Profile()\n"
+    "try:\n"
+    "    profiler.runcall(runpy.run_path, sys.argv[0], run_name='__main__')\n"
+    "finally:\n"
+    "    profiler.dump_stats(output_path)\n"
+)
+PYTHON_EXECUTABLE_RE = re.compile(r"python(\d+(\.\d+)?)?(\.exe)?")
+
+
+@dataclass
+class GateResult:
+    name: str
+    status: str  # PASS | FAIL | SKIP
+    returncode: int
+    output: bytes
+    wall_seconds: float = 0.0
+    user_seconds: float = 0.0
+    system_seconds: float = 0.0
+    peak_rss_kb: Optional[int] = None
+    detail: str = ""
+    cache: str = ""  # hit | miss | "" (gate not cacheable)
+    profile: str = ""
+
+    @property
+    def cpu_seconds(self) -> float:
+        return self.user_seconds + self.system_seconds
 
 
 def load_config(path: Path) -> Dict:
@@ -45,6 +151,10 @@ def load_config(path: Path) -> Dict:
     return data
 
 
+def gate_dependencies(gate_config: Dict) -> List[str]:
+    return list(gate_config.get("depends_on") or [])
+
+
 def validate_gate_definitions(config: Dict) -> None:
     gates = config["gates"]
     for gate_name, gate in gates.items():
@@ -57,6 +167,45 @@ def validate_gate_definitions(config: Dict) -> None:
                 f"Gate '{gate_name}' must define non-empty string list field 'command'"
             )
 
+        depends_on = gate.get("depends_on", [])
+        if depends_on is None:
+            depends_on = []
+        if not isinstance(depends_on, list) or not all(isinstance(d, str) for d in depends_on):
+            raise ValueError(f"Gate '{gate_name}' field 'depends_on' must be a list of gate names")
+        unknown = [d for d in depends_on if d not in gates]
+        if unknown:
+            raise ValueError(f"Gate '{gate_name}' depends on unknown gates: {', '.join(unknown)}")
+        if gate_name in depends_on:
+            raise ValueError(f"Gate '{gate_name}' cannot depend on itself")
+
+        inputs = gate.get("inputs", [])
+        if inputs is None:
+            inputs = []
+        if not isinstance(inputs, list) or not all(isinstance(i, str) and i.strip() for i in inputs):
+            raise ValueError(f"Gate '{gate_name}' field 'inputs' must be a list of glob patterns")
+
+    check_dependency_cycles(gates)
+
+
+def check_dependency_cycles(gates: Dict) -> None:
+    visiting: Set[str] = set()
+    visited: Set[str] = set()
+
+    def visit(gate_name: str, trail: List[str]) -> None:
+        if gate_name in visited:
+            return
+        if gate_name in visiting:
+            cycle = trail[trail.index(gate_name):] + [gate_name]
+            raise ValueError(f"Gate dependency cycle detected: {' -> '.join(cycle)}")
+        visiting.add(gate_name)
+        for dependency in gate_dependencies(gates[gate_name]):
+            visit(dependency, trail + [gate_name])
+        visiting.discard(gate_name)
+        visited.add(gate_name)
+
+    for gate_name in gates:
+        visit(gate_name, [])
+
 
 def resolve_stage(config: Dict, override_stage: str) -> Tuple[str, Dict]:
     stages = config["stages"]
@@ -83,14 +232,491 @@ def print_stage_matrix(config: Dict) -> None:
         required = stage.get("required_gates", [])
         print(f"{stage_name}: {description}")
         for gate in required:
-            print(f"  - {gate}")
+            depends_on = gate_dependencies(config["gates"].get(gate, {}))
+            suffix = f" (after: {', '.join(depends_on)})" if depends_on else ""
+            print(f"  - {gate}{suffix}")
         if not required:
             print("  - (none)")
     print("-" * 60)
     print(f"Current stage: {config['current_stage']}")
 
 
-def run_gate(repo_root: Path, gate_name: str, gate_config: Dict) -> int:
+@dataclass
+class ResourceUsage:
+    user_seconds: float = 0.0
+    system_seconds: float = 0.0
+    peak_rss_kb: Optional[int] = None
+
+
+def child_usage(usage: object) -> ResourceUsage:
+    peak_rss = int(usage.ru_maxrss)
+    if sys.platform == "darwin":
+        peak_rss //= 1024  # macOS reports bytes; Linux reports kilobytes.
+    return ResourceUsage(usage.ru_utime, usage.ru_stime, peak_rss)
+
+
+def run_command(repo_root: Path, command: List[str]) -> Tuple[int, bytes, ResourceUsage]:
+    """
+    Run a gate command with stdout/stderr buffered together.
+
+    Returns (exit code, combined output, child resource usage). CPU time and
+    peak RSS come from the child's own rusage where os.wait4 is available
+    (POSIX); elsewhere only the exit code and output are reported.
+    """
+    try:
+        process = subprocess.Popen(
+            command,
+            cwd=repo_root,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+        )
+    except OSError as exc:
+        message = f"[ERROR] Could not start gate command: {exc}\n".encode("utf-8")
+        return 127, message, ResourceUsage()
+
+    with process.stdout:
+        output = process.stdout.read()
+
+    if hasattr(os, "wait4"):
+        _, status, usage = os.wait4(process.pid, 0)
+        # Tell Popen the child is reaped so it does not wait on it again.
+        process.returncode = os.waitstatus_to_exitcode(status)
+        return process.returncode, output, child_usage(usage)
+
+    return process.wait(), output, ResourceUsage()
+
+
+def profile_report(profile_path: Path, top: int) -> str:
+    """Render the top-N functions of a cProfile dump by internal (self) time."""
+    try:
+        stats = pstats.Stats(str(profile_path), stream=io.StringIO())
+    except (OSError, TypeError, ValueError) as exc:
+        return f"  [PROFILE] could not read {profile_path}: {exc}\n"
+
+    rows = sorted(stats.stats.items(), key=lambda item: item[1][2], reverse=True)[:top]
+    lines = [
+        f"  [PROFILE] top {len(rows)} hotspots by self time ({profile_path})",
+        f"    {'tottime':>8}  {'cumtime':>8}  {'calls':>9}  function",
+    ]
+    for (filename, line_number, function), (primitive, total, tottime, cumtime, _) in rows:
+        calls = str(total) if total == primitive else f"{total}/{primitive}"
+        location = f"{Path(filename).name}:{line_number}" if line_number else filename
+        lines.append(f"    {tottime:8.4f}  {cumtime:8.4f}  {calls:>9}  {location}({function})")
+    return "\n".join(lines) + "\n"
+
+
+def run_gate(
+    repo_root: Path,
+    gate_name: str,
+    gate_config: Dict,
+    profile_dir: Optional[Path] = None,
+    profile_top: int = DEFAULT_PROFILE_TOP,
+) -> GateResult:
+    command = gate_config["command"]
+    profile_path = None
+    if profile_dir is not None and python_gate_script(repo_root, command) is not None:
+        profile_dir.mkdir(parents=True, exist_ok=True)
+        profile_path = profile_dir / f"{gate_name}.prof"
+        command = [command[0], "-c", PROFILE_BOOTSTRAP, str(profile_path)] + command[1:]
+
+    started = time.perf_counter()
+    returncode, output, usage = run_command(repo_root, command)
+    return GateResult(
+        name=gate_name,
+        status="PASS" if returncode == 0 else "FAIL",
+        returncode=returncode,
+        output=output,
+        wall_seconds=time.perf_counter() - started,
+        user_seconds=usage.user_seconds,
+        system_seconds=usage.system_seconds,
+        peak_rss_kb=usage.peak_rss_kb,
+        profile=profile_report(profile_path, profile_top) if profile_path else "",
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def glob_to_regex(pattern: str) -> "re.Pattern[str]":
+    """
+    Translate a repo-relative glob into a regex over POSIX paths.
+
+    Mirrors pathlib.Path.glob: `*`, `?` and `[...]` stay within one path
+    segment and a `**` segment matches zero or more directories.
+    """
+    segments = pattern.strip("/").split("/")
+    parts = []
+    for index, segment in enumerate(segments):
+        is_last = index == len(segments) - 1
+        if segment == "**":
+            parts.append(".*" if is_last else "(?:[^/]+/)*")
+            continue
+        i = 0
+        while i < len(segment):
+            char = segment[i]
+            if char == "*":
+                parts.append("[^/]*")
+            elif char == "?":
+                parts.append("[^/]")
+            elif char == "[" and "]" in segment[i + 2:]:
+                end = segment.index("]", i + 2)
+                body = segment[i + 1:end]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                parts.append(f"[{body.replace(chr(92), chr(92) * 2)}]")
+                i = end
+            else:
+                parts.append(re.escape(char))
+            i += 1
+        if not is_last:
+            parts.append("/")
+    return re.compile("".join(parts))
+
+
+def gate_is_affected(gate_config: Dict, changed_paths: List[str]) -> bool:
+    patterns = [glob_to_regex(pattern) for pattern in gate_config.get("inputs") or []]
+    command_files = set(gate_config["command"][1:])
+    for path in changed_paths:
+        if path in command_files or any(regex.fullmatch(path) for regex in patterns):
+            return True
+    return False
+
+
+def git_changed_paths(repo_root: Path, ref: str) -> List[str]:
+    completed = subprocess.run(
+        ["git", "diff", "--name-only", ref, "--"],
+        cwd=repo_root,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if completed.returncode != 0:
+        raise ValueError(f"git diff --name-only {ref} failed: {completed.stderr.strip()}")
+    return [line.strip() for line in completed.stdout.splitlines() if line.strip()]
+
+
+def select_changed_gates(
+    gate_names: List[str], gates: Dict, changed_paths: List[str], config_path: str
+) -> Tuple[List[str], Dict[str, str]]:
+    """Split gates into those to run and those skipped (with a reason)."""
+    if config_path in changed_paths:
+        return list(gate_names), {}
+
+    selected: List[str] = []
+    skipped: Dict[str, str] = {}
+    for name in gate_names:
+        if not gates[name].get("inputs"):
+            selected.append(name)
+        elif gate_is_affected(gates[name], changed_paths):
+            selected.append(name)
+        else:
+            skipped[name] = "no declared inputs changed"
+    return selected, skipped
+
+
+def python_gate_script(repo_root: Path, command: List[str]) -> Optional[Path]:
+    """Return the script path when a gate command is `python3 <script>.py ...`."""
+    if len(command) < 2 or not PYTHON_EXECUTABLE_RE.fullmatch(Path(command[0]).name):
+        return None
+    script = repo_root / command[1]
+    if script.suffix != ".py" or not script.is_file():
+        return None
+    return script
+
+
+def defines_main(script: Path) -> bool:
+    """Whether the script binds a top-level `main`, checked without executing it."""
+    stat = script.stat()
+    return _defines_main(str(script), stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=None)
+def _defines_main(path: str, mtime_ns: int, size: int) -> bool:
+    try:
+        tree = ast.parse(Path(path).read_bytes(), filename=path)
+    except (OSError, SyntaxError, ValueError):
+        return False  # the subprocess run reports the problem
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)) and node.name == "main":
+            return True
+        if isinstance(node, (ast.Import, ast.ImportFrom)) and any(
+            (alias.asname or alias.name) == "main" for alias in node.names
+        ):
+            return True
+        if isinstance(node, ast.Assign) and any(
+            isinstance(target, ast.Name) and target.id == "main" for target in node.targets
+        ):
+            return True
+    return False
+
+
+def exit_code_from(code: object, stream: io.StringIO) -> int:
+    """Map a SystemExit code to a process exit status like the interpreter does."""
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=stream)
+    return 1
+
+
+def thread_usage() -> ResourceUsage:
+    if resource is not None and hasattr(resource, "RUSAGE_THREAD"):
+        usage = resource.getrusage(resource.RUSAGE_THREAD)
+        return ResourceUsage(usage.ru_utime, usage.ru_stime)
+    return ResourceUsage(time.thread_time(), 0.0)
+
+
+def run_gate_in_process(
+    repo_root: Path,
+    gate_name: str,
+    gate_config: Dict,
+    profile_dir: Optional[Path] = None,
+    profile_top: int = DEFAULT_PROFILE_TOP,
+) -> Optional[GateResult]:
+    """
+    Import a Python gate script and call its main() in this interpreter.
+
+    Returns None when the gate cannot run in-process (non-Python command or no
+    top-level main()), so the caller falls back to a subprocess. main() is
+    looked up in the script's syntax tree first, so a script without one is
+    never executed twice. Must run on the main
+    thread: it swaps process-wide state (cwd, sys.argv, sys.path, stdout).
+    Peak RSS is not reported because the interpreter is shared across gates.
+    """
+    command = gate_config["command"]
+    script = python_gate_script(repo_root, command)
+    if script is None or not defines_main(script):
+        return None
+
+    profiler = cProfile.Profile() if profile_dir is not None else None
+    stream = io.StringIO()
+    saved_argv, saved_path, saved_cwd = sys.argv, list(sys.path), os.getcwd()
+    module_name = "_lifecycle_gate_" + re.sub(r"\W", "_", script.stem)
+    started = time.perf_counter()
+    usage_started = thread_usage()
+    try:
+        os.chdir(repo_root)
+        sys.argv = [command[1]] + command[2:]
+        sys.path.insert(0, str(script.parent))
+        # A StringIO has no .buffer, so gate scripts skip their stdout re-wrap.
+        with contextlib.redirect_stdout(stream), contextlib.redirect_stderr(stream):
+            try:
+                spec = importlib.util.spec_from_file_location(module_name, script)
+                module = importlib.util.module_from_spec(spec)
+                # Registered so gates that use a process pool can pickle their worker functions.
+                sys.modules[module_name] = module
+                spec.loader.exec_module(module)
+                entry_point = getattr(module, "main", None)
+                if not callable(entry_point):
+                    # The script already ran its top-level code; running it again would repeat it.
+                    print(f"[FAIL] {command[1]}: main is not callable")
+                    returncode = 1
+                elif profiler is not None:
+                    outcome = profiler.runcall(entry_point)
+                    returncode = outcome if isinstance(outcome, int) else 0
+                else:
+                    outcome = entry_point()
+                    returncode = outcome if isinstance(outcome, int) else 0
+            except SystemExit as exc:
+                returncode = exit_code_from(exc.code, stream)
+            except Exception:
+                traceback.print_exc()
+                returncode = 1
+    finally:
+        sys.modules.pop(module_name, None)
+        sys.argv = saved_argv
+        sys.path[:] = saved_path
+        os.chdir(saved_cwd)
+
+    usage_finished = thread_usage()
+    report = ""
+    if profiler is not None:
+        profile_dir.mkdir(parents=True, exist_ok=True)
+        profile_path = profile_dir / f"{gate_name}.prof"
+        profiler.dump_stats(str(profile_path))
+        report = profile_report(profile_path, profile_top)
+
+    return GateResult(
+        name=gate_name,
+        status="PASS" if returncode == 0 else "FAIL",
+        returncode=returncode,
+        output=stream.getvalue().encode("utf-8"),
+        wall_seconds=time.perf_counter() - started,
+        user_seconds=usage_finished.user_seconds - usage_started.user_seconds,
+        system_seconds=usage_finished.system_seconds - usage_started.system_seconds,
+        detail="in-process",
+        profile=report,
+    )
+
+
+def run_gate_with_mode(
+    repo_root: Path,
+    gate_name: str,
+    gate_config: Dict,
+    in_process: bool,
+    profile_dir: Optional[Path] = None,
+    profile_top: int = DEFAULT_PROFILE_TOP,
+) -> GateResult:
+    if in_process:
+        result = run_gate_in_process(repo_root, gate_name, gate_config, profile_dir, profile_top)
+        if result is not None:
+            return result
+    return run_gate(repo_root, gate_name, gate_config, profile_dir, profile_top)
+
+
+def gate_input_files(repo_root: Path, gate_config: Dict) -> List[Path]:
+    files = set()
+    for pattern in gate_config.get("inputs") or []:
+        files.update(path for path in repo_root.glob(pattern) if path.is_file())
+    # Gate scripts and argument files are implicit inputs.
+    for arg in gate_config["command"][1:]:
+        candidate = repo_root / arg
+        if candidate.is_file():
+            files.add(candidate)
+    return sorted(files)
+
+
+def gate_input_dirs(repo_root: Path, gate_config: Dict) -> List[str]:
+    """
+    Existing directories named by a gate's input patterns, repo-relative.
+
+    Gates may check that a directory exists (e.g. an empty .gitlab/), which
+    the matched files alone do not show: this covers each pattern's literal
+    leading path ('.gitlab' for '.gitlab/**/*') and directories it matches.
+    """
+    dirs = set()
+    for pattern in gate_config.get("inputs") or []:
+        parts = Path(pattern).parts
+        literal = []
+        for part in parts:
+            if any(char in part for char in "*?["):
+                break
+            literal.append(part)
+        if literal and (repo_root.joinpath(*literal)).is_dir():
+            dirs.add(Path(*literal).as_posix())
+        if len(literal) < len(parts):
+            dirs.update(
+                path.relative_to(repo_root).as_posix() for path in repo_root.glob(pattern) if path.is_dir()
+            )
+    return sorted(dirs)
+
+
+class GateCache:
+    """Content-addressed store of gate results under a local directory."""
+
+    def __init__(self, repo_root: Path, cache_dir: Path):
+        self.repo_root = repo_root
+        self.cache_dir = cache_dir
+
+    def key(self, gate_config: Dict) -> str:
+        digest = hashlib.sha256()
+        header = {
+            "format": CACHE_FORMAT_VERSION,
+            "command": gate_config["command"],
+            "executable": shutil.which(gate_config["command"][0]) or gate_config["command"][0],
+            "python": platform.python_version(),
+            "pyyaml": getattr(yaml, "__version__", ""),
+        }
+        digest.update(json.dumps(header, sort_keys=True).encode("utf-8"))
+        for path in gate_input_files(self.repo_root, gate_config):
+            digest.update(path.relative_to(self.repo_root).as_posix().encode("utf-8") + b"\0")
+            digest.update(hashlib.sha256(path.read_bytes()).digest())
+        for directory in gate_input_dirs(self.repo_root, gate_config):
+            digest.update(b"dir\0" + directory.encode("utf-8") + b"\0")
+        return digest.hexdigest()
+
+    def entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def load(self, gate_name: str, key: str) -> Optional[GateResult]:
+        try:
+            entry = json.loads(self.entry_path(key).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if entry.get("gate") != gate_name or entry.get("status") not in {"PASS", "FAIL"}:
+            return None
+        return GateResult(
+            name=gate_name,
+            status=entry["status"],
+            returncode=int(entry.get("returncode", 1)),
+            output=str(entry.get("output", "")).encode("utf-8"),
+            detail=f"replayed {key[:12]}",
+            cache="hit",
+        )
+
+    def store(self, key: str, result: GateResult) -> None:
+        entry = {
+            "gate": result.name,
+            "status": result.status,
+            "returncode": result.returncode,
+            "output": result.output.decode("utf-8", errors="replace"),
+            "wall_seconds": round(result.wall_seconds, 4),
+            "user_seconds": round(result.user_seconds, 4),
+            "system_seconds": round(result.system_seconds, 4),
+            "peak_rss_kb": result.peak_rss_kb,
+        }
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # Write-then-rename so concurrent runners never read a partial entry.
+        temp_path = self.entry_path(key).with_suffix(f".{os.getpid()}.tmp")
+        temp_path.write_text(json.dumps(entry), encoding="utf-8")
+        os.replace(temp_path, self.entry_path(key))
+
+
+def execute_gate(
+    repo_root: Path,
+    gate_name: str,
+    gate_config: Dict,
+    cache: Optional[GateCache],
+    in_process: bool = False,
+    profile_dir: Optional[Path] = None,
+    profile_top: int = DEFAULT_PROFILE_TOP,
+) -> GateResult:
+    if cache is None or not gate_config.get("inputs"):
+        return run_gate_with_mode(
+            repo_root, gate_name, gate_config, in_process, profile_dir, profile_top
+        )
+
+    started = time.perf_counter()
+    key = cache.key(gate_config)
+    cached = cache.load(gate_name, key)
+    if cached is not None:
+        cached.wall_seconds = time.perf_counter() - started
+        return cached
+
+    result = run_gate_with_mode(
+        repo_root, gate_name, gate_config, in_process, profile_dir, profile_top
+    )
+    result.cache = "miss"
+    try:
+        cache.store(key, result)
+    except OSError as exc:
+        result.output += f"[WARN] Could not write gate cache entry: {exc}\n".encode("utf-8")
+    return result
+
+
+def write_output(data: bytes) -> None:
+    # Gate scripts emit UTF-8; pass their bytes through untouched.
+    sys.stdout.flush()
+    if hasattr(sys.stdout, "buffer"):
+        sys.stdout.buffer.write(data)
+        sys.stdout.buffer.flush()
+    else:
+        sys.stdout.write(data.decode("utf-8", errors="replace"))
+
+
+def format_timing(result: GateResult) -> str:
+    if result.cache == "hit":
+        return "cached"
+    parts = [
+        f"{result.wall_seconds:.2f}s wall",
+        f"{result.user_seconds:.2f}s user",
+        f"{result.system_seconds:.2f}s sys",
+    ]
+    if result.peak_rss_kb is not None:
+        parts.append(f"{result.peak_rss_kb / 1024:.1f} MiB peak RSS")
+    return ", ".join(parts)
+
+
+def print_gate_result(gate_name: str, gate_config: Dict, result: GateResult) -> None:
     description = gate_config.get("description", "")
     command = gate_config["command"]
 
@@ -99,12 +725,308 @@ def run_gate(repo_root: Path, gate_name: str, gate_config: Dict) -> int:
         print(f"  {description}")
     print(f"  command: {' '.join(command)}")
 
-    completed = subprocess.run(command, cwd=repo_root, check=False)
-    if completed.returncode == 0:
-        print(f"[PASS] {gate_name}\n")
+    if result.status == "SKIP":
+        print(f"[SKIP] {gate_name} ({result.detail})\n")
+        return
+
+    if result.cache == "hit":
+        print(f"  [CACHE] hit: inputs unchanged, {result.detail}")
+    write_output(result.output)
+    if result.profile:
+        write_output(result.profile.encode("utf-8"))
+    timing = format_timing(result)
+    if result.status == "PASS":
+        print(f"[PASS] {gate_name} ({timing})\n")
     else:
-        print(f"[FAIL] {gate_name} (exit code {completed.returncode})\n")
-    return completed.returncode
+        print(f"[FAIL] {gate_name} (exit code {result.returncode}, {timing})\n")
+
+
+def run_gates(
+    repo_root: Path,
+    gate_names: List[str],
+    gates: Dict,
+    jobs: int,
+    cache: Optional[GateCache] = None,
+    in_process: bool = False,
+    profile_dir: Optional[Path] = None,
+    profile_top: int = DEFAULT_PROFILE_TOP,
+) -> Dict[str, GateResult]:
+    """
+    Execute gates with up to `jobs` running at once, honoring `depends_on`.
+
+    Dependencies outside `gate_names` only order gates; they are not pulled
+    into the run. A gate whose dependency did not pass is skipped. Results are
+    printed in `gate_names` order as soon as each prefix of the list is final.
+    In-process gates run one at a time on the calling thread while subprocess
+    gates keep running on the pool.
+    """
+    selected = set(gate_names)
+    dependencies = {
+        name: [d for d in gate_dependencies(gates[name]) if d in selected]
+        for name in gate_names
+    }
+    inline = {
+        name for name in gate_names
+        if in_process and python_gate_script(repo_root, gates[name]["command"]) is not None
+    }
+    results: Dict[str, GateResult] = {}
+    running: Dict[Future, str] = {}
+    printed = 0
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        while len(results) < len(gate_names):
+            inline_ready: Optional[str] = None
+            for name in gate_names:
+                if name in results or name in running.values():
+                    continue
+                if any(d not in results for d in dependencies[name]):
+                    continue
+                blocked = [d for d in dependencies[name] if results[d].status != "PASS"]
+                if blocked:
+                    results[name] = GateResult(
+                        name=name,
+                        status="SKIP",
+                        returncode=1,
+                        output=b"",
+                        detail=f"dependency did not pass: {', '.join(blocked)}",
+                    )
+                    continue
+                if name in inline:
+                    inline_ready = inline_ready or name
+                elif len(running) < jobs:
+                    future = executor.submit(
+                        execute_gate, repo_root, name, gates[name], cache,
+                        False, profile_dir, profile_top,
+                    )
+                    running[future] = name
+
+            while printed < len(gate_names) and gate_names[printed] in results:
+                name = gate_names[printed]
+                print_gate_result(name, gates[name], results[name])
+                printed += 1
+
+            if inline_ready is not None:
+                results[inline_ready] = execute_gate(
+                    repo_root, inline_ready, gates[inline_ready], cache,
+                    True, profile_dir, profile_top,
+                )
+                done = [future for future in running if future.done()]
+            elif running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+            else:
+                done = []
+            for future in done:
+                name = running.pop(future)
+                results[name] = future.result()
+
+    while printed < len(gate_names):
+        name = gate_names[printed]
+        print_gate_result(name, gates[name], results[name])
+        printed += 1
+
+    return results
+
+
+def watched_paths(repo_root: Path, gate_names: List[str], gates: Dict) -> List[Path]:
+    """Input files of the given gates, globbed once."""
+    paths: Set[Path] = set()
+    for name in gate_names:
+        paths.update(gate_input_files(repo_root, gates[name]))
+    return sorted(paths)
+
+
+def snapshot_inputs(repo_root: Path, paths: List[Path]) -> Dict[str, Tuple[int, int]]:
+    snapshot: Dict[str, Tuple[int, int]] = {}
+    for path in paths:
+        try:
+            stat = path.stat()
+        except OSError:
+            continue  # deleted: its absence from the snapshot is the change
+        snapshot[path.relative_to(repo_root).as_posix()] = (stat.st_mtime_ns, stat.st_size)
+    return snapshot
+
+
+def repo_module_stamps(repo_root: Path) -> Dict[str, Tuple[str, Optional[Tuple[int, int]]]]:
+    """(file, (mtime, size)) of every imported module whose source lives in the repo."""
+    root = str(repo_root.resolve()) + os.sep
+    stamps: Dict[str, Tuple[str, Optional[Tuple[int, int]]]] = {}
+    for name, module in list(sys.modules.items()):
+        source = getattr(module, "__file__", None)
+        if name == "__main__" or not source:
+            continue
+        source = os.path.abspath(source)
+        if not source.startswith(root) or "site-packages" in source:
+            continue
+        try:
+            stat = os.stat(source)
+            stamps[name] = (source, (stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            stamps[name] = (source, None)
+    return stamps
+
+
+def evict_changed_modules(repo_root: Path, stamps: Dict[str, Tuple[str, Optional[Tuple[int, int]]]]) -> List[str]:
+    """
+    Drop repo-local modules from sys.modules when any of their sources changed.
+
+    All of them go, not only the edited one: a helper that imported names from
+    the edited module would otherwise keep the old objects.
+    """
+    changed = []
+    for name, (source, stamp) in stamps.items():
+        try:
+            stat = os.stat(source)
+            current: Optional[Tuple[int, int]] = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            current = None
+        if current != stamp:
+            changed.append(name)
+    if changed:
+        for name in repo_module_stamps(repo_root):
+            sys.modules.pop(name, None)
+    return sorted(changed)
+
+
+def changed_between(before: Dict[str, Tuple[int, int]], after: Dict[str, Tuple[int, int]]) -> Set[str]:
+    return {path for path in before.keys() | after.keys() if before.get(path) != after.get(path)}
+
+
+def watch_gates(
+    repo_root: Path,
+    gate_names: List[str],
+    gates: Dict,
+    jobs: int,
+    cache: Optional[GateCache],
+    debounce: float,
+) -> int:
+    """
+    Rerun affected gates in-process whenever their input files change.
+
+    Only gates with declared `inputs` (or file arguments) are retriggered;
+    the lifecycle config itself is read once, so restart after editing it.
+    """
+    results = run_gates(repo_root, gate_names, gates, jobs, cache, in_process=True)
+    failing = sorted(name for name, result in results.items() if result.status != "PASS")
+    print(f"[WATCH] initial run: {len(gate_names) - len(failing)}/{len(gate_names)} gate(s) passing")
+    print(f"[WATCH] watching inputs of {len(gate_names)} gate(s); press Ctrl-C to stop")
+
+    modules = repo_module_stamps(repo_root)
+    paths = watched_paths(repo_root, gate_names, gates)
+    next_rescan = time.monotonic() + WATCH_RESCAN_SECONDS
+    snapshot = snapshot_inputs(repo_root, paths)
+    try:
+        while True:
+            time.sleep(WATCH_POLL_SECONDS)
+            if time.monotonic() >= next_rescan:
+                paths = watched_paths(repo_root, gate_names, gates)
+                next_rescan = time.monotonic() + WATCH_RESCAN_SECONDS
+            current = snapshot_inputs(repo_root, paths)
+            changed = changed_between(snapshot, current)
+            if not changed:
+                continue
+
+            detected = time.perf_counter()
+            # Debounce: editors often write a file several times per save.
+            quiet_until = time.monotonic() + debounce
+            while time.monotonic() < quiet_until:
+                time.sleep(min(WATCH_POLL_SECONDS, max(quiet_until - time.monotonic(), 0)))
+                newer = snapshot_inputs(repo_root, paths)
+                if newer != current:
+                    changed |= changed_between(current, newer)
+                    current = newer
+                    quiet_until = time.monotonic() + debounce
+            snapshot = current
+
+            changed_paths = sorted(changed)
+            affected = [name for name in gate_names if gate_is_affected(gates[name], changed_paths)]
+            shown = ", ".join(changed_paths[:5]) + (" ..." if len(changed_paths) > 5 else "")
+            print(f"\n[WATCH] {len(changed_paths)} changed path(s): {shown}")
+            if not affected:
+                print("[WATCH] no gate reads the changed paths")
+                continue
+
+            reloaded = evict_changed_modules(repo_root, modules)
+            if reloaded:
+                print(f"[WATCH] reloading repo modules (changed: {', '.join(reloaded)})")
+            print(f"[WATCH] rerunning: {', '.join(affected)}")
+            print("-" * 60)
+            rerun = run_gates(repo_root, affected, gates, jobs, cache, in_process=True)
+            modules = repo_module_stamps(repo_root)
+            results.update(rerun)
+            failing = sorted(name for name, result in results.items() if result.status != "PASS")
+            latency = time.perf_counter() - detected
+            state = f"FAILING: {', '.join(failing)}" if failing else "all gates passing"
+            print(f"[WATCH] {len(affected)} gate(s) rerun in {latency:.2f}s (incl. debounce); {state}")
+    except KeyboardInterrupt:
+        print("\n[WATCH] stopped")
+    return 1 if failing else 0
+
+
+def write_json_report(
+    path: Path,
+    stage_name: str,
+    gate_names: List[str],
+    results: Dict[str, GateResult],
+    run_info: Dict,
+) -> None:
+    report = dict(run_info)
+    report["stage"] = stage_name
+    report["gates"] = [
+        {
+            "name": name,
+            "status": results[name].status,
+            "returncode": results[name].returncode,
+            "wall_seconds": round(results[name].wall_seconds, 4),
+            "user_seconds": round(results[name].user_seconds, 4),
+            "system_seconds": round(results[name].system_seconds, 4),
+            "peak_rss_kb": results[name].peak_rss_kb,
+            "cache": results[name].cache or None,
+            "detail": results[name].detail,
+        }
+        for name in gate_names
+    ]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+
+def write_junit_report(
+    path: Path,
+    stage_name: str,
+    gate_names: List[str],
+    results: Dict[str, GateResult],
+    wall_seconds: float,
+) -> None:
+    suite_name = f"lifecycle-gates.{stage_name}"
+    suite = ET.Element(
+        "testsuite",
+        name=suite_name,
+        tests=str(len(gate_names)),
+        failures=str(sum(1 for n in gate_names if results[n].status == "FAIL")),
+        skipped=str(sum(1 for n in gate_names if results[n].status == "SKIP")),
+        time=f"{wall_seconds:.3f}",
+    )
+    for name in gate_names:
+        result = results[name]
+        case = ET.SubElement(
+            suite, "testcase", classname=suite_name, name=name, time=f"{result.wall_seconds:.3f}"
+        )
+        properties = ET.SubElement(case, "properties")
+        for key, value in (
+            ("user_seconds", f"{result.user_seconds:.4f}"),
+            ("system_seconds", f"{result.system_seconds:.4f}"),
+            ("peak_rss_kb", "" if result.peak_rss_kb is None else str(result.peak_rss_kb)),
+            ("cache", result.cache),
+        ):
+            ET.SubElement(properties, "property", name=key, value=value)
+        if result.status == "FAIL":
+            failure = ET.SubElement(case, "failure", message=f"exit code {result.returncode}")
+            failure.text = result.output.decode("utf-8", errors="replace")
+        elif result.status == "SKIP":
+            ET.SubElement(case, "skipped", message=result.detail)
+        else:
+            ET.SubElement(case, "system-out").text = result.output.decode("utf-8", errors="replace")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    ET.ElementTree(suite).write(path, encoding="utf-8", xml_declaration=True)
 
 
 def main() -> int:
@@ -124,8 +1046,71 @@ def main() -> int:
         action="store_true",
         help="Print stage/gate matrix and exit",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Maximum gates to run concurrently (0 = one per CPU; default: 1)",
+    )
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="Run `python3 <script>` gates inside this interpreter instead of a subprocess",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always execute gates; do not read or write the gate result cache",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=str(DEFAULT_CACHE_DIR),
+        help=f"Gate result cache directory, relative to the repo root (default: {DEFAULT_CACHE_DIR})",
+    )
+    parser.add_argument(
+        "--since",
+        default="",
+        help="Only run gates whose declared inputs changed since this git ref",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Stay resident and rerun affected gates in-process when their inputs change",
+    )
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        default=DEFAULT_WATCH_DEBOUNCE,
+        help=f"Seconds of quiet required before a --watch rerun (default: {DEFAULT_WATCH_DEBOUNCE})",
+    )
+    parser.add_argument(
+        "--report-json",
+        default="",
+        help="Write per-gate status, wall/user/sys time and peak RSS to this JSON file",
+    )
+    parser.add_argument(
+        "--report-junit",
+        default="",
+        help="Write per-gate results as a JUnit XML test suite to this file",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help=f"Run Python gates under cProfile (dumps to {DEFAULT_PROFILE_DIR}/<gate>.prof); implies --no-cache",
+    )
+    parser.add_argument(
+        "--profile-top",
+        type=int,
+        default=DEFAULT_PROFILE_TOP,
+        help=f"Hotspot rows to print per profiled gate (default: {DEFAULT_PROFILE_TOP})",
+    )
     args = parser.parse_args()
 
+    if args.jobs < 0:
+        print("[ERROR] --jobs must be >= 0")
+        return 2
+    jobs = args.jobs or os.cpu_count() or 1
+
     config_path = Path(args.config)
     repo_root = Path(__file__).resolve().parents[2]
 
@@ -149,19 +1134,125 @@ def main() -> int:
         print(f"[ERROR] Stage '{stage_name}' references unknown gates: {', '.join(unknown_gates)}")
         return 2
 
-    print(f"Running lifecycle gates for stage: {stage_name}")
+    unchanged: Dict[str, str] = {}
+    if args.since:
+        try:
+            changed_paths = git_changed_paths(repo_root, args.since)
+        except (OSError, ValueError) as exc:
+            print(f"[ERROR] {exc}")
+            return 2
+        try:
+            config_rel = config_path.resolve().relative_to(repo_root).as_posix()
+        except ValueError:
+            config_rel = ""
+        selected_gates, unchanged = select_changed_gates(
+            required_gate_names, gates, changed_paths, config_rel
+        )
+    else:
+        selected_gates = list(required_gate_names)
+
+    mode = "in-process" if args.in_process or args.watch else "subprocess"
+    print(f"Running lifecycle gates for stage: {stage_name} (jobs={jobs}, mode={mode})")
+    if args.since:
+        print(f"[SINCE] {args.since}: {len(changed_paths)} changed path(s)")
+        for name in required_gate_names:
+            if name in unchanged:
+                print(f"  - {name}: SKIP ({unchanged[name]})")
+            elif gates[name].get("inputs"):
+                print(f"  - {name}: run (inputs changed)")
+            else:
+                print(f"  - {name}: run (no inputs declared)")
     print("-" * 60)
 
-    failures: List[str] = []
-    for gate_name in required_gate_names:
-        if run_gate(repo_root, gate_name, gates[gate_name]) != 0:
-            failures.append(gate_name)
+    # Profiling needs real executions, so it bypasses cached results.
+    use_cache = not (args.no_cache or args.profile)
+    cache = GateCache(repo_root, repo_root / args.cache_dir) if use_cache else None
+    profile_dir = repo_root / DEFAULT_PROFILE_DIR if args.profile else None
+
+    if args.watch:
+        if args.profile or args.since:
+            print("[ERROR] --watch cannot be combined with --profile or --since")
+            return 2
+        return watch_gates(repo_root, selected_gates, gates, jobs, cache, args.debounce)
+
+    started = time.perf_counter()
+    results = run_gates(
+        repo_root,
+        selected_gates,
+        gates,
+        jobs,
+        cache,
+        args.in_process,
+        profile_dir,
+        args.profile_top,
+    )
+    wall_seconds = time.perf_counter() - started
+    cpu_seconds = sum(result.cpu_seconds for result in results.values())
+
+    for name, reason in unchanged.items():
+        results[name] = GateResult(
+            name=name,
+            status="SKIP",
+            returncode=0,
+            output=b"",
+            detail=f"unchanged since {args.since}: {reason}",
+        )
+
+    if args.report_json:
+        write_json_report(
+            Path(args.report_json),
+            stage_name,
+            required_gate_names,
+            results,
+            {
+                "jobs": jobs,
+                "mode": mode,
+                "since": args.since or None,
+                "wall_seconds": round(wall_seconds, 4),
+                "cpu_seconds": round(cpu_seconds, 4),
+            },
+        )
+    if args.report_junit:
+        write_junit_report(
+            Path(args.report_junit), stage_name, required_gate_names, results, wall_seconds
+        )
+
+    failures = [name for name in required_gate_names if results[name].status == "FAIL"]
+    skipped = [
+        name for name in required_gate_names
+        if results[name].status == "SKIP" and name not in unchanged
+    ]
 
     print("=" * 60)
-    if failures:
+    print(
+        f"[TIMING] wall-clock {wall_seconds:.2f}s vs summed gate CPU {cpu_seconds:.2f}s "
+        f"(jobs={jobs})"
+    )
+    if cache is not None:
+        hits = sum(1 for name in selected_gates if results[name].cache == "hit")
+        misses = sum(1 for name in selected_gates if results[name].cache == "miss")
+        uncached = len(selected_gates) - hits - misses
+        print(
+            f"[CACHE] {hits} hit(s), {misses} miss(es), {uncached} not cacheable "
+            f"({cache.cache_dir})"
+        )
+    if unchanged:
+        print(
+            f"[SKIPPED] {len(unchanged)} gate(s) with no changed inputs since {args.since}: "
+            f"{', '.join(name for name in required_gate_names if name in unchanged)}"
+        )
+    if skipped:
+        print(f"[SKIPPED] {len(skipped)} gate(s) blocked by failed dependencies: {', '.join(skipped)}")
+    if failures or skipped:
         print(f"[SUMMARY] FAILED ({len(failures)} gate(s)): {', '.join(failures)}")
         return 1
 
+    if unchanged:
+        print(
+            f"[SUMMARY] PASSED ({len(selected_gates)} gate(s) run, "
+            f"{len(unchanged)} skipped as unchanged)"
+        )
+        return 0
     print(f"[SUMMARY] PASSED ({len(required_gate_names)} gate(s))")
     return 0
 
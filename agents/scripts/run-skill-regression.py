@@ -6,17 +6,46 @@ Validates:
 1) Skill metadata completeness and format.
 2) Skill structure quality (required sections + line count ceiling).
 3) Trigger routing accuracy against a golden prompt set.
+
+Routing goes through SkillRouter, an inverted index from prompt token to
+per-skill weights. All cases are scored as one batch: a sparse
+prompt x token product with the token x skill weight matrix when NumPy is
+installed, index lookups otherwise. Both give route_score()'s ranking.
+
+`--router bm25` swaps the hand-tuned +1/+2 weights for Okapi BM25 weights over
+each SKILL.md (frontmatter profile plus body), so term frequency and rarity
+count. The per-token BM25 weights are cached in
+.cache/skill-regression/bm25.json, keyed by the SKILL.md contents.
+`--report` prints each case's top-k with its margin and routing latency, plus
+an expected x predicted confusion matrix; `--min-margin` fails cases whose
+relative margin ((top1 - top2) / top1) is below the given floor.
+
+Usage:
+    python3 agents/scripts/run-skill-regression.py
+    python3 agents/scripts/run-skill-regression.py --router bm25 --report --top-k 3
+    python3 agents/scripts/run-skill-regression.py --min-margin 0.2
 """
 
 import argparse
+import hashlib
+import json
+import math
+import os
+import pickle
 import re
 import sys
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
 import yaml
 
+try:
+    import numpy as np
+except ImportError:  # Optional: SkillRouter falls back to pure-Python postings.
+    np = None
+
 
 REQUIRED_TOP_LEVEL_FIELDS = [
     "name",
@@ -88,6 +117,18 @@ SKILL_HINTS: Dict[str, List[str]] = {
     "blogger": ["blog", "devlog", "retrospective", "lessons", "article"],
 }
 
+# libyaml's C loader accepts the same documents as yaml.safe_load, much faster.
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+SKILL_CACHE_VERSION = 1
+DEFAULT_SKILL_CACHE = Path(__file__).resolve().parents[2] / ".cache" / "skill-regression" / "skills.pickle"
+
+ROUTER_MODES = ("weights", "bm25")
+BM25_K1 = 1.2
+BM25_B = 0.75
+BM25_CACHE_VERSION = 1
+DEFAULT_BM25_CACHE = Path(__file__).resolve().parents[2] / ".cache" / "skill-regression" / "bm25.json"
+
 
 @dataclass
 class Skill:
@@ -97,6 +138,8 @@ class Skill:
     body: str
     line_count: int
     profile_tokens: set
+    profile: str = ""
+    sha256: str = ""  # of the SKILL.md bytes
 
 
 def resolve_field(frontmatter: Dict, field: str):
@@ -124,8 +167,17 @@ def tokenize(text: str) -> set:
     return tokens
 
 
-def parse_frontmatter(path: Path) -> Tuple[Dict, str]:
-    content = path.read_text(encoding="utf-8")
+def token_counts(text: str) -> Dict[str, int]:
+    """Like tokenize(), but keeping how often each token occurs."""
+    counts: Dict[str, int] = {}
+    for token in re.findall(r"[a-z0-9]+", text.lower()):
+        if len(token) < 2 or token in STOPWORDS:
+            continue
+        counts[token] = counts.get(token, 0) + 1
+    return counts
+
+
+def split_frontmatter(content: str) -> Tuple[Dict, str]:
     lines = content.splitlines()
     if not lines or lines[0].strip() != "---":
         raise ValueError("Missing YAML frontmatter start delimiter")
@@ -140,7 +192,7 @@ def parse_frontmatter(path: Path) -> Tuple[Dict, str]:
         raise ValueError("Missing YAML frontmatter end delimiter")
 
     frontmatter = "\n".join(lines[1:end_idx])
-    metadata = yaml.safe_load(frontmatter)
+    metadata = yaml.load(frontmatter, Loader=YAML_LOADER)
     if not isinstance(metadata, dict):
         raise ValueError("Frontmatter must parse to a mapping")
 
@@ -148,11 +200,76 @@ def parse_frontmatter(path: Path) -> Tuple[Dict, str]:
     return metadata, body
 
 
-def build_skill(path: Path) -> Skill:
-    metadata, body = parse_frontmatter(path)
-    folder = path.parent.name
+def parse_frontmatter(path: Path) -> Tuple[Dict, str]:
+    return split_frontmatter(path.read_text(encoding="utf-8"))
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write data to a temp file beside path, then rename it over path."""
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        temp_path.write_bytes(data)
+        os.replace(temp_path, path)
+    finally:
+        if temp_path.exists():
+            temp_path.unlink()
+
+
+class SkillParseCache:
+    """
+    Parsed SKILL.md frontmatter, body and line count, keyed by the file's sha256.
+
+    Pickled (frontmatter may hold dates) to .cache/skill-regression/ and only
+    trusted when written with the same YAML loader. Saving drops entries for
+    content no longer seen.
+    """
+
+    def __init__(self, cache_path: Optional[Path]):
+        self.cache_path = cache_path
+        self.entries: Dict[str, Tuple[Dict, str, int]] = {}
+        self.seen: set = set()
+        self.dirty = False
+        if cache_path is not None and cache_path.is_file():
+            try:
+                payload = pickle.loads(cache_path.read_bytes())
+            except Exception:
+                payload = None
+            if (
+                isinstance(payload, dict)
+                and payload.get("version") == SKILL_CACHE_VERSION
+                and payload.get("loader") == YAML_LOADER.__name__
+            ):
+                self.entries = payload["entries"]
+
+    def parse(self, data: bytes) -> Tuple[str, Dict, str, int]:
+        """Return (sha256, frontmatter, body, line count) for SKILL.md bytes."""
+        digest = hashlib.sha256(data).hexdigest()
+        self.seen.add(digest)
+        entry = self.entries.get(digest)
+        if entry is None:
+            content = data.decode("utf-8")
+            metadata, body = split_frontmatter(content)
+            entry = (metadata, body, len(content.splitlines()))
+            self.entries[digest] = entry
+            self.dirty = True
+        return (digest,) + entry
+
+    def save(self) -> None:
+        """Write the cache (best effort) when entries were added or went stale."""
+        if self.cache_path is None or (not self.dirty and self.seen == set(self.entries)):
+            return
+        entries = {digest: entry for digest, entry in self.entries.items() if digest in self.seen}
+        payload = {"version": SKILL_CACHE_VERSION, "loader": YAML_LOADER.__name__, "entries": entries}
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            _write_atomic(self.cache_path, pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL))
+        except OSError:
+            pass
+
+
+def skill_profile(metadata: Dict, folder: str) -> str:
     tags = resolve_field(metadata, "tags")
-    profile = " ".join(
+    return " ".join(
         [
             str(metadata.get("description", "")),
             str(metadata.get("name", "")),
@@ -160,13 +277,24 @@ def build_skill(path: Path) -> Skill:
             folder.replace("-", " "),
         ]
     )
+
+
+def build_skill(path: Path, cache: Optional[SkillParseCache] = None) -> Skill:
+    """Read SKILL.md once and parse it (through cache when given)."""
+    if cache is None:
+        cache = SkillParseCache(None)
+    digest, metadata, body, line_count = cache.parse(path.read_bytes())
+    folder = path.parent.name
+    profile = skill_profile(metadata, folder)
     return Skill(
         folder=folder,
         path=path,
         metadata=metadata,
         body=body,
-        line_count=len(path.read_text(encoding="utf-8").splitlines()),
+        line_count=line_count,
         profile_tokens=tokenize(profile),
+        profile=profile,
+        sha256=digest,
     )
 
 
@@ -238,6 +366,7 @@ def validate_structure(skill: Skill, max_lines: int, errors: List[str]) -> None:
 
 
 def route_score(prompt_tokens: set, skill: Skill) -> int:
+    """Score one prompt against one skill (the per-pair reference for SkillRouter)."""
     score = 0
     folder_tokens = set(skill.folder.split("-"))
     name_tokens = tokenize(str(skill.metadata.get("name", "")))
@@ -254,13 +383,248 @@ def route_score(prompt_tokens: set, skill: Skill) -> int:
     return score
 
 
-def validate_routing(skills: List[Skill], cases_path: Path, errors: List[str]) -> None:
+def skill_token_weights(skill: Skill) -> Dict[str, int]:
+    """What each token adds to route_score() for this skill."""
+    folder_tokens = set(skill.folder.split("-"))
+    name_tokens = tokenize(str(skill.metadata.get("name", "")))
+    hints = set(SKILL_HINTS.get(skill.folder, []))
+    weights = {}
+    for token in skill.profile_tokens | hints | folder_tokens | name_tokens:
+        weight = 0
+        if token in skill.profile_tokens:
+            weight += 1
+        if token in hints:
+            weight += 2
+        if token in folder_tokens or token in name_tokens:
+            weight += 2
+        weights[token] = weight
+    return weights
+
+
+def bm25_token_weights(skills: List[Skill]) -> List[Dict[str, float]]:
+    """
+    Okapi BM25 weight of every token in every skill document.
+
+    A skill's document is its frontmatter profile plus its SKILL.md body. A
+    prompt's BM25 score for a skill is the sum of its tokens' weights, so the
+    weights slot into SkillRouter in place of skill_token_weights().
+    """
+    documents = [token_counts(f"{skill.profile}\n{skill.body}") for skill in skills]
+    lengths = [sum(counts.values()) for counts in documents]
+    average_length = (sum(lengths) / len(lengths)) if lengths else 0.0
+    document_frequency: Dict[str, int] = {}
+    for counts in documents:
+        for token in counts:
+            document_frequency[token] = document_frequency.get(token, 0) + 1
+
+    total = len(documents)
+    idf = {
+        token: math.log(1 + (total - frequency + 0.5) / (frequency + 0.5))
+        for token, frequency in document_frequency.items()
+    }
+    weights = []
+    for counts, length in zip(documents, lengths):
+        norm = BM25_K1 * (1 - BM25_B + BM25_B * length / average_length) if average_length else BM25_K1
+        weights.append({
+            token: idf[token] * count * (BM25_K1 + 1) / (count + norm)
+            for token, count in counts.items()
+        })
+    return weights
+
+
+def cached_bm25_token_weights(skills: List[Skill], cache_path: Optional[Path]) -> List[Dict[str, float]]:
+    """
+    bm25_token_weights(), persisted as JSON (best effort).
+
+    The cache key hashes the BM25 parameters and each skill's folder and
+    SKILL.md bytes, so any edit to a skill rebuilds the statistics.
+    """
+    if cache_path is None:
+        return bm25_token_weights(skills)
+    digest = hashlib.sha256(f"{BM25_CACHE_VERSION}:{BM25_K1}:{BM25_B}".encode("utf-8"))
+    for skill in skills:
+        digest.update(f"\0{skill.folder}\0".encode("utf-8"))
+        digest.update(skill.sha256.encode("ascii"))
+    key = digest.hexdigest()
+
+    try:
+        payload = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        payload = None
+    if isinstance(payload, dict) and payload.get("version") == BM25_CACHE_VERSION and payload.get("key") == key:
+        return payload["weights"]
+
+    weights = bm25_token_weights(skills)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"version": BM25_CACHE_VERSION, "key": key, "weights": weights}
+        _write_atomic(cache_path, json.dumps(payload).encode("utf-8"))
+    except OSError:
+        pass
+    return weights
+
+
+class SkillRouter:
+    """
+    Inverted index of prompt token -> (skill, weight) postings.
+
+    A prompt's score for a skill is the sum of its tokens' weights: by default
+    skill_token_weights(), which adds up exactly as route_score() does, or
+    BM25 weights. Only the postings of tokens that occur in some skill are
+    visited. Skills are held in folder order, so the first highest score is
+    the winner of the (-score, folder) sort.
+    """
+
+    def __init__(self, skills: List[Skill], token_weights: Optional[List[Dict[str, float]]] = None):
+        if token_weights is None:
+            token_weights = [skill_token_weights(skill) for skill in skills]
+        ordered = sorted(zip(skills, token_weights), key=lambda pair: pair[0].folder)
+        self.skills = [skill for skill, _ in ordered]
+        self.postings: Dict[str, List[Tuple[int, float]]] = {}
+        for index, (_, weights) in enumerate(ordered):
+            for token, weight in weights.items():
+                self.postings.setdefault(token, []).append((index, weight))
+        self.vocabulary = {token: row for row, token in enumerate(sorted(self.postings))}
+
+        # Token x skill weight matrix for batch scoring.
+        self.weights = None
+        if np is not None:
+            integral = all(isinstance(weight, int) for weights in token_weights for weight in weights.values())
+            self.weights = np.zeros(
+                (len(self.vocabulary), len(self.skills)), dtype=np.int64 if integral else np.float64
+            )
+            for token, row in self.vocabulary.items():
+                for index, weight in self.postings[token]:
+                    self.weights[row, index] = weight
+
+    def scores(self, prompt_tokens: set) -> List[float]:
+        totals = [0] * len(self.skills)
+        for token in prompt_tokens:
+            for index, weight in self.postings.get(token, ()):
+                totals[index] += weight
+        return totals
+
+    def route(self, prompt_tokens: set) -> Tuple[float, str]:
+        """Return (top score, skill folder) for one tokenized prompt."""
+        totals = self.scores(prompt_tokens)
+        best = max(range(len(totals)), key=totals.__getitem__)
+        return totals[best], self.skills[best].folder
+
+    def rank(self, prompt_tokens: set, top_k: int) -> List[Tuple[float, str]]:
+        """The top_k (score, skill folder) pairs, best first."""
+        totals = self.scores(prompt_tokens)
+        ranked = sorted(range(len(totals)), key=lambda index: -totals[index])[:top_k]
+        return [(totals[index], self.skills[index].folder) for index in ranked]
+
+    def route_batch(self, prompts: Sequence[set]) -> List[Tuple[float, str]]:
+        """
+        route() for many tokenized prompts.
+
+        With NumPy the prompts form a sparse prompt x token incidence matrix in
+        CSR layout (token columns, row starts) and are multiplied with the
+        weight matrix in one pass: the weight rows of every prompt token are
+        gathered and summed per prompt with one segmented reduction.
+        """
+        if self.weights is None or not prompts:
+            return [self.route(tokens) for tokens in prompts]
+
+        vocabulary = self.vocabulary
+        columns: List[int] = []
+        row_starts: List[int] = []
+        for tokens in prompts:
+            row_starts.append(len(columns))
+            columns.extend(vocabulary[token] for token in tokens if token in vocabulary)
+
+        starts = np.asarray(row_starts, dtype=np.intp)
+        ends = np.append(starts[1:], len(columns))
+        nonempty = ends > starts
+        totals = np.zeros((len(prompts), len(self.skills)), dtype=self.weights.dtype)
+        if columns:
+            gathered = self.weights[np.asarray(columns, dtype=np.intp)]
+            totals[nonempty] = np.add.reduceat(gathered, starts[nonempty], axis=0)
+
+        best = totals.argmax(axis=1)  # first maximum, i.e. lowest folder on ties
+        top = totals[np.arange(len(prompts)), best]
+        return [(score, self.skills[index].folder) for score, index in zip(top.tolist(), best.tolist())]
+
+
+def format_score(score: float) -> str:
+    return f"{score:.2f}" if isinstance(score, float) else str(score)
+
+
+def relative_margin(ranked: List[Tuple[float, str]]) -> float:
+    """(top1 - top2) / top1 on a 0..1 scale whatever the router's score units; 0 when top1 is 0."""
+    if not ranked or ranked[0][0] <= 0:
+        return 0.0
+    runner_up = ranked[1][0] if len(ranked) > 1 else 0
+    return (ranked[0][0] - runner_up) / ranked[0][0]
+
+
+@dataclass
+class RoutedCase:
+    case_id: str
+    expected: str
+    ranked: List[Tuple[float, str]]
+    seconds: float
+
+
+@dataclass
+class RoutingReport:
+    """Per-case top-k, margins and latency gathered while routing cases."""
+
+    router_mode: str
+    top_k: int
+    cases: List[RoutedCase] = field(default_factory=list)
+
+    def render(self) -> List[str]:
+        total_seconds = sum(case.seconds for case in self.cases)
+        rate = f", {len(self.cases) / total_seconds:,.0f} prompts/s" if total_seconds else ""
+        lines = [
+            f"[ROUTING] {self.router_mode} router: {len(self.cases)} case(s) in "
+            f"{total_seconds * 1000:.2f} ms{rate}"
+        ]
+        id_width = max([len("case")] + [len(case.case_id) for case in self.cases])
+        expected_width = max([len("expected")] + [len(case.expected) for case in self.cases])
+        lines.append(
+            f"  {'case':<{id_width}}  {'expected':<{expected_width}}  margin  latency  top-{self.top_k} (score)"
+        )
+        for case in self.cases:
+            ranked = ", ".join(f"{folder} {format_score(score)}" for score, folder in case.ranked[: self.top_k])
+            marker = "" if case.ranked and case.ranked[0][1] == case.expected else "  <-- misrouted"
+            lines.append(
+                f"  {case.case_id:<{id_width}}  {case.expected:<{expected_width}}  "
+                f"{relative_margin(case.ranked):>6.2f}  {case.seconds * 1e6:>5.0f} µs  {ranked}{marker}"
+            )
+
+        # Confusion matrix: expected skill per row, predicted skill per column.
+        labels = sorted({case.expected for case in self.cases} | {case.ranked[0][1] for case in self.cases})
+        counts: Dict[Tuple[str, str], int] = {}
+        for case in self.cases:
+            key = (case.expected, case.ranked[0][1])
+            counts[key] = counts.get(key, 0) + 1
+        label_width = max(len(label) for label in labels) if labels else 0
+        lines.append("[CONFUSION] expected (rows) x predicted (columns)")
+        lines.append(f"  {'':<{label_width + 4}}" + "".join(f"{number:>4}" for number in range(1, len(labels) + 1)))
+        for number, expected in enumerate(labels, start=1):
+            cells = "".join(f"{counts.get((expected, predicted), 0) or '.':>4}" for predicted in labels)
+            lines.append(f"  {number:>2}. {expected:<{label_width}}{cells}")
+        return lines
+
+
+def validate_routing(
+    skills: List[Skill],
+    cases_path: Path,
+    errors: List[str],
+    router: Optional[SkillRouter] = None,
+    report: Optional[RoutingReport] = None,
+    min_margin: float = 0.0,
+) -> None:
     if not cases_path.exists():
         errors.append(f"Missing cases file: {cases_path}")
         return
 
     try:
-        cases_data = yaml.safe_load(cases_path.read_text(encoding="utf-8"))
+        cases_data = yaml.load(cases_path.read_text(encoding="utf-8"), Loader=YAML_LOADER)
     except yaml.YAMLError as exc:
         errors.append(f"{cases_path}: invalid YAML ({exc})")
         return
@@ -271,10 +635,15 @@ def validate_routing(skills: List[Skill], cases_path: Path, errors: List[str]) -
     cases = cases_data["cases"]
     covered_skills = set()
     skills_by_folder = {s.folder: s for s in skills}
+    # Each case's errors go to its own slot, so batch routing keeps case order.
+    case_errors: List[List[str]] = []
+    routed_cases: List[Tuple[List[str], str, str, List[str], set]] = []
 
     for case in cases:
+        case_slot: List[str] = []
+        case_errors.append(case_slot)
         if not isinstance(case, dict):
-            errors.append(f"{cases_path}: case must be a mapping, got '{case}'")
+            case_slot.append(f"{cases_path}: case must be a mapping, got '{case}'")
             continue
 
         case_id = case.get("id", "<unknown>")
@@ -282,25 +651,25 @@ def validate_routing(skills: List[Skill], cases_path: Path, errors: List[str]) -
         expected = str(case.get("expected_skill", "")).strip()
 
         if not expected:
-            errors.append(f"{cases_path}: case '{case_id}' missing expected_skill")
+            case_slot.append(f"{cases_path}: case '{case_id}' missing expected_skill")
             continue
 
         if expected not in skills_by_folder:
-            errors.append(f"{cases_path}: case '{case_id}' expects unknown skill '{expected}'")
+            case_slot.append(f"{cases_path}: case '{case_id}' expects unknown skill '{expected}'")
             continue
 
         # Count declared skill coverage once expected_skill is valid.
         covered_skills.add(expected)
 
         if not prompt:
-            errors.append(f"{cases_path}: case '{case_id}' missing prompt")
+            case_slot.append(f"{cases_path}: case '{case_id}' missing prompt")
             continue
 
         forbidden_raw = case.get("forbidden_skills", [])
         if forbidden_raw is None:
             forbidden = []
         elif not isinstance(forbidden_raw, list):
-            errors.append(
+            case_slot.append(
                 f"{cases_path}: case '{case_id}' field 'forbidden_skills' must be a list of skill names"
             )
             continue
@@ -309,7 +678,7 @@ def validate_routing(skills: List[Skill], cases_path: Path, errors: List[str]) -
                 item for item in forbidden_raw if not isinstance(item, str) or not item.strip()
             ]
             if invalid_forbidden:
-                errors.append(
+                case_slot.append(
                     f"{cases_path}: case '{case_id}' has invalid forbidden_skills entries: {invalid_forbidden}"
                 )
                 continue
@@ -317,35 +686,59 @@ def validate_routing(skills: List[Skill], cases_path: Path, errors: List[str]) -
 
         unknown_forbidden = [item for item in forbidden if item not in skills_by_folder]
         if unknown_forbidden:
-            errors.append(
+            case_slot.append(
                 f"{cases_path}: case '{case_id}' has unknown forbidden skills: {unknown_forbidden}"
             )
             continue
 
-        prompt_tokens = tokenize(prompt)
-        scored = []
-        for skill in skills:
-            score = route_score(prompt_tokens, skill)
-            scored.append((score, skill.folder))
-        scored.sort(key=lambda x: (-x[0], x[1]))
-
-        top_score, predicted = scored[0]
+        routed_cases.append((case_slot, case_id, expected, forbidden, tokenize(prompt)))
+
+    if router is None:
+        router = SkillRouter(skills)
+    prompts = [prompt_tokens for *_, prompt_tokens in routed_cases]
+    if report is None and min_margin <= 0:
+        routes = router.route_batch(prompts)
+        margins = [None] * len(routes)
+    else:
+        # Rank case by case so each one's latency and margin can be reported.
+        top_k = max(2, report.top_k if report is not None else 2)
+        routes, margins = [], []
+        for (_, case_id, expected, _, _), prompt_tokens in zip(routed_cases, prompts):
+            started = time.perf_counter()
+            ranked = router.rank(prompt_tokens, top_k)
+            elapsed = time.perf_counter() - started
+            if report is not None:
+                report.cases.append(RoutedCase(str(case_id), expected, ranked, elapsed))
+            routes.append(ranked[0])
+            margins.append(relative_margin(ranked))
+
+    for (case_slot, case_id, expected, forbidden, _), (top_score, predicted), margin in zip(
+        routed_cases, routes, margins
+    ):
         if top_score == 0:
-            errors.append(f"{cases_path}: case '{case_id}' produced zero scores for all skills")
+            case_slot.append(f"{cases_path}: case '{case_id}' produced zero scores for all skills")
             continue
 
         if predicted != expected:
-            errors.append(
-                f"{cases_path}: case '{case_id}' routed to '{predicted}' (score {top_score}) "
+            case_slot.append(
+                f"{cases_path}: case '{case_id}' routed to '{predicted}' (score {format_score(top_score)}) "
                 f"instead of '{expected}'"
             )
+        elif margin is not None and margin < min_margin:
+            case_slot.append(
+                f"{cases_path}: case '{case_id}' routed to '{predicted}' with margin {margin:.2f} "
+                f"below --min-margin {min_margin:.2f}"
+            )
 
         for forbidden_skill in forbidden:
             if predicted == forbidden_skill:
-                errors.append(
+                case_slot.append(
                     f"{cases_path}: case '{case_id}' predicted forbidden skill '{forbidden_skill}'"
                 )
 
+    for case_slot in case_errors:
+        errors.extend(case_slot)
+
     missing_coverage = sorted(set(skills_by_folder) - covered_skills)
     if missing_coverage:
         errors.append(
@@ -353,13 +746,17 @@ def validate_routing(skills: List[Skill], cases_path: Path, errors: List[str]) -
         )
 
 
-def discover_skills(skills_dir: Path, errors: List[str]) -> List[Skill]:
+def discover_skills(
+    skills_dir: Path, errors: List[str], cache_path: Optional[Path] = None
+) -> List[Skill]:
+    cache = SkillParseCache(cache_path)
     skills = []
     for path in sorted(skills_dir.glob("*/SKILL.md")):
         try:
-            skills.append(build_skill(path))
+            skills.append(build_skill(path, cache))
         except Exception as exc:
             errors.append(f"{path}: failed to parse SKILL.md ({exc})")
+    cache.save()
     return skills
 
 
@@ -377,6 +774,29 @@ def main() -> int:
         default=500,
         help="Maximum allowed lines per SKILL.md",
     )
+    parser.add_argument(
+        "--router",
+        choices=ROUTER_MODES,
+        default="weights",
+        help="Routing scores: hand-tuned token weights (default) or BM25 over each SKILL.md",
+    )
+    parser.add_argument(
+        "--report",
+        action="store_true",
+        help="Print per-case top-k, margin and latency, plus a confusion matrix",
+    )
+    parser.add_argument("--top-k", type=int, default=3, help="Skills listed per case in --report")
+    parser.add_argument(
+        "--min-margin",
+        type=float,
+        default=0.0,
+        help="Fail correctly routed cases whose relative margin (top1 - top2) / top1 is below this",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Parse every SKILL.md and rebuild BM25 statistics without the disk caches",
+    )
     args = parser.parse_args()
 
     skills_dir = Path(args.skills_dir)
@@ -387,7 +807,7 @@ def main() -> int:
         return 2
 
     errors: List[str] = []
-    skills = discover_skills(skills_dir, errors)
+    skills = discover_skills(skills_dir, errors, None if args.no_cache else DEFAULT_SKILL_CACHE)
     if not skills:
         if errors:
             print("[FAIL] Skill regression checks failed:")
@@ -411,8 +831,18 @@ def main() -> int:
             else:
                 seen_names[name] = skill.path
 
+    report = RoutingReport(args.router, max(1, args.top_k)) if args.report else None
     if not any("failed to parse SKILL.md" in error for error in errors):
-        validate_routing(skills, cases_path, errors)
+        token_weights = None
+        if args.router == "bm25":
+            token_weights = cached_bm25_token_weights(skills, None if args.no_cache else DEFAULT_BM25_CACHE)
+        router = SkillRouter(skills, token_weights)
+        validate_routing(skills, cases_path, errors, router, report, args.min_margin)
+
+    if report is not None and report.cases:
+        for line in report.render():
+            print(line)
+        print()
 
     if errors:
         print("[FAIL] Skill regression checks failed:")
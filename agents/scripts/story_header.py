@@ -0,0 +1,96 @@
+"""
+Story header metadata extraction shared by planning scripts.
+
+A story file opens with a header block of bold fields, ahead of its first
+'##' section:
+
+    # F0001-S0001: Title
+    **Story ID:** F0001-S0001
+    **Feature:** F0001 — Feature name
+    **Title:** ...
+    **Priority:** High
+    **Phase:** MVP
+
+    ## User Story
+    **As a** persona ...
+
+parse_story_header() reads every header field with one compiled regex in a
+single pass bounded to that block, instead of one search per field. The
+**As a** persona lives under '## User Story', so it takes one more search; the
+first '# ' heading is looked up only when there is no **Title:**.
+
+generate-story-index.py takes its story metadata from here, and the planning
+index behind validate-trackers.py takes its Story IDs.
+
+Usage (from a planning script):
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "scripts"))
+    from story_header import parse_story_header
+
+    header = parse_story_header(text)
+    header.field("Priority"), header.story_id, header.persona
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+HEADER_FIELDS = ("Story ID", "Title", "Feature", "Priority", "Phase")
+STORY_ID_VALUE_RE = re.compile(r"F\d{4}-S\d{4}")
+
+# The value is captured in a lookahead so the scan resumes right after the
+# marker: '**Priority:**' followed by a blank line must not swallow the next
+# field's marker as its value.
+STORY_HEADER_RE = re.compile(
+    r"\*\*(" + "|".join(re.escape(name) for name in HEADER_FIELDS) + r"):\*\*(?=\s*([^\n]+))?"
+)
+PERSONA_RE = re.compile(r"\*\*As\s+a\*\*\s+([^\n*]+)")
+HEADING_RE = re.compile(r"^#\s+(.+)$", re.MULTILINE)
+
+
+@dataclass
+class StoryHeader:
+    # Header field -> first non-empty value.
+    fields: Dict[str, str] = field(default_factory=dict)
+    has_story_id: bool = False  # a '**Story ID:**' marker is present, even without a value
+    story_id: Optional[str] = None  # first Story ID value starting with F{NNNN}-S{NNNN}
+    heading: Optional[str] = None  # first '# ' heading; only looked up without a Title field
+    persona: Optional[str] = None  # text after the first **As a** marker
+
+    def field(self, name: str) -> Optional[str]:
+        return self.fields.get(name)
+
+
+def header_end(text: str) -> int:
+    """Offset of the first line starting with '##' (len(text) when there is none)."""
+    if text.startswith("##"):
+        return 0
+    offset = text.find("\n##")
+    return len(text) if offset < 0 else offset + 1
+
+
+def parse_story_header(text: str) -> StoryHeader:
+    """Extract header fields, first heading and persona from story markdown."""
+    header = StoryHeader()
+    fields = header.fields
+    # findall() yields '' for a marker with no value after it.
+    for name, value in STORY_HEADER_RE.findall(text, 0, header_end(text)):
+        if name == "Story ID":
+            header.has_story_id = True
+            if value and header.story_id is None:
+                story_id = STORY_ID_VALUE_RE.match(value.lstrip())
+                if story_id:
+                    header.story_id = story_id.group(0)
+        if value and name not in fields:
+            fields[name] = value.strip()
+
+    persona = PERSONA_RE.search(text)
+    if persona:
+        header.persona = persona.group(1).strip()
+
+    if "Title" not in fields:
+        heading = HEADING_RE.search(text)
+        if heading:
+            header.heading = heading.group(1).strip()
+    return header
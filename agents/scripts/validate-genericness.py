@@ -6,16 +6,46 @@ Prevents solution-specific terms from entering agents/ directory.
 Pulls the blocked term list from the domain glossary — no hardcoded
 terms in this script.
 
+Blocked terms (with plural variants) and their exception phrases are
+compiled into one token-level Aho-Corasick automaton, so each line is scanned
+once however long the glossary grows.
+
+Files are memory-mapped and prefiltered as bytes: only files containing the
+first token of some blocked term are decoded, and only the lines around those
+tokens are handed to the automaton, with line numbers counted up to each hit.
+Large trees are spread across a process pool (--jobs).
+
+--since <ref> scans only the lines added since a git ref (one `git diff -U0`,
+plus untracked files), so a pre-commit run costs O(diff) rather than O(tree).
+--baseline <file> lists known violations keyed by file and a hash of the line
+text (not its number), so legacy hits do not fail the gate and stay matched
+as lines move; --write-baseline records the current full-scan hits.
+
 Usage:
-    python3 agents/scripts/validate-genericness.py [--glossary <path>] [--agents-dir <path>]
+    python3 agents/scripts/validate-genericness.py [--glossary <path>] [--agents-dir <path>] [--jobs N]
+        [--since <ref>] [--baseline <file> [--write-baseline]]
     python3 agents/scripts/validate-genericness.py
     python3 agents/scripts/validate-genericness.py --glossary planning-mds/domain/glossary.md
+    python3 agents/scripts/validate-genericness.py --jobs 4
+    python3 agents/scripts/validate-genericness.py --since origin/main
+    python3 agents/scripts/validate-genericness.py --baseline genericness-baseline.json --write-baseline
+    python3 agents/scripts/validate-genericness.py --baseline genericness-baseline.json
 """
 
 import sys
+import codecs
+import hashlib
 import io
+import json
+import mmap
+import os
 import re
+import subprocess
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
 
 # Windows cp1252 stdout can't encode emojis found in scanned files.
 # Reconfigure stdout/stderr to utf-8 unconditionally — safe on all platforms.
@@ -25,6 +55,288 @@ if hasattr(sys.stderr, 'buffer'):
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
 
 
+# Term-scoped exception phrases for legitimate generic usage. A line is only
+# skipped when every blocked term matched on it has one of its phrases on the
+# same line. Tokens in a phrase are separated by ' ' (exactly one space),
+# '\s+' (any whitespace) or '\s*' (optional whitespace). Matching is
+# case-insensitive; a phrase starts on a word boundary and, when it ends in a
+# word character, ends on one too.
+TERM_EXCEPTIONS = {
+    'broker': ['pact broker', 'message broker'],
+    'submission': ['form submission'],
+    'renewal': ['token renewal'],
+    'claim': [
+        r'new\s+claim\s*(',
+        r'claim\s*(',
+        r'jwt\s+claim', r'jwt\s+claims',
+        r'token\s+claim', r'token\s+claims',
+        r'identity\s+claim', r'identity\s+claims',
+    ],
+}
+
+# Lines are tokenized into word runs and single punctuation characters; the
+# whitespace between tokens is kept as "gaps" for multi-token patterns.
+TOKEN_RE = re.compile(r'\w+|[^\w\s]')
+WORD_RE = re.compile(r'\w+')
+PHRASE_GAP_RE = re.compile(r'(\\s[+*]| )')
+ANY_WHITESPACE = '\\s+'
+OPTIONAL_WHITESPACE = '\\s*'
+# Characters that re.IGNORECASE equates with ASCII letters but str.lower() does
+# not (U+0130 is also the only character whose lower() is two characters long).
+CASE_FOLD = str.maketrans({'\u0130': 'i', '\u0131': 'i', '\u017f': 's', '\u212a': 'k'})
+CASE_FOLD_RE = re.compile('[\u0130\u0131\u017f\u212a]')
+
+# Byte-level prefilter, run over the mapped file one window at a time.
+# bytes.lower() only folds ASCII, so a file holding the UTF-8 form of a
+# CASE_FOLD character is scanned as decoded text instead, as is one holding a
+# line break str.splitlines() honours besides '\n' (so line numbers stay the same).
+WORD_BYTES_RE = re.compile(rb'\w+')
+TOKEN_BYTES_RE = re.compile(rb'\w+|[^\w\s]')
+WORD_BYTES = frozenset(b'0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz')
+CASE_FOLD_BYTES = tuple(char.encode('utf-8') for char in '\u0130\u0131\u017f\u212a')
+OTHER_LINE_BREAKS = tuple(char.encode('utf-8') for char in '\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029')
+DECODE_WHOLE_BYTES_RE = re.compile(b'|'.join(re.escape(seq) for seq in CASE_FOLD_BYTES + OTHER_LINE_BREAKS))
+# Up to this many distinct first tokens, substring searches beat tokenizing a file.
+BYTE_SEARCH_MAX_TOKENS = 64
+# The mapping is lowered in windows of about this size (extended to the next
+# '\n'), so the file is never copied whole.
+SCAN_WINDOW = 1 << 20
+NON_ASCII_BYTES_RE = re.compile(rb'[\x80-\xff]')
+# Undecodable files are validated in chunks of this size, never copied whole.
+UTF8_CHECK_CHUNK = 1 << 20
+
+# Scan all text files in agents/, except files explicitly allowed to contain
+# blocked terms.
+SCANNED_EXTENSIONS = {'.md', '.py', '.sh', '.yaml', '.yml'}
+SKIP_FILES = {'TECH-STACK-ADAPTATION.md', Path(__file__).name}
+
+# Hunk header of `git diff -U0`: '@@ -old[,count] +new[,count] @@'.
+HUNK_RE = re.compile(r'^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@')
+BASELINE_VERSION = 1
+
+# Below this many files a process pool costs more to start than it saves.
+POOL_MIN_FILES = 256
+
+
+def fold_case(text: str) -> str:
+    """Lower-case text without changing its length, so offsets still line up."""
+    if not text.isascii() and CASE_FOLD_RE.search(text):
+        text = text.translate(CASE_FOLD)
+    return text.lower()
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == '_'
+
+
+def _at_word_boundary(text: str, offset: int) -> bool:
+    """Equivalent of a regex \\b assertion at offset."""
+    before = offset > 0 and _is_word_char(text[offset - 1])
+    after = offset < len(text) and _is_word_char(text[offset])
+    return before != after
+
+
+@dataclass
+class AutomatonPattern:
+    tokens: Tuple[str, ...]
+    gaps: Tuple[str, ...]  # literal gap text, ANY_WHITESPACE or OPTIONAL_WHITESPACE
+    term: str  # canonical blocked term this pattern reports or exempts
+    is_exception: bool
+    boundary_end: bool  # require \b after the last token
+
+
+def _gap_matches(gap: str, expected: str) -> bool:
+    if expected == ANY_WHITESPACE:
+        return bool(gap) and gap.isspace()
+    if expected == OPTIONAL_WHITESPACE:
+        return not gap or gap.isspace()
+    return gap == expected
+
+
+def _term_pattern(variant: str, term: str) -> AutomatonPattern:
+    spans = [(m.group(0), m.start(), m.end()) for m in TOKEN_RE.finditer(variant)]
+    gaps = tuple(variant[spans[i][2]:spans[i + 1][1]] for i in range(len(spans) - 1))
+    return AutomatonPattern(tuple(t for t, _, _ in spans), gaps, term, False, True)
+
+
+def _exception_pattern(phrase: str, term: str) -> AutomatonPattern:
+    tokens: List[str] = []
+    gaps: List[str] = []
+    pending_gap = ''
+    for part in PHRASE_GAP_RE.split(fold_case(phrase)):
+        if part in (' ', ANY_WHITESPACE, OPTIONAL_WHITESPACE):
+            pending_gap = part
+            continue
+        for token in TOKEN_RE.findall(part):
+            if tokens:
+                gaps.append(pending_gap)
+            tokens.append(token)
+            pending_gap = ''
+    # A trailing word token needs \b after it; a trailing punctuation token does not.
+    boundary_end = _is_word_char(tokens[-1][-1])
+    return AutomatonPattern(tuple(tokens), tuple(gaps), term, True, boundary_end)
+
+
+@dataclass
+class AutomatonState:
+    transitions: Dict[str, int] = field(default_factory=dict)
+    fail: int = 0
+    outputs: List[int] = field(default_factory=list)  # pattern indexes, own and via fail links
+
+
+class BlockedTermAutomaton:
+    """
+    Aho-Corasick automaton over line tokens for blocked terms and exceptions.
+
+    One pass over a line's tokens reports every blocked-term and exception
+    pattern occurrence. Word boundaries and the whitespace between tokens are
+    checked per hit, and term hits are then reduced to leftmost-longest
+    non-overlapping matches, as a longest-first regex alternation would.
+    """
+
+    def __init__(self, terms: List[str], exceptions: Optional[Dict[str, List[str]]] = None):
+        if exceptions is None:
+            exceptions = TERM_EXCEPTIONS
+        blocked_terms = sorted({term.lower().strip() for term in terms if term.strip()})
+        self.blocked_term_set = set(blocked_terms)
+        self.patterns: List[AutomatonPattern] = []
+        for term in blocked_terms:
+            for variant in sorted(expand_term_variants(term)):
+                self.patterns.append(_term_pattern(fold_case(variant), term))
+        for term, phrases in exceptions.items():
+            for phrase in phrases:
+                self.patterns.append(_exception_pattern(phrase, term))
+
+        self.states: List[AutomatonState] = [AutomatonState()]
+        for index, pattern in enumerate(self.patterns):
+            if not pattern.tokens:
+                continue
+            state = 0
+            for token in pattern.tokens:
+                next_state = self.states[state].transitions.get(token)
+                if next_state is None:
+                    next_state = len(self.states)
+                    self.states.append(AutomatonState())
+                    self.states[state].transitions[token] = next_state
+                state = next_state
+            self.states[state].outputs.append(index)
+        self._link_failures()
+
+        # Only lines containing the first token of some blocked term can violate.
+        self.term_first_tokens = {
+            pattern.tokens[0] for pattern in self.patterns if pattern.tokens and not pattern.is_exception
+        }
+        # Word-only tokenizing is cheaper and enough unless a term starts with punctuation.
+        words_only = all(map(_is_word_char, (t[0] for t in self.term_first_tokens)))
+        self._prefilter_re = WORD_RE if words_only else TOKEN_RE
+        # The byte prefilter needs ASCII first tokens: bytes.lower() and \w on
+        # bytes leave non-ASCII characters alone.
+        self.byte_first_tokens: Optional[Set[bytes]] = None
+        if all(token.isascii() for token in self.term_first_tokens):
+            self.byte_first_tokens = {token.encode('ascii') for token in self.term_first_tokens}
+        self._byte_prefilter_re = WORD_BYTES_RE if words_only else TOKEN_BYTES_RE
+        self._byte_search_tokens: Optional[List[bytes]] = None
+        if self.byte_first_tokens is not None and len(self.byte_first_tokens) <= BYTE_SEARCH_MAX_TOKENS:
+            self._byte_search_tokens = sorted(self.byte_first_tokens)
+
+    def _link_failures(self) -> None:
+        queue = deque(self.states[0].transitions.values())
+        while queue:
+            state_index = queue.popleft()
+            state = self.states[state_index]
+            for token, child_index in state.transitions.items():
+                queue.append(child_index)
+                fail = state.fail
+                while fail and token not in self.states[fail].transitions:
+                    fail = self.states[fail].fail
+                child = self.states[child_index]
+                child.fail = self.states[fail].transitions.get(token, 0)
+                if child.fail == child_index:
+                    child.fail = 0
+                child.outputs.extend(self.states[child.fail].outputs)
+
+    def may_match(self, folded_text: str) -> bool:
+        """Cheap prefilter: does folded_text contain any blocked term's first token?"""
+        return not self.term_first_tokens.isdisjoint(self._prefilter_re.findall(folded_text))
+
+    def may_match_bytes(self, lowered: bytes) -> bool:
+        """Byte counterpart of may_match() for ASCII-lowered file content."""
+        if self._byte_search_tokens is not None:
+            # Substring hits are a superset of token hits; candidate_offsets() is exact.
+            return any(token in lowered for token in self._byte_search_tokens)
+        return not self.byte_first_tokens.isdisjoint(self._byte_prefilter_re.findall(lowered))
+
+    def candidate_offsets(self, lowered: bytes) -> List[int]:
+        """Sorted offsets of blocked-term first tokens in ASCII-lowered bytes."""
+        if self._byte_search_tokens is None:
+            tokens = self.byte_first_tokens
+            return [match.start() for match in self._byte_prefilter_re.finditer(lowered) if match.group() in tokens]
+
+        offsets = []
+        size = len(lowered)
+        for token in self._byte_search_tokens:
+            # A first token is either a word run or one punctuation character.
+            is_word = token[0] in WORD_BYTES
+            offset = lowered.find(token)
+            while offset >= 0:
+                end = offset + len(token)
+                if not is_word or (
+                    (offset == 0 or lowered[offset - 1] not in WORD_BYTES)
+                    and (end == size or lowered[end] not in WORD_BYTES)
+                ):
+                    offsets.append(offset)
+                offset = lowered.find(token, offset + 1)
+        return sorted(offsets)
+
+    def find(self, line: str) -> Tuple[Set[str], Set[str]]:
+        """
+        Return (matched blocked terms, terms exempted by an exception phrase) for line.
+
+        Matched terms are canonicalized from the line's own text, like the
+        matched group of a regex scan.
+        """
+        folded = fold_case(line)
+        spans = [(m.group(0), m.start(), m.end()) for m in TOKEN_RE.finditer(folded)]
+        term_hits: List[Tuple[int, int, AutomatonPattern]] = []
+        exempted: Set[str] = set()
+        state = 0
+        states = self.states
+        for position, (token, _, end) in enumerate(spans):
+            while state and token not in states[state].transitions:
+                state = states[state].fail
+            state = states[state].transitions.get(token, 0)
+            for pattern_index in states[state].outputs:
+                pattern = self.patterns[pattern_index]
+                first = position - len(pattern.tokens) + 1
+                start = spans[first][1]
+                if not _at_word_boundary(folded, start):
+                    continue
+                if pattern.boundary_end and not _at_word_boundary(folded, end):
+                    continue
+                if not all(
+                    _gap_matches(folded[spans[first + i][2]:spans[first + i + 1][1]], expected)
+                    for i, expected in enumerate(pattern.gaps)
+                ):
+                    continue
+                if pattern.is_exception:
+                    exempted.add(pattern.term)
+                else:
+                    term_hits.append((start, end, pattern))
+
+        matched: Set[str] = set()
+        resume = 0
+        for start, end, _ in sorted(term_hits, key=lambda hit: (hit[0], -hit[1])):
+            if start >= resume:
+                matched.add(canonicalize_matched_term(line[start:end], self.blocked_term_set))
+                resume = end
+        return matched, exempted
+
+    def line_violates(self, line: str) -> bool:
+        """True unless every blocked term on the line is covered by one of its exceptions."""
+        matched, exempted = self.find(line)
+        return bool(matched - exempted)
+
+
 def extract_blocked_terms(glossary_path: str) -> list:
     """
     Extract blocked terms from the glossary's 'Genericness-Blocked Terms' section.
@@ -113,10 +425,130 @@ def canonicalize_matched_term(term: str, blocked_term_set: set) -> str:
     return word
 
 
-def scan_directory(agents_dir: str, terms: list) -> list:
+def is_scanned_file(file_path: Path) -> bool:
+    return (
+        file_path.suffix in SCANNED_EXTENSIONS
+        and file_path.name not in SKIP_FILES
+        and '.git' not in file_path.parts
+        and file_path.is_file()
+    )
+
+
+def scan_text(content: str, automaton: BlockedTermAutomaton) -> List[Tuple[int, str]]:
+    """Return (line_number, stripped line) for each violating line of decoded text."""
+    violations = []
+    if not automaton.may_match(fold_case(content)):
+        return violations
+    for line_num, line in enumerate(content.splitlines(), start=1):
+        if not automaton.may_match(fold_case(line)):
+            continue
+        # Boundary gate must remain strict: only skip when each matched
+        # blocked term is explicitly exempted by a scoped exception phrase.
+        if automaton.line_violates(line):
+            violations.append((line_num, line.strip()))
+    return violations
+
+
+def _scan_decoded(data, automaton: BlockedTermAutomaton) -> List[Tuple[int, str]]:
+    """Decode the whole file and scan it as text (the fallback path)."""
+    try:
+        return scan_text(str(data[:], 'utf-8'), automaton)
+    except UnicodeDecodeError:
+        return []
+
+
+def _is_utf8(data) -> bool:
+    if NON_ASCII_BYTES_RE.search(data) is None:
+        return True
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    try:
+        for start in range(0, len(data), UTF8_CHECK_CHUNK):
+            decoder.decode(data[start:start + UTF8_CHECK_CHUNK])
+        decoder.decode(b'', final=True)
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+def scan_mapped(data, automaton: BlockedTermAutomaton) -> List[Tuple[int, str]]:
+    """
+    Scan file bytes (an mmap or bytes object) without decoding the whole file.
+
+    The mapping is lowered and searched one SCAN_WINDOW-sized run of whole
+    lines at a time, so at most one window is copied. Only lines holding a
+    blocked term's first token are decoded and checked; their line numbers
+    come from counting newlines up to each hit. Files the byte prefilter
+    cannot handle exactly fall back to scan_text().
+    """
+    if automaton.byte_first_tokens is None or DECODE_WHOLE_BYTES_RE.search(data):
+        return _scan_decoded(data, automaton)
+
+    violations = []
+    line_num = 1
+    size = len(data)
+    window_start = 0
+    while window_start < size:
+        window_end = data.find(b'\n', min(window_start + SCAN_WINDOW, size))
+        window_end = size if window_end < 0 else window_end + 1
+        lowered = data[window_start:window_end].lower()
+        counted_to = 0
+        if automaton.may_match_bytes(lowered):
+            next_line = 0
+            for offset in automaton.candidate_offsets(lowered):
+                if offset < next_line:
+                    continue  # this line was already checked
+                start = lowered.rfind(b'\n', 0, offset) + 1
+                end = lowered.find(b'\n', offset)
+                if end < 0:
+                    end = len(lowered)
+                line_num += lowered.count(b'\n', counted_to, start)
+                counted_to = start
+                next_line = end + 1
+                try:
+                    line = str(data[window_start + start:window_start + end], 'utf-8')
+                except UnicodeDecodeError:
+                    return []
+                if automaton.line_violates(line):
+                    violations.append((line_num, line.strip()))
+        line_num += lowered.count(b'\n', counted_to)
+        window_start = window_end
+    # Undecodable files are skipped as a whole, as read_text() would fail on them.
+    if violations and not _is_utf8(data):
+        return []
+    return violations
+
+
+def scan_file(file_path: Path, automaton: BlockedTermAutomaton) -> List[Tuple[int, str]]:
+    """Memory-map one file and return its violating (line_number, stripped line) pairs."""
+    try:
+        with open(file_path, 'rb') as handle:
+            if os.fstat(handle.fileno()).st_size == 0:
+                return []
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return scan_mapped(data, automaton)
+    except (OSError, ValueError):
+        return []
+
+
+_worker_automaton: Optional[BlockedTermAutomaton] = None
+
+
+def _init_worker(terms: List[str]) -> None:
+    global _worker_automaton
+    _worker_automaton = BlockedTermAutomaton(terms)
+
+
+def _scan_in_worker(file_path: Path) -> List[Tuple[int, str]]:
+    """Pool worker: scan one file with the automaton built once per process."""
+    return scan_file(file_path, _worker_automaton)
+
+
+def scan_directory(agents_dir: str, terms: list, jobs: int = 1) -> list:
     """
     Scan agents/ for occurrences of blocked terms (case-insensitive, word-boundary),
     including basic plural/inflected variants.
+    With jobs > 1, trees of POOL_MIN_FILES or more files are scanned in that
+    many worker processes; results keep the serial order.
     Returns list of (filepath, line_number, line_content) tuples.
     """
     agents_path = Path(agents_dir)
@@ -124,89 +556,158 @@ def scan_directory(agents_dir: str, terms: list) -> list:
         print(f"[ERROR] Directory not found: {agents_dir}")
         return []
 
-    blocked_terms = sorted({term.lower().strip() for term in terms if term.strip()})
-    blocked_term_set = set(blocked_terms)
-    pattern_terms = sorted(
-        {variant for term in blocked_terms for variant in expand_term_variants(term)},
-        key=len,
-        reverse=True,
-    )
-
-    # Case-insensitive word-boundary pattern.
-    pattern = re.compile(
-        r'\b(' + '|'.join(re.escape(t) for t in pattern_terms) + r')\b',
-        re.IGNORECASE
-    )
+    file_paths = [file_path for file_path in sorted(agents_path.rglob('*')) if is_scanned_file(file_path)]
 
-    # Files explicitly allowed to contain blocked terms
-    skip_files = {'TECH-STACK-ADAPTATION.md', Path(__file__).name}
-
-    # Term-scoped exception rules for legitimate generic usage.
-    # Each blocked term has to be covered by an explicit rule to skip a line.
-    term_exception_patterns = {
-        'broker': [
-            re.compile(r'\bpact broker\b', re.IGNORECASE),
-            re.compile(r'\bmessage broker\b', re.IGNORECASE),
-        ],
-        'submission': [
-            re.compile(r'\bform submission\b', re.IGNORECASE),
-        ],
-        'renewal': [
-            re.compile(r'\btoken renewal\b', re.IGNORECASE),
-        ],
-        'claim': [
-            re.compile(r'\bnew\s+claim\s*\(', re.IGNORECASE),
-            re.compile(r'\bclaim\s*\(', re.IGNORECASE),
-            re.compile(r'\bjwt\s+claims?\b', re.IGNORECASE),
-            re.compile(r'\btoken\s+claims?\b', re.IGNORECASE),
-            re.compile(r'\bidentity\s+claims?\b', re.IGNORECASE),
-        ],
-    }
+    if jobs > 1 and len(file_paths) >= POOL_MIN_FILES:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(terms,)) as executor:
+            chunksize = max(1, len(file_paths) // (jobs * 4))
+            # map() yields results in input order, so output matches the serial run.
+            results = list(executor.map(_scan_in_worker, file_paths, chunksize=chunksize))
+    else:
+        automaton = BlockedTermAutomaton(terms)
+        results = [scan_file(file_path, automaton) for file_path in file_paths]
 
-    # Scan all text files in agents/
-    extensions = {'.md', '.py', '.sh', '.yaml', '.yml'}
     violations = []
+    for file_path, file_violations in zip(file_paths, results):
+        for line_num, line in file_violations:
+            violations.append((str(file_path), line_num, line))
+    return violations
 
-    for file_path in sorted(agents_path.rglob('*')):
-        if not file_path.is_file():
-            continue
-        if file_path.suffix not in extensions:
-            continue
-        if file_path.name in skip_files:
-            continue
-        if '.git' in file_path.parts:
-            continue
 
-        try:
-            lines = file_path.read_text(encoding='utf-8').splitlines()
-        except Exception:
+def _unquote_git_path(path: str) -> str:
+    """Undo git's C-style quoting of unusual file names."""
+    if path.startswith('"') and path.endswith('"'):
+        return codecs.escape_decode(path[1:-1].encode('utf-8'))[0].decode('utf-8')
+    return path
+
+
+def git_added_lines(agents_path: Path, ref: str) -> Dict[Path, Optional[Set[int]]]:
+    """
+    Map each file under agents_path to the line numbers added since ref.
+
+    Added lines come from one `git diff -U0 <ref>` of the working tree;
+    untracked (not ignored) files count as added in full.
+    """
+    git = ['git', '-c', 'core.quotePath=off', '-C', str(agents_path)]
+    completed = subprocess.run(
+        git + ['diff', '-U0', '--no-color', '--no-ext-diff', '--relative',
+               '--src-prefix=a/', '--dst-prefix=b/', ref, '--', '.'],
+        capture_output=True,
+        text=True,
+        encoding='utf-8',
+        errors='replace',
+        check=False,
+    )
+    if completed.returncode != 0:
+        raise ValueError(f"git diff -U0 {ref} failed: {completed.stderr.strip()}")
+
+    added: Dict[Path, Optional[Set[int]]] = {}
+    lines: Optional[Set[int]] = None
+    for row in completed.stdout.splitlines():
+        if row.startswith('+++ '):
+            target = _unquote_git_path(row[4:])
+            lines = added.setdefault(agents_path / target[2:], set()) if target.startswith('b/') else None
             continue
+        match = HUNK_RE.match(row)
+        if match and lines is not None:
+            start = int(match.group(1))
+            count = int(match.group(2)) if match.group(2) is not None else 1
+            lines.update(range(start, start + count))
+
+    completed = subprocess.run(
+        git + ['ls-files', '--others', '--exclude-standard', '-z', '--', '.'],
+        capture_output=True,
+        check=False,
+    )
+    if completed.returncode != 0:
+        raise ValueError(f"git ls-files --others failed: {completed.stderr.decode('utf-8', 'replace').strip()}")
+    for name in completed.stdout.decode('utf-8', 'replace').split('\0'):
+        if name:
+            added[agents_path / name] = None  # every line is new
+    return {path: lines for path, lines in added.items() if lines is None or lines}
 
-        for line_num, line in enumerate(lines, start=1):
-            matches = list(pattern.finditer(line))
-            if not matches:
-                continue
 
-            matched_terms = {
-                canonicalize_matched_term(m.group(0), blocked_term_set)
-                for m in matches
-            }
-            all_terms_exempted = True
-
-            # Boundary gate must remain strict: only skip when each matched
-            # blocked term is explicitly exempted by a scoped regex rule.
-            for term in matched_terms:
-                term_rules = term_exception_patterns.get(term, [])
-                if not any(rule.search(line) for rule in term_rules):
-                    all_terms_exempted = False
-                    break
-
-            if all_terms_exempted:
+def scan_added_lines(agents_dir: str, terms: list, ref: str) -> list:
+    """
+    Scan only the lines added under agents/ since a git ref.
+    Returns list of (filepath, line_number, line_content) tuples, like scan_directory().
+    """
+    agents_path = Path(agents_dir)
+    if not agents_path.is_dir():
+        print(f"[ERROR] Directory not found: {agents_dir}")
+        return []
+
+    automaton = BlockedTermAutomaton(terms)
+    violations = []
+    for file_path, line_numbers in sorted(git_added_lines(agents_path, ref).items()):
+        if not is_scanned_file(file_path):
+            continue
+        if line_numbers is None:
+            file_violations = scan_file(file_path, automaton)
+        else:
+            try:
+                content = file_path.read_text(encoding='utf-8')
+            except Exception:
                 continue
+            # git numbers lines by '\n' only, so split the same way here.
+            lines = content.split('\n')
+            file_violations = [
+                (line_num, lines[line_num - 1].strip())
+                for line_num in sorted(line_numbers)
+                if line_num <= len(lines) and automaton.line_violates(lines[line_num - 1])
+            ]
+        for line_num, line in file_violations:
+            violations.append((str(file_path), line_num, line))
+    return violations
 
-            violations.append((str(file_path), line_num, line.strip()))
 
-    return violations
+def baseline_key(agents_dir: str, filepath: str, line_content: str) -> Tuple[str, str]:
+    """
+    (path relative to agents_dir, sha256 of the stripped line) for one violation.
+
+    Line numbers are left out, so known violations stay matched when lines
+    above them are added or removed.
+    """
+    relative = Path(os.path.relpath(filepath, agents_dir)).as_posix()
+    return relative, hashlib.sha256(line_content.encode('utf-8')).hexdigest()
+
+
+def load_baseline(path: str) -> Dict[Tuple[str, str], int]:
+    """Read a baseline written by --write-baseline as {(file, line hash): count}."""
+    data = json.loads(Path(path).read_text(encoding='utf-8'))
+    if data.get('version') != BASELINE_VERSION:
+        raise ValueError(f"unsupported baseline version {data.get('version')!r} (expected {BASELINE_VERSION})")
+    return {
+        (filepath, line_hash): count
+        for filepath, hashes in data.get('violations', {}).items()
+        for line_hash, count in hashes.items()
+    }
+
+
+def write_baseline(path: str, agents_dir: str, violations: list) -> None:
+    counts: Dict[str, Dict[str, int]] = {}
+    for filepath, _, line_content in violations:
+        relative, line_hash = baseline_key(agents_dir, filepath, line_content)
+        file_counts = counts.setdefault(relative, {})
+        file_counts[line_hash] = file_counts.get(line_hash, 0) + 1
+    payload = {
+        'version': BASELINE_VERSION,
+        'violations': {relative: dict(sorted(hashes.items())) for relative, hashes in sorted(counts.items())},
+    }
+    Path(path).write_text(json.dumps(payload, indent=2) + '\n', encoding='utf-8')
+
+
+def apply_baseline(violations: list, baseline: Dict[Tuple[str, str], int], agents_dir: str) -> Tuple[list, int]:
+    """Drop violations recorded in the baseline (each entry covers up to its count); return (new, suppressed)."""
+    remaining = dict(baseline)
+    new_violations = []
+    for violation in violations:
+        key = baseline_key(agents_dir, violation[0], violation[2])
+        if remaining.get(key, 0) > 0:
+            remaining[key] -= 1
+        else:
+            new_violations.append(violation)
+    return new_violations, len(violations) - len(new_violations)
 
 
 def main():
@@ -225,7 +726,34 @@ def main():
         default='agents',
         help='Path to agents directory to scan'
     )
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=0,
+        help=f'Scan files in N worker processes once the tree has {POOL_MIN_FILES}+ files '
+             '(0 = CPU count, 1 = serial); output order is unchanged'
+    )
+    parser.add_argument(
+        '--since',
+        metavar='REF',
+        help='Only scan lines added since this git ref (committed, staged or unstaged, plus untracked files)'
+    )
+    parser.add_argument(
+        '--baseline',
+        metavar='PATH',
+        help='JSON file of known violations (keyed by file and line content hash) that do not fail the gate'
+    )
+    parser.add_argument(
+        '--write-baseline',
+        action='store_true',
+        help='Record every current violation in --baseline and exit 0'
+    )
     args = parser.parse_args()
+    if args.write_baseline and not args.baseline:
+        parser.error('--write-baseline requires --baseline PATH')
+    if args.write_baseline and args.since:
+        parser.error('--write-baseline needs a full scan; drop --since')
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
 
     # Fallback: if default glossary path is missing, auto-discover a single glossary file.
     default_glossary = Path('planning-mds/domain/glossary.md')
@@ -238,7 +766,10 @@ def main():
 
     print(f"Validating genericness of {args.agents_dir}/")
     print("-" * 60)
-    print(f"[Scope]  Scanning only:       {args.agents_dir}/")
+    if args.since:
+        print(f"[Scope]  Scanning only:       lines added in {args.agents_dir}/ since {args.since}")
+    else:
+        print(f"[Scope]  Scanning only:       {args.agents_dir}/")
     print("[Scope]  Not scanned:          planning-mds/ (solution-specific content is allowed)\n")
 
     # Extract blocked terms from glossary
@@ -252,8 +783,32 @@ def main():
     print(f"[Source] Term list from:      {args.glossary}")
     print("[Note]   Source file is used only to derive denylist terms for agents/ validation.\n")
 
+    baseline = None
+    if args.baseline and not args.write_baseline:
+        try:
+            baseline = load_baseline(args.baseline)
+        except (OSError, ValueError) as e:
+            print(f"[ERROR] Could not read baseline at '{args.baseline}': {e}")
+            sys.exit(1)
+
     # Scan
-    violations = scan_directory(args.agents_dir, blocked_terms)
+    if args.since:
+        try:
+            violations = scan_added_lines(args.agents_dir, blocked_terms, args.since)
+        except (OSError, ValueError) as e:
+            print(f"[ERROR] {e}")
+            sys.exit(1)
+    else:
+        violations = scan_directory(args.agents_dir, blocked_terms, jobs)
+
+    if args.write_baseline:
+        write_baseline(args.baseline, args.agents_dir, violations)
+        print(f"[Baseline] Recorded {len(violations)} known violation(s) in {args.baseline}")
+        sys.exit(0)
+
+    if baseline is not None:
+        violations, suppressed = apply_baseline(violations, baseline, args.agents_dir)
+        print(f"[Baseline] {suppressed} known violation(s) suppressed by {args.baseline}\n")
 
     if not violations:
         print("[PASS] agents/ directory is generic — no blocked terms found")
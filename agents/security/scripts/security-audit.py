@@ -17,6 +17,9 @@ import sys
 from pathlib import Path
 from typing import List, Optional
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "scripts"))
+from markdown_corpus import shared_corpus  # noqa: E402
+
 REQUIRED_FILES = [
     "threat-model.md",
     "authorization-review.md",
@@ -31,8 +34,8 @@ DRAFT_STATUSES = {"draft", "placeholder", "tbd", "todo"}
 REVIEW_FILE_PATTERN = re.compile(r"^security-review-\d{4}-\d{2}-\d{2}\.md$")
 
 
-def is_effectively_empty(path: Path) -> bool:
-    content = path.read_text(encoding="utf-8", errors="ignore").strip()
+def is_effectively_empty(content: str) -> bool:
+    content = content.strip()
     if not content:
         return True
     # Consider a single heading as empty
@@ -71,7 +74,7 @@ def validate_dated_review_outputs(reviews_dir: Path) -> List[str]:
 
     has_usable_review = False
     for review_file in sorted(candidate_files):
-        content = review_file.read_text(encoding="utf-8", errors="ignore")
+        content = shared_corpus().text(review_file, errors="ignore")
         if non_empty_line_count(content) < 5:
             continue
         if re.search(r"^\s*Date:\s*\d{4}-\d{2}-\d{2}\s*$", content, flags=re.MULTILINE):
@@ -114,8 +117,8 @@ def main() -> int:
         if not path.exists():
             errors.append(f"Missing security artifact: {path}")
             continue
-        content = path.read_text(encoding="utf-8", errors="ignore")
-        if is_effectively_empty(path):
+        content = shared_corpus().text(path, errors="ignore")
+        if is_effectively_empty(content):
             message = f"Security artifact looks empty: {path}"
             if args.strict:
                 errors.append(message)
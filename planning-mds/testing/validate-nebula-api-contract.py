@@ -16,27 +16,21 @@ import sys
 from pathlib import Path
 from typing import Any, Dict, List
 
-import yaml
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "agents" / "scripts"))
+import openapi_spec  # noqa: E402
 
 DEFAULT_SPEC_PATH = Path("planning-mds/api/nebula-api.yaml")
 PROBLEM_DETAILS_REF = "#/components/schemas/ProblemDetails"
 
 
 def load_spec(file_path: Path) -> Dict[str, Any]:
-    with file_path.open("r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    # Shared with the api_contract gate: one parse per process, cached on disk by content hash.
+    return openapi_spec.load_spec(file_path)
 
 
 def resolve_local_ref(spec: Dict[str, Any], ref: str) -> Any:
-    if not isinstance(ref, str) or not ref.startswith("#/"):
-        return None
-
-    node: Any = spec
-    for token in ref[2:].split("/"):
-        if not isinstance(node, dict) or token not in node:
-            return None
-        node = node[token]
-    return node
+    # Memoized lookup in the spec's ref table, shared with the api_contract gate.
+    return openapi_spec.spec_graph(spec).resolve(ref)
 
 
 def resolve_parameter(spec: Dict[str, Any], parameter: Dict[str, Any], errors: List[str]) -> Dict[str, Any]: